@@ -1,6 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
-from web3 import Web3
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .index import EventIndex
+from .registry import ContractRegistry
+from .rpc import JsonRpcPool
+from .scanner import LogScanner
+from .transactions import TransactionPipeline
+
+if TYPE_CHECKING:
+    from web3 import Web3
 
 class BaseBlockchain(ABC):
     """
@@ -13,11 +21,26 @@ class BaseBlockchain(ABC):
         Initialize the blockchain interface with configuration.
         
         Args:
-            config: Dictionary containing blockchain configuration
+            config: Dictionary containing blockchain configuration; with an
+                "rpc_url" or "rpc_urls", reads go through an async JSON-RPC
+                pool
         """
         self.config = config
-        self.web3 = None
-        self.contracts = {}
+        # Created by implementations in connect(), importing web3 lazily
+        self.web3: Optional["Web3"] = None
+        # Async reads, batched across concurrent callers
+        self.rpc: Optional[JsonRpcPool] = None
+        self.scanner: Optional[LogScanner] = None
+        self.events: Optional[EventIndex] = None
+        self.transactions: Optional[TransactionPipeline] = None
+        if config.get("rpc_url") or config.get("rpc_urls"):
+            self.rpc = JsonRpcPool(config)
+            self.scanner = LogScanner(self.rpc, config)
+            self.events = EventIndex(self.scanner, config)
+            # Implementations set its signer in connect()
+            self.transactions = TransactionPipeline(self.rpc, config)
+        # Compiled contracts by address, with view call results memoized per block
+        self.contracts = ContractRegistry(config.get("chain_id", 0), self.rpc, config)
 
     @abstractmethod
     async def connect(self) -> bool:
@@ -48,6 +71,11 @@ class BaseBlockchain(ABC):
         """
         Call a smart contract method.
         
+        Implementations should read through ``self.contracts.call`` rather
+        than the synchronous ``self.web3``, so calls do not block the event
+        loop, concurrent calls share batch requests and calls are encoded
+        with precompiled ABIs.
+        
         Args:
             contract_address: Address of the contract
             method_name: Name of the method to call
@@ -63,6 +91,10 @@ class BaseBlockchain(ABC):
         """
         Send a blockchain transaction.
         
+        Implementations should submit through ``self.transactions``, which
+        allocates nonces locally, reuses cached fee estimates and keeps
+        several transactions in flight while confirmations are tracked.
+        
         Args:
             transaction: Transaction parameters
             
@@ -72,16 +104,27 @@ class BaseBlockchain(ABC):
         pass
 
     @abstractmethod
-    async def get_events(self, contract_address: str, event_name: str, from_block: int) -> List[Dict[str, Any]]:
+    async def get_events(
+        self,
+        contract_address: str,
+        event_name: str,
+        from_block: int,
+        to_block: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get contract events.
         
+        Implementations should fetch logs through ``self.events``, which
+        answers confirmed blocks from the local index and fetches the rest
+        through ``self.scanner`` in concurrent chunks.
+        
         Args:
             contract_address: Address of the contract
             event_name: Name of the event to get
             from_block: Starting block number
+            to_block: Optional last block number (default: latest block)
             
         Returns:
             List of event data
         """
-        pass 
\ No newline at end of file
+        pass
\ No newline at end of file
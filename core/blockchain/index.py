@@ -0,0 +1,331 @@
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+
+from .scanner import LogScanner
+
+class EventIndex:
+    """
+    Local store of contract event logs, indexed up to confirmed blocks.
+    Every stream (chain, contract, event and topic filters) records the block range it has
+    indexed and the hashes of recent checkpoint blocks. Queries over that
+    range are answered from SQLite and only newer blocks come from the
+    node. A checkpoint whose block hash changed means a reorg deeper than
+    ``confirmation_blocks``: the stream is rolled back to the newest
+    checkpoint still on the chain and indexed again from there. The logs
+    of a sync are fetched first and then stored in one transaction.
+    """
+
+    def __init__(self, scanner: LogScanner, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the index.
+        
+        Args:
+            scanner: Log scanner of the network
+            config: Network configuration:
+                - chain_id: Chain the logs belong to (default: 0)
+                - confirmation_blocks: Blocks behind the tip a block needs
+                  to be indexed (default: 0)
+                - event_index_path: SQLite file persisting the index
+                  (default: in memory)
+                - event_index_checkpoints: Checkpoints kept per stream for
+                  reorg recovery (default: 64)
+        """
+        config = config or {}
+        self.scanner = scanner
+        self.rpc = scanner.rpc
+        self.chain_id = config.get("chain_id", 0)
+        self.confirmation_blocks = config.get("confirmation_blocks", 0)
+        self.max_checkpoints = config.get("event_index_checkpoints", 64)
+        self.stats = {"local": 0, "fetched": 0, "rollbacks": 0}
+        self._locks: Dict[Tuple[int, str, str], asyncio.Lock] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        self.db = sqlite3.connect(config.get("event_index_path") or ":memory:")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS streams "
+            "(chain_id INTEGER, address TEXT, event TEXT, first_block INTEGER NOT NULL, "
+            "last_block INTEGER NOT NULL, PRIMARY KEY (chain_id, address, event))"
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints "
+            "(chain_id INTEGER, address TEXT, event TEXT, block INTEGER, hash TEXT NOT NULL, "
+            "PRIMARY KEY (chain_id, address, event, block))"
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS logs "
+            "(chain_id INTEGER, address TEXT, event TEXT, block INTEGER, log_index INTEGER, "
+            "log TEXT NOT NULL, PRIMARY KEY (chain_id, address, event, block, log_index))"
+        )
+        self.db.commit()
+
+    async def get_events(
+        self,
+        address: str,
+        event: str,
+        topics: Optional[List[Any]],
+        from_block: int,
+        to_block: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the logs of an event, indexing confirmed blocks first.
+        
+        Args:
+            address: Contract address
+            event: Event name or topic identifying the stream
+            topics: Topic filters selecting the event's logs
+            from_block: First block
+            to_block: Last block (default: latest block)
+            
+        Returns:
+            Logs ordered by block number and log index
+        """
+        tip = await self.rpc.block_number()
+        last = await self.sync(address, event, topics, from_block, tip)
+        end = tip if to_block is None else to_block
+        
+        logs = self._read(self._key(address, event, topics), from_block, min(end, last))
+        self.stats["local"] += len(logs)
+        if end > last:
+            # Unconfirmed blocks are not indexed; they may still change
+            recent = await self.scanner.get_logs(address, topics, max(from_block, last + 1), end)
+            self.stats["fetched"] += len(recent)
+            logs.extend(recent)
+        return logs
+
+    async def sync(
+        self,
+        address: str,
+        event: str,
+        topics: Optional[List[Any]],
+        from_block: int,
+        tip: Optional[int] = None
+    ) -> int:
+        """
+        Index a stream up to the last confirmed block.
+        
+        Args:
+            address: Contract address
+            event: Event name or topic identifying the stream
+            topics: Topic filters selecting the event's logs
+            from_block: First block the stream must cover
+            tip: Latest block, if already known
+            
+        Returns:
+            Last indexed block
+        """
+        key = self._key(address, event, topics)
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        async with self._locks[key]:
+            if tip is None:
+                tip = await self.rpc.block_number()
+            confirmed = tip - self.confirmation_blocks
+            
+            row = self.db.execute(
+                "SELECT first_block, last_block FROM streams WHERE chain_id = ? AND address = ? AND event = ?", key
+            ).fetchone()
+            rollback_to = None
+            if row is None or row[1] < row[0]:
+                first, last = from_block, from_block - 1
+            else:
+                first, last = row
+                rollback_to = await self._verify(key, first)
+                if rollback_to is not None:
+                    last = rollback_to
+                    
+            rows = []
+            if from_block < first:
+                # Earlier history than indexed so far
+                rows += await self._fetch(key, address, topics, from_block, first - 1)
+                first = from_block
+            checkpoint = None
+            if last < confirmed:
+                rows += await self._fetch(key, address, topics, last + 1, confirmed)
+                last = confirmed
+                if last >= 0:
+                    checkpoint = (last, await self._block_hash(last))
+                    
+            # Streams share the connection: written without awaiting, so the
+            # transaction never holds another stream's changes
+            try:
+                if rollback_to is not None:
+                    self._roll_back(key, rollback_to)
+                self._insert(rows)
+                if checkpoint is not None:
+                    self._checkpoint(key, *checkpoint)
+                self.db.execute(
+                    "INSERT OR REPLACE INTO streams (chain_id, address, event, first_block, last_block) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (*key, first, last)
+                )
+            except BaseException:
+                # Keep the stream as it was; it is indexed again next time
+                self.db.rollback()
+                raise
+            self.db.commit()
+            return last
+
+    def close(self):
+        """Close the index."""
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def _key(self, address: str, event: str, topics: Optional[List[Any]]) -> Tuple[int, str, str]:
+        """
+        Get the key of a stream.
+        
+        Args:
+            address: Contract address
+            event: Event name or topic
+            topics: Topic filters selecting the event's logs
+            
+        Returns:
+            Chain id, normalized address, and the event with a digest of
+            the topic filters, so differently filtered logs are kept apart
+        """
+        topics = list(topics or [])
+        while topics and topics[-1] is None:
+            # Trailing wildcards match the same logs as no filter
+            topics.pop()
+        digest = hashlib.sha256(json.dumps(topics).lower().encode("utf-8")).hexdigest()[:16]
+        return self.chain_id, address.lower(), f"{event}:{digest}"
+
+    def _read(self, key: Tuple[int, str, str], start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        Read indexed logs of a block range.
+        
+        Args:
+            key: Stream key
+            start: First block
+            end: Last block
+            
+        Returns:
+            Logs ordered by block number and log index
+        """
+        rows = self.db.execute(
+            "SELECT log FROM logs WHERE chain_id = ? AND address = ? AND event = ? "
+            "AND block BETWEEN ? AND ? ORDER BY block, log_index",
+            (*key, start, end)
+        )
+        return [json.loads(log) for log, in rows]
+
+    async def _fetch(
+        self,
+        key: Tuple[int, str, str],
+        address: str,
+        topics: Optional[List[Any]],
+        start: int,
+        end: int
+    ) -> List[Tuple]:
+        """
+        Fetch the logs of a block range as rows to store.
+        
+        Args:
+            key: Stream key
+            address: Contract address
+            topics: Topic filters
+            start: First block
+            end: Last block
+            
+        Returns:
+            Stream key, block, log index and log of every log
+        """
+        return [
+            (*key, int(log["blockNumber"], 16), int(log["logIndex"], 16), json.dumps(log))
+            async for log in self.scanner.scan(address, topics, start, end)
+        ]
+
+    def _insert(self, rows: List[Tuple]):
+        """
+        Store log rows.
+        
+        Args:
+            rows: Stream key, block, log index and log
+        """
+        self.db.executemany(
+            "INSERT OR REPLACE INTO logs (chain_id, address, event, block, log_index, log) VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+
+    async def _block_hash(self, block: int) -> Optional[str]:
+        """
+        Get the hash of a block on the node's current chain.
+        
+        Args:
+            block: Block number
+            
+        Returns:
+            Block hash, or None for an unknown block
+        """
+        header = await self.rpc.request("eth_getBlockByNumber", [hex(block), False])
+        return header["hash"] if header else None
+
+    def _checkpoint(self, key: Tuple[int, str, str], block: int, block_hash: Optional[str]):
+        """
+        Record the hash of the last indexed block, uncommitted.
+        
+        Args:
+            key: Stream key
+            block: Block number
+            block_hash: Hash of the block
+        """
+        self.db.execute(
+            "INSERT OR REPLACE INTO checkpoints (chain_id, address, event, block, hash) VALUES (?, ?, ?, ?, ?)",
+            (*key, block, block_hash)
+        )
+        self.db.execute(
+            "DELETE FROM checkpoints WHERE chain_id = ? AND address = ? AND event = ? AND block NOT IN "
+            "(SELECT block FROM checkpoints WHERE chain_id = ? AND address = ? AND event = ? "
+            "ORDER BY block DESC LIMIT ?)",
+            (*key, *key, self.max_checkpoints)
+        )
+
+    def _roll_back(self, key: Tuple[int, str, str], block: int):
+        """
+        Delete the logs and checkpoints of a stream after a block, uncommitted.
+        
+        Args:
+            key: Stream key
+            block: Last block kept
+        """
+        self.db.execute(
+            "DELETE FROM logs WHERE chain_id = ? AND address = ? AND event = ? AND block > ?", (*key, block)
+        )
+        self.db.execute(
+            "DELETE FROM checkpoints WHERE chain_id = ? AND address = ? AND event = ? AND block > ?", (*key, block)
+        )
+
+    async def _verify(self, key: Tuple[int, str, str], first: int) -> Optional[int]:
+        """
+        Check the stream is on the node's chain.
+        
+        Args:
+            key: Stream key
+            first: First indexed block
+            
+        Returns:
+            Block to roll the stream back to, or None if it is on the chain
+        """
+        checkpoints = self.db.execute(
+            "SELECT block, hash FROM checkpoints WHERE chain_id = ? AND address = ? AND event = ? "
+            "ORDER BY block DESC",
+            key
+        ).fetchall()
+        if not checkpoints or await self._block_hash(checkpoints[0][0]) == checkpoints[0][1]:
+            return None
+            
+        headers = await self.rpc.batch([("eth_getBlockByNumber", [hex(block), False]) for block, _ in checkpoints])
+        rollback_to = first - 1
+        for (block, block_hash), header in zip(checkpoints, headers):
+            if isinstance(header, dict) and header.get("hash") == block_hash:
+                rollback_to = block
+                break
+                
+        self.stats["rollbacks"] += 1
+        self.logger.warning(f"Reorg below block {checkpoints[0][0]} on chain {key[0]}, rolling {key[1]} {key[2]} back to block {rollback_to}")
+        return rollback_to
\ No newline at end of file
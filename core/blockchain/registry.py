@@ -0,0 +1,363 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import hashlib
+import json
+
+from ..utils.cache import LRUCache
+from ..utils.lazy import lazy_import
+from .rpc import JsonRpcPool
+
+eth_abi_registry = lazy_import("eth_abi.registry")
+eth_abi_decoding = lazy_import("eth_abi.decoding")
+eth_utils = lazy_import("eth_utils")
+
+def is_hashed(abi_type: str) -> bool:
+    """
+    Check whether indexed values of a type are logged as their hash.
+    
+    Args:
+        abi_type: Canonical ABI type
+        
+    Returns:
+        True for strings, bytes, arrays and tuples
+    """
+    return abi_type in ("string", "bytes") or abi_type.startswith("(") or abi_type.endswith("]")
+
+def canonical_type(param: Dict[str, Any]) -> str:
+    """
+    Get the canonical ABI type of a parameter.
+    
+    Args:
+        param: ABI parameter entry
+        
+    Returns:
+        Type as used in signatures, tuples spelled out
+    """
+    abi_type = param["type"]
+    if abi_type.startswith("tuple"):
+        components = ",".join(canonical_type(component) for component in param["components"])
+        return f"({components}){abi_type[len('tuple'):]}"
+    return abi_type
+
+def signature(item: Dict[str, Any]) -> str:
+    """
+    Get the signature of a function or event ABI entry.
+    
+    Args:
+        item: ABI entry
+        
+    Returns:
+        Signature, e.g. "transfer(address,uint256)"
+    """
+    return f"{item['name']}({','.join(canonical_type(param) for param in item.get('inputs', []))})"
+
+def keccak_hex(text: str) -> str:
+    """
+    Hash text with Keccak-256.
+    
+    Args:
+        text: Text to hash
+        
+    Returns:
+        0x-prefixed hex digest
+    """
+    return "0x" + eth_utils.keccak(text=text).hex()
+
+class ContractFunction:
+    """Contract function with its selector and ABI codecs resolved once."""
+
+    def __init__(self, item: Dict[str, Any]):
+        """
+        Compile a function.
+        
+        Args:
+            item: Function ABI entry
+        """
+        self.name = item["name"]
+        self.signature = signature(item)
+        self.selector = keccak_hex(self.signature)[:10]
+        self.input_types = [canonical_type(param) for param in item.get("inputs", [])]
+        self.output_types = [canonical_type(param) for param in item.get("outputs", [])]
+        self.view = item.get("stateMutability") in ("view", "pure") or item.get("constant", False)
+        self._encoder = eth_abi_registry.registry.get_tuple_encoder(*self.input_types)
+        self._decoder = eth_abi_registry.registry.get_tuple_decoder(*self.output_types)
+
+    def encode(self, args: List[Any]) -> str:
+        """
+        Encode a call.
+        
+        Args:
+            args: Function arguments
+            
+        Returns:
+            Hex-encoded calldata
+        """
+        return self.selector + self._encoder(tuple(args)).hex()
+
+    def decode(self, data: str) -> Any:
+        """
+        Decode return data.
+        
+        Args:
+            data: Hex-encoded return data
+            
+        Returns:
+            The single return value, or a tuple of values
+        """
+        values = self._decoder(eth_abi_decoding.ContextFramesBytesIO(bytes.fromhex(data[2:])))
+        return values[0] if len(values) == 1 else values
+
+class ContractEvent:
+    """Contract event with its topic and ABI codecs resolved once."""
+
+    def __init__(self, item: Dict[str, Any]):
+        """
+        Compile an event.
+        
+        Args:
+            item: Event ABI entry
+        """
+        self.name = item["name"]
+        self.signature = signature(item)
+        self.topic = keccak_hex(self.signature)
+        self.anonymous = item.get("anonymous", False)
+        inputs = item.get("inputs", [])
+        self.indexed = [(param["name"], canonical_type(param)) for param in inputs if param.get("indexed")]
+        self.data = [(param["name"], canonical_type(param)) for param in inputs if not param.get("indexed")]
+        self.names = [param["name"] for param in inputs]
+        self._topic_decoders = [
+            None if is_hashed(abi_type) else eth_abi_registry.registry.get_tuple_decoder(abi_type)
+            for _, abi_type in self.indexed
+        ]
+        self._data_decoder = eth_abi_registry.registry.get_tuple_decoder(*(abi_type for _, abi_type in self.data))
+
+    def decode(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode the arguments of a log.
+        
+        Args:
+            log: Log as returned by ``eth_getLogs``
+            
+        Returns:
+            Arguments by name, in ABI order; indexed dynamic values are
+            their topic hash
+        """
+        topics = log["topics"] if self.anonymous else log["topics"][1:]
+        args = {}
+        for (name, _), decoder, topic in zip(self.indexed, self._topic_decoders, topics):
+            if decoder is None:
+                args[name] = topic
+            else:
+                args[name] = decoder(eth_abi_decoding.ContextFramesBytesIO(bytes.fromhex(topic[2:])))[0]
+                
+        values = self._data_decoder(eth_abi_decoding.ContextFramesBytesIO(bytes.fromhex(log["data"][2:])))
+        args.update(zip((name for name, _ in self.data), values))
+        return {name: args[name] for name in self.names}
+
+class CompiledABI:
+    """Functions and events of an ABI, shared by contracts using it."""
+
+    def __init__(self, abi: List[Dict[str, Any]]):
+        """
+        Compile an ABI.
+        
+        Args:
+            abi: Contract ABI
+        """
+        self.functions: Dict[str, ContractFunction] = {}
+        self.events: Dict[str, ContractEvent] = {}
+        for item in abi:
+            if item.get("type") == "function":
+                # Overloads are registered by signature; the name gets the first
+                function = ContractFunction(item)
+                self.functions.setdefault(function.name, function)
+                self.functions[function.signature] = function
+            elif item.get("type") == "event":
+                event = ContractEvent(item)
+                self.events.setdefault(event.name, event)
+                self.events[event.signature] = event
+        self.events_by_topic = {event.topic: event for event in self.events.values() if not event.anonymous}
+
+class Contract:
+    """Deployed contract with a compiled ABI."""
+
+    def __init__(self, chain_id: int, address: str, abi: CompiledABI):
+        """
+        Initialize the contract.
+        
+        Args:
+            chain_id: Chain the contract is deployed on
+            address: Contract address
+            abi: Compiled ABI
+        """
+        self.chain_id = chain_id
+        self.address = address
+        self.abi = abi
+
+    def function(self, name: str) -> ContractFunction:
+        """
+        Get a function.
+        
+        Args:
+            name: Function name or signature
+            
+        Returns:
+            Compiled function
+        """
+        if name not in self.abi.functions:
+            raise Exception(f"Contract {self.address} has no function {name}")
+        return self.abi.functions[name]
+
+    def event(self, name: str) -> ContractEvent:
+        """
+        Get an event.
+        
+        Args:
+            name: Event name or signature
+            
+        Returns:
+            Compiled event
+        """
+        if name not in self.abi.events:
+            raise Exception(f"Contract {self.address} has no event {name}")
+        return self.abi.events[name]
+
+    def decode_log(self, log: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Decode a log emitted by the contract.
+        
+        Args:
+            log: Log as returned by ``eth_getLogs``
+            
+        Returns:
+            Log with "event" and decoded "args" added, or None for logs
+            of unknown events
+        """
+        topics = log.get("topics") or []
+        event = self.abi.events_by_topic.get(topics[0]) if topics else None
+        if event is None:
+            return None
+        return {**log, "event": event.name, "args": event.decode(log)}
+
+class ContractRegistry:
+    """
+    Contracts of a chain by address, compiled once.
+    Selectors, topics and ABI codecs are built when a contract is
+    registered, and contracts sharing an ABI share them. Results of view
+    calls at a given block number cannot change, so they are memoized in a
+    bounded LRU cache.
+    """
+
+    def __init__(
+        self,
+        chain_id: int,
+        rpc: Optional[JsonRpcPool] = None,
+        config: Optional[Dict[str, Any]] = None,
+        abi_loader: Optional[Callable[[str], List[Dict[str, Any]]]] = None
+    ):
+        """
+        Initialize the registry.
+        
+        Args:
+            chain_id: Chain the contracts are deployed on
+            rpc: JSON-RPC pool used for calls
+            config: Network configuration:
+                - contract_cache_size: Contracts kept (default: 1024)
+                - call_cache_size: View call results kept (default: 10000)
+            abi_loader: Optional function returning the ABI of an address,
+                used for contracts not registered or evicted
+        """
+        config = config or {}
+        self.chain_id = chain_id
+        self.rpc = rpc
+        self.abi_loader = abi_loader
+        self.contracts = LRUCache(maxsize=config.get("contract_cache_size", 1024))
+        self.abis: Dict[str, CompiledABI] = {}
+        self.calls = LRUCache(maxsize=config.get("call_cache_size", 10000))
+        self.stats = {"calls": 0, "memo_hits": 0}
+
+    def register(self, address: str, abi: List[Dict[str, Any]]) -> Contract:
+        """
+        Register a contract.
+        
+        Args:
+            address: Contract address
+            abi: Contract ABI
+            
+        Returns:
+            Compiled contract
+        """
+        abi_key = hashlib.sha256(json.dumps(abi, sort_keys=True).encode("utf-8")).hexdigest()
+        if abi_key not in self.abis:
+            self.abis[abi_key] = CompiledABI(abi)
+        contract = Contract(self.chain_id, address, self.abis[abi_key])
+        self.contracts.set(address.lower(), contract)
+        return contract
+
+    def get(self, address: str) -> Contract:
+        """
+        Get a registered contract.
+        
+        Args:
+            address: Contract address
+            
+        Returns:
+            Compiled contract
+        """
+        contract = self.contracts.get(address.lower())
+        if contract is None:
+            if self.abi_loader is None:
+                raise Exception(f"Unknown contract {address} on chain {self.chain_id}")
+            contract = self.register(address, self.abi_loader(address))
+        return contract
+
+    async def call(self, address: str, method: str, args: List[Any], block: Any = "latest") -> Any:
+        """
+        Call a contract function without a transaction.
+        
+        Args:
+            address: Contract address
+            method: Function name or signature
+            args: Function arguments
+            block: Block number or tag to read at; results of view
+                functions at a block number are memoized
+                
+        Returns:
+            Decoded return value
+        """
+        if self.rpc is None:
+            raise Exception(f"No RPC endpoint configured for chain {self.chain_id}")
+        function = self.get(address).function(method)
+        data = function.encode(args)
+        self.stats["calls"] += 1
+        
+        key: Optional[Tuple[str, str, int]] = None
+        if function.view and isinstance(block, int):
+            key = (address.lower(), data, block)
+            result = self.calls.get(key)
+            if result is not None:
+                self.stats["memo_hits"] += 1
+                return result
+                
+        result = function.decode(await self.rpc.call(address, data, block))
+        if key is not None:
+            self.calls.set(key, result)
+        return result
+
+    def decode_log(self, log: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Decode a log emitted by a registered contract.
+        
+        Args:
+            log: Log as returned by ``eth_getLogs``
+            
+        Returns:
+            Decoded log, or None if its contract or event is unknown
+        """
+        contract = self.contracts.get(log["address"].lower())
+        return contract.decode_log(log) if contract is not None else None
+
+    def __contains__(self, address: str) -> bool:
+        return address.lower() in self.contracts
+
+    def __len__(self) -> int:
+        return len(self.contracts)
\ No newline at end of file
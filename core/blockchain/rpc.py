@@ -0,0 +1,198 @@
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import itertools
+import logging
+
+from ..utils.batching import RequestBatcher
+from ..utils.lazy import lazy_import
+
+aiohttp = lazy_import("aiohttp")
+
+class JsonRpcPool:
+    """
+    Async JSON-RPC client for a pool of node endpoints.
+    Requests share keep-alive connections, and concurrent requests are
+    coalesced into JSON-RPC batch requests, so hundreds of reads issued
+    together cost a handful of round trips. Batches go to the endpoints in
+    turn and fail over to the next endpoint when one is unreachable.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the pool.
+        
+        Args:
+            config: Network configuration:
+                - rpc_url: Node URL, or rpc_urls: list of node URLs
+                - rpc_batch_size: Requests per batch (default: 100)
+                - rpc_batch_delay_ms: Milliseconds a request waits for
+                  others to batch with (default: 2)
+                - rpc_timeout: Seconds per batch request (default: 10)
+                - max_connections: Connection pool size (default: 20)
+                - keepalive_timeout: Seconds idle connections are kept
+                  (default: 30)
+        """
+        self.config = config
+        self.urls: List[str] = list(config.get("rpc_urls") or [config["rpc_url"]])
+        self.batcher = RequestBatcher(
+            self._send_batch,
+            max_batch_size=config.get("rpc_batch_size", 100),
+            max_delay=config.get("rpc_batch_delay_ms", 2) / 1000
+        )
+        self.session: Optional["aiohttp.ClientSession"] = None
+        self.stats = {"requests": 0, "batches": 0, "failovers": 0}
+        self._next = 0
+        self._ids = itertools.count()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def open(self) -> "aiohttp.ClientSession":
+        """
+        Get the pooled session, creating it on first use.
+        
+        Returns:
+            Shared client session
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.get("max_connections", 20),
+                keepalive_timeout=self.config.get("keepalive_timeout", 30),
+            )
+            timeout = aiohttp.ClientTimeout(total=self.config.get("rpc_timeout", 10))
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self.session
+
+    async def close(self):
+        """Close the pooled session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def request(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        """
+        Make a JSON-RPC request, batched with concurrent ones.
+        
+        Args:
+            method: RPC method, e.g. "eth_call"
+            params: Method parameters
+            
+        Returns:
+            Result of the request
+        """
+        self.stats["requests"] += 1
+        return await self.batcher.submit((method, params or []))
+
+    async def send(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        """
+        Make a JSON-RPC request on its own.
+        
+        For slow requests such as ``eth_getLogs``, which would hold up
+        the other requests of a batch.
+        
+        Args:
+            method: RPC method
+            params: Method parameters
+            
+        Returns:
+            Result of the request
+        """
+        self.stats["requests"] += 1
+        result, = await self._send_batch([(method, params or [])])
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Make several JSON-RPC requests in one batch.
+        
+        Args:
+            calls: Methods and their parameters
+            
+        Returns:
+            Results in call order, or the exception of a failed call
+        """
+        self.stats["requests"] += len(calls)
+        return await self._send_batch(calls)
+
+    async def call(self, to: str, data: str, block: Any = "latest") -> str:
+        """
+        Execute a read-only contract call.
+        
+        Args:
+            to: Contract address
+            data: Hex-encoded calldata
+            block: Block number or tag to read at
+            
+        Returns:
+            Hex-encoded return data
+        """
+        if isinstance(block, int):
+            block = hex(block)
+        return await self.request("eth_call", [{"to": to, "data": data}, block])
+
+    async def block_number(self) -> int:
+        """
+        Get the latest block number.
+        
+        Returns:
+            Block number
+        """
+        return int(await self.request("eth_blockNumber"), 16)
+
+    async def _send_batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Send calls as one JSON-RPC batch, failing over between endpoints.
+        
+        Args:
+            calls: Methods and their parameters
+            
+        Returns:
+            Results in call order; an error of a single call is returned
+            as its exception
+        """
+        ids = [next(self._ids) for _ in calls]
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            for request_id, (method, params) in zip(ids, calls)
+        ]
+        session = await self.open()
+        self.stats["batches"] += 1
+        
+        error: Optional[Exception] = None
+        for attempt in range(len(self.urls)):
+            url = self.urls[self._next % len(self.urls)]
+            self._next += 1
+            try:
+                response = await session.post(url, json=payload)
+                async with response:
+                    if response.status < 500:
+                        if response.status != 200:
+                            raise Exception(f"RPC request to {url} failed with status {response.status}")
+                        replies = await response.json(content_type=None)
+                        break
+                    error = Exception(f"RPC endpoint {url} returned status {response.status}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+                
+            if attempt < len(self.urls) - 1:
+                self.stats["failovers"] += 1
+                self.logger.warning(f"RPC endpoint {url} failed, trying the next one: {str(error)}")
+        else:
+            raise error
+            
+        if isinstance(replies, dict):
+            # Nodes rejecting the whole batch answer with a single error
+            raise Exception(f"RPC batch failed: {replies.get('error', replies)}")
+            
+        by_id = {reply.get("id"): reply for reply in replies}
+        results = []
+        for request_id, (method, _) in zip(ids, calls):
+            reply = by_id.get(request_id)
+            if reply is None:
+                results.append(Exception(f"No response to {method}"))
+            elif "error" in reply:
+                rpc_error = reply["error"]
+                results.append(Exception(f"{method} failed: {rpc_error.get('message')} ({rpc_error.get('code')})"))
+            else:
+                results.append(reply.get("result"))
+        return results
\ No newline at end of file
@@ -0,0 +1,176 @@
+from collections import deque
+from typing import Any, AsyncIterator, Dict, List, Optional
+import asyncio
+import logging
+import time
+
+from .rpc import JsonRpcPool
+
+# Error messages nodes use when a log query covers too much
+TOO_MANY_RESULTS = (
+    "more than",
+    "too many",
+    "limit exceeded",
+    "response size",
+    "range is too large",
+    "limited to",
+    "(-32005)",
+)
+
+def is_too_many_results(error: Exception) -> bool:
+    """
+    Check whether an error means a log query must cover fewer blocks.
+    
+    Args:
+        error: Error raised by the query
+        
+    Returns:
+        True if the range should be split
+    """
+    if isinstance(error, asyncio.TimeoutError):
+        # Includes aiohttp's ServerTimeoutError; nodes often time out
+        # rather than answer with an error on ranges they cannot serve
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in TOO_MANY_RESULTS)
+
+class LogScanner:
+    """
+    Fetches event logs over block ranges of any length.
+    Ranges are split into chunks fetched concurrently, and logs are yielded
+    in block order as the chunks complete. The chunk size adapts to the
+    node: a chunk with too many results, or timing out, is split in two
+    and later chunks are smaller; chunks answered quickly make later chunks larger, doubling
+    up to the maximum but only halfway towards a size that had too many.
+    """
+
+    def __init__(self, rpc: JsonRpcPool, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the scanner.
+        
+        Args:
+            rpc: JSON-RPC pool of the network
+            config: Network configuration:
+                - log_chunk_size: Initial blocks per query (default: 2000)
+                - log_min_chunk_size: Smallest chunk size (default: 1)
+                - log_max_chunk_size: Largest chunk size (default: 100000)
+                - log_concurrency: Queries in flight (default: 4)
+                - log_target_seconds: Query duration below which chunks
+                  grow and above twice of which they shrink (default: 1.0)
+        """
+        config = config or {}
+        self.rpc = rpc
+        self.chunk_size = config.get("log_chunk_size", 2000)
+        self.min_chunk_size = config.get("log_min_chunk_size", 1)
+        self.max_chunk_size = config.get("log_max_chunk_size", 100000)
+        self.concurrency = config.get("log_concurrency", 4)
+        self.target_seconds = config.get("log_target_seconds", 1.0)
+        # Smallest chunk size that had too many results
+        self.too_many: Optional[int] = None
+        self.stats = {"queries": 0, "splits": 0}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def scan(
+        self,
+        address: Any,
+        topics: Optional[List[Any]],
+        from_block: int,
+        to_block: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the logs of a block range.
+        
+        Args:
+            address: Contract address, or list of addresses
+            topics: Topic filters, as for ``eth_getLogs``
+            from_block: First block
+            to_block: Last block (default: latest block)
+            
+        Yields:
+            Logs ordered by block number and log index
+        """
+        if to_block is None:
+            to_block = await self.rpc.block_number()
+            
+        pending = deque()
+        start = from_block
+        try:
+            while pending or start <= to_block:
+                while len(pending) < self.concurrency and start <= to_block:
+                    end = min(start + self.chunk_size - 1, to_block)
+                    pending.append(asyncio.ensure_future(self._fetch(address, topics, start, end)))
+                    start = end + 1
+                    
+                for log in await pending.popleft():
+                    yield log
+        finally:
+            # The consumer stopped early or a chunk failed
+            for task in pending:
+                task.cancel()
+
+    async def get_logs(
+        self,
+        address: Any,
+        topics: Optional[List[Any]],
+        from_block: int,
+        to_block: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all logs of a block range.
+        
+        Args:
+            address: Contract address, or list of addresses
+            topics: Topic filters, as for ``eth_getLogs``
+            from_block: First block
+            to_block: Last block (default: latest block)
+            
+        Returns:
+            Logs ordered by block number and log index
+        """
+        return [log async for log in self.scan(address, topics, from_block, to_block)]
+
+    async def _fetch(self, address: Any, topics: Optional[List[Any]], start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        Fetch the logs of a chunk, splitting it while it has too many.
+        
+        Args:
+            address: Contract address, or list of addresses
+            topics: Topic filters
+            start: First block of the chunk
+            end: Last block of the chunk
+            
+        Returns:
+            Logs of the chunk in order
+        """
+        log_filter = {"address": address, "fromBlock": hex(start), "toBlock": hex(end)}
+        if topics:
+            log_filter["topics"] = topics
+            
+        self.stats["queries"] += 1
+        started = time.monotonic()
+        try:
+            logs = await self.rpc.send("eth_getLogs", [log_filter])
+        except Exception as e:
+            if not is_too_many_results(e) or start == end:
+                raise
+            size = end - start + 1
+            self.stats["splits"] += 1
+            self.too_many = min(self.too_many or size, size)
+            self.chunk_size = max(min(self.chunk_size, size // 2), self.min_chunk_size)
+            self.logger.debug(f"Splitting blocks {start}-{end}: {str(e)}")
+            
+            middle = start + size // 2
+            return await self._fetch(address, topics, start, middle - 1) + \
+                await self._fetch(address, topics, middle, end)
+                
+        elapsed = time.monotonic() - started
+        if elapsed < self.target_seconds and end - start + 1 >= self.chunk_size:
+            limit = self.max_chunk_size
+            if self.too_many is not None:
+                limit = min(limit, (self.chunk_size + self.too_many) // 2)
+            self.chunk_size = max(min(self.chunk_size * 2, limit), self.chunk_size)
+        elif elapsed > 2 * self.target_seconds:
+            self.chunk_size = max(self.chunk_size // 2, self.min_chunk_size)
+            
+        logs.sort(key=lambda log: (int(log["blockNumber"], 16), int(log["logIndex"], 16)))
+        return logs
\ No newline at end of file
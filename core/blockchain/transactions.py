@@ -0,0 +1,442 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
+import logging
+import time
+
+from ..utils.cache import LRUCache
+from .rpc import JsonRpcPool
+
+# Fields sent as strings rather than hex quantities
+STRING_FIELDS = ("from", "to", "data", "input", "accessList")
+
+def to_rpc(transaction: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Encode a transaction for JSON-RPC.
+    
+    Args:
+        transaction: Transaction with integer quantities
+        
+    Returns:
+        Transaction with quantities as hex strings
+    """
+    return {
+        field: hex(value) if isinstance(value, int) and field not in STRING_FIELDS else value
+        for field, value in transaction.items()
+    }
+
+class NonceManager:
+    """
+    Allocates nonces per account locally.
+    The node is asked for an account's pending transaction count once;
+    later nonces are counted up without a round trip. A nonce released
+    unused is handed out again, and the count is fetched anew once the
+    account has nothing in flight.
+    """
+
+    def __init__(self, rpc: JsonRpcPool):
+        """
+        Initialize the manager.
+        
+        Args:
+            rpc: JSON-RPC pool of the network
+        """
+        self.rpc = rpc
+        self.next: Dict[str, int] = {}
+        # Allocated nonces not yet completed or released
+        self.outstanding: Dict[str, set] = {}
+        # Released nonces below the next one, handed out first
+        self.released: Dict[str, set] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def allocate(self, account: str) -> int:
+        """
+        Allocate the next nonce of an account.
+        
+        Args:
+            account: Sending address
+            
+        Returns:
+            Nonce for the account's next transaction
+        """
+        account = account.lower()
+        if account not in self._locks:
+            self._locks[account] = asyncio.Lock()
+        async with self._locks[account]:
+            if account not in self.next:
+                self.next[account] = int(await self.rpc.request("eth_getTransactionCount", [account, "pending"]), 16)
+            released = self.released.get(account)
+            if released:
+                nonce = min(released)
+                released.remove(nonce)
+            else:
+                nonce = self.next[account]
+                self.next[account] += 1
+            self.outstanding.setdefault(account, set()).add(nonce)
+            return nonce
+
+    def complete(self, account: str, nonce: int):
+        """
+        Mark an allocated nonce as used on chain.
+        
+        Args:
+            account: Sending address
+            nonce: Nonce of a mined, dropped or replaced transaction
+        """
+        account = account.lower()
+        outstanding = self.outstanding.get(account)
+        if outstanding is not None:
+            outstanding.discard(nonce)
+            if not outstanding:
+                del self.outstanding[account]
+
+    def release(self, account: str, nonce: int):
+        """
+        Return an allocated nonce that may not have been used.
+        
+        Other nonces of the account may be in flight, so only this one is
+        handed out again; without any, the count is fetched anew.
+        
+        Args:
+            account: Sending address
+            nonce: Nonce of a transaction that failed to send or confirm
+        """
+        account = account.lower()
+        if nonce not in self.outstanding.get(account, ()):
+            # Not allocated here, or already completed
+            return
+        self.complete(account, nonce)
+        if account not in self.outstanding:
+            self.reset(account)
+            return
+            
+        released = self.released.setdefault(account, set())
+        released.add(nonce)
+        while self.next[account] - 1 in released:
+            self.next[account] -= 1
+            released.remove(self.next[account])
+
+    def reset(self, account: str):
+        """
+        Forget an account's nonce so the next one is fetched from the node.
+        
+        Args:
+            account: Sending address
+        """
+        self.next.pop(account.lower(), None)
+        self.released.pop(account.lower(), None)
+
+class FeeOracle:
+    """
+    Cached fee estimates, refreshed once they are too old.
+    On chains with a base fee the estimate is an EIP-1559 fee cap of twice
+    the base fee plus the priority fee, so it stays valid for several
+    blocks of rising fees; other chains get the node's gas price.
+    """
+
+    def __init__(self, rpc: JsonRpcPool, config: Optional[Dict[str, Any]] = None, timer=time.monotonic):
+        """
+        Initialize the oracle.
+        
+        Args:
+            rpc: JSON-RPC pool of the network
+            config: Network configuration:
+                - fee_refresh_seconds: Age after which estimates are
+                  refreshed (default: 15)
+            timer: Clock used for the estimate age
+        """
+        config = config or {}
+        self.rpc = rpc
+        self.refresh_seconds = config.get("fee_refresh_seconds", 15)
+        self.timer = timer
+        self.estimate: Optional[Dict[str, int]] = None
+        self.updated_at: Optional[float] = None
+        self.refreshes = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def fees(self) -> Dict[str, int]:
+        """
+        Get the current fee estimate.
+        
+        Returns:
+            "maxFeePerGas" and "maxPriorityFeePerGas", or "gasPrice"
+        """
+        if self.updated_at is None or self.timer() - self.updated_at >= self.refresh_seconds:
+            if self._lock is None:
+                self._lock = asyncio.Lock()
+            async with self._lock:
+                # Another caller may have refreshed while this one waited
+                if self.updated_at is None or self.timer() - self.updated_at >= self.refresh_seconds:
+                    await self.refresh()
+        return dict(self.estimate)
+
+    async def refresh(self):
+        """Fetch a new fee estimate from the node."""
+        block, priority_fee, gas_price = await self.rpc.batch([
+            ("eth_getBlockByNumber", ["latest", False]),
+            ("eth_maxPriorityFeePerGas", []),
+            ("eth_gasPrice", []),
+        ])
+        if isinstance(gas_price, Exception):
+            raise gas_price
+        gas_price = int(gas_price, 16)
+        
+        base_fee = block.get("baseFeePerGas") if isinstance(block, dict) else None
+        if base_fee is None:
+            estimate = {"gasPrice": gas_price}
+        else:
+            base_fee = int(base_fee, 16)
+            if isinstance(priority_fee, Exception):
+                # Nodes without the method: the gas price includes the tip
+                priority_fee = max(gas_price - base_fee, 0)
+            else:
+                priority_fee = int(priority_fee, 16)
+            estimate = {"maxFeePerGas": 2 * base_fee + priority_fee, "maxPriorityFeePerGas": priority_fee}
+            
+        self.estimate = estimate
+        self.updated_at = self.timer()
+        self.refreshes += 1
+
+class TransactionPipeline:
+    """
+    Submits transactions with up to ``max_in_flight`` awaiting confirmation.
+    Nonces are allocated locally, fees come from the cached estimate and
+    gas estimates of concurrent submissions share batch requests, so a
+    submission costs one round trip for the gas estimate and one to send.
+    Receipts of all transactions in flight are polled together until they
+    are ``confirmation_blocks`` deep. A transaction whose nonce was used by
+    another one, or that is not confirmed within ``confirmation_timeout``,
+    fails so it does not hold its slot forever.
+    """
+
+    def __init__(
+        self,
+        rpc: JsonRpcPool,
+        config: Optional[Dict[str, Any]] = None,
+        signer: Optional[Callable[[Dict[str, Any]], Union[bytes, str, Awaitable[Union[bytes, str]]]]] = None
+    ):
+        """
+        Initialize the pipeline.
+        
+        Args:
+            rpc: JSON-RPC pool of the network
+            config: Network configuration:
+                - chain_id: Chain id set on transactions
+                - confirmation_blocks: Blocks on top of a transaction's
+                  block before it is confirmed (default: 0)
+                - gas_limit: Largest gas limit of a transaction
+                - gas_multiplier: Headroom on gas estimates (default: 1.2)
+                - max_in_flight: Transactions submitted but not confirmed
+                  (default: 16)
+                - receipt_poll_seconds: Interval of receipt polls
+                  (default: 1.0)
+                - receipt_cache_size: Outcomes of confirmed transactions
+                  kept for ``wait`` (default: 1000)
+                - confirmation_timeout: Seconds after which a transaction
+                  without a receipt fails (default: 600)
+                - fee_refresh_seconds: See ``FeeOracle``
+            signer: Function, or coroutine function, returning a signed raw
+                transaction; without one transactions are sent for the
+                node to sign
+        """
+        config = config or {}
+        self.rpc = rpc
+        self.signer = signer
+        self.chain_id = config.get("chain_id")
+        self.confirmation_blocks = config.get("confirmation_blocks", 0)
+        self.gas_limit = config.get("gas_limit")
+        self.gas_multiplier = config.get("gas_multiplier", 1.2)
+        self.max_in_flight = config.get("max_in_flight", 16)
+        self.poll_seconds = config.get("receipt_poll_seconds", 1.0)
+        self.confirmation_timeout = config.get("confirmation_timeout", 600)
+        self.nonces = NonceManager(rpc)
+        self.fees = FeeOracle(rpc, config)
+        self.stats = {"submitted": 0, "confirmed": 0, "failed": 0}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        # Sender, nonce and submission time of transactions in flight
+        self._sent: Dict[str, Tuple[str, int, float]] = {}
+        # Transactions in flight whose nonce was already used on chain
+        self._superseded = set()
+        self.receipts = LRUCache(maxsize=config.get("receipt_cache_size", 1000))
+        self._tracker: Optional[asyncio.Task] = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def submit(self, transaction: Dict[str, Any]) -> str:
+        """
+        Submit a transaction, waiting while the pipeline is full.
+        
+        Args:
+            transaction: Transaction with integer quantities and a "from"
+                address; nonce, gas, fees and chain id are filled in
+                
+        Returns:
+            Transaction hash
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        slots = self._slots
+        await slots.acquire()
+        transaction = dict(transaction)
+        try:
+            tx_hash = await self._send(transaction)
+        except BaseException:
+            slots.release()
+            self.stats["failed"] += 1
+            raise
+            
+        self.stats["submitted"] += 1
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda _: slots.release())
+        self._pending[tx_hash] = future
+        self._sent[tx_hash] = (transaction["from"].lower(), transaction["nonce"], time.monotonic())
+        if self._tracker is None or self._tracker.done():
+            self._tracker = asyncio.ensure_future(self._track())
+        return tx_hash
+
+    async def wait(self, tx_hash: str) -> Dict[str, Any]:
+        """
+        Wait for a submitted transaction to be confirmed.
+        
+        Args:
+            tx_hash: Transaction hash
+            
+        Returns:
+            Transaction receipt
+        """
+        future = self._pending.get(tx_hash) or self.receipts.get(tx_hash)
+        if future is None:
+            raise Exception(f"Unknown transaction {tx_hash}")
+        return await asyncio.shield(future)
+
+    async def send(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit a transaction and wait for its confirmation.
+        
+        Args:
+            transaction: Transaction, as for ``submit``
+            
+        Returns:
+            Transaction receipt
+        """
+        return await self.wait(await self.submit(transaction))
+
+    async def send_all(self, transactions: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Send transactions through the pipeline.
+        
+        Args:
+            transactions: Transactions, as for ``submit``
+            
+        Returns:
+            Receipts in order, or the exception of a failed transaction
+        """
+        return await asyncio.gather(*(self.send(transaction) for transaction in transactions), return_exceptions=True)
+
+    async def close(self):
+        """Stop tracking confirmations."""
+        if self._tracker is not None:
+            self._tracker.cancel()
+            await asyncio.gather(self._tracker, return_exceptions=True)
+            self._tracker = None
+
+    async def _send(self, transaction: Dict[str, Any]) -> str:
+        """
+        Complete, sign and send a transaction.
+        
+        Args:
+            transaction: Transaction to send
+            
+        Returns:
+            Transaction hash
+        """
+        if self.chain_id is not None:
+            transaction.setdefault("chainId", self.chain_id)
+        if "gasPrice" not in transaction and "maxFeePerGas" not in transaction:
+            transaction.update(await self.fees.fees())
+        if "gas" not in transaction:
+            # Estimated before the nonce is taken: a reverting call leaves no gap
+            estimate = int(await self.rpc.request("eth_estimateGas", [to_rpc(transaction)]), 16)
+            gas = int(estimate * self.gas_multiplier)
+            transaction["gas"] = min(gas, self.gas_limit) if self.gas_limit else gas
+            
+        account = transaction["from"]
+        if "nonce" not in transaction:
+            transaction["nonce"] = await self.nonces.allocate(account)
+        nonce = transaction["nonce"]
+        try:
+            if self.signer is None:
+                return await self.rpc.request("eth_sendTransaction", [to_rpc(transaction)])
+            raw = self.signer(transaction)
+            if asyncio.iscoroutine(raw):
+                raw = await raw
+            if isinstance(raw, (bytes, bytearray)):
+                raw = "0x" + raw.hex()
+            return await self.rpc.request("eth_sendRawTransaction", [raw])
+        except Exception:
+            # The nonce may not have been used; hand it out again
+            self.nonces.release(account, nonce)
+            raise
+
+    async def _track(self):
+        """Poll receipts of transactions in flight until all are resolved."""
+        while self._pending:
+            await asyncio.sleep(self.poll_seconds)
+            hashes = list(self._pending)
+            accounts = sorted({self._sent[tx_hash][0] for tx_hash in hashes})
+            try:
+                tip, *results = await asyncio.gather(
+                    self.rpc.block_number(),
+                    *(self.rpc.request("eth_getTransactionReceipt", [tx_hash]) for tx_hash in hashes),
+                    *(self.rpc.request("eth_getTransactionCount", [account, "latest"]) for account in accounts)
+                )
+            except Exception as e:
+                self.logger.warning(f"Receipt poll failed: {str(e)}")
+                continue
+                
+            receipts = results[:len(hashes)]
+            mined = {account: int(count, 16) for account, count in zip(accounts, results[len(hashes):])}
+            now = time.monotonic()
+            for tx_hash, receipt in zip(hashes, receipts):
+                if receipt is None or receipt.get("blockNumber") is None:
+                    account, nonce, submitted_at = self._sent[tx_hash]
+                    if mined[account] > nonce:
+                        # Checked on the next poll too, in case the receipt lagged
+                        if tx_hash in self._superseded:
+                            self._resolve(tx_hash, error=Exception(f"Transaction {tx_hash} was dropped or replaced: nonce {nonce} of {account} is used"))
+                        self._superseded.add(tx_hash)
+                    elif now - submitted_at >= self.confirmation_timeout:
+                        # The nonce may never be used; hand it out again
+                        self.nonces.release(account, nonce)
+                        self._resolve(tx_hash, error=Exception(f"Transaction {tx_hash} not confirmed within {self.confirmation_timeout}s"))
+                    continue
+                if tip - int(receipt["blockNumber"], 16) < self.confirmation_blocks:
+                    continue
+                if receipt.get("status") == "0x0":
+                    self._resolve(tx_hash, error=Exception(f"Transaction {tx_hash} reverted in block {int(receipt['blockNumber'], 16)}"))
+                else:
+                    self._resolve(tx_hash, receipt=receipt)
+
+    def _resolve(self, tx_hash: str, receipt: Optional[Dict[str, Any]] = None, error: Optional[Exception] = None):
+        """
+        Settle a transaction in flight, releasing its slot.
+        
+        Args:
+            tx_hash: Transaction hash
+            receipt: Receipt of a confirmed transaction
+            error: Error of a failed transaction
+        """
+        future = self._pending.pop(tx_hash)
+        sent = self._sent.pop(tx_hash, None)
+        if sent is not None:
+            # No-op for a nonce released on timeout
+            self.nonces.complete(sent[0], sent[1])
+        self._superseded.discard(tx_hash)
+        self.receipts.set(tx_hash, future)
+        if future.done():
+            return
+        if error is not None:
+            self.stats["failed"] += 1
+            future.set_exception(error)
+        else:
+            self.stats["confirmed"] += 1
+            future.set_result(receipt)
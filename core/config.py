@@ -71,6 +71,9 @@ class Config:
                 "collectors": {
                     "max_retries": 3,
                     "timeout": 10,
+                    "max_connections": 100,
+                    "max_connections_per_host": 10,
+                    "keepalive_timeout": 30,
                 },
                 "storage": {
                     "retention_days": 30,
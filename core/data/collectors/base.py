@@ -1,5 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
+import asyncio
+import hashlib
+import logging
+
+import aiohttp
+
+from ...utils.cache import LRUCache
+from .http_cache import ResponseCache
+from .state import CursorStore
+from .throttle import backoff_delay, get_rate_limiter
 
 class BaseCollector(ABC):
     """
@@ -12,10 +22,226 @@ class BaseCollector(ABC):
         Initialize the collector with configuration.
         
         Args:
-            config: Dictionary containing collector configuration
+            config: Dictionary containing collector configuration. Connection
+                pool settings are usually taken from ``data.collectors``:
+                - timeout: Total request timeout in seconds (default: 10)
+                - max_connections: Size of the connection pool (default: 100)
+                - max_connections_per_host: Per-host pool limit (default: 10)
+                - keepalive_timeout: Idle keep-alive in seconds (default: 30)
+                - dedup_size: Number of item IDs remembered (default: 100000)
+                - retention_days: Days an item ID is remembered, usually
+                  ``data.storage.retention_days`` (default: 30)
+                - state_file: Optional JSON file persisting polling cursors
+                - max_retries: Retries per request (default: 3)
+                - retry_backoff: Base retry delay in seconds (default: 0.5)
+                - retry_backoff_max: Maximum retry delay in seconds (default: 30)
+                - rate_limit: Requests per second allowed per source and API
+                  key; unlimited when unset
+                - rate_limit_burst: Maximum burst of requests (default: one
+                  second's worth)
+                - cache_ttl: Seconds identical requests are answered from the
+                  response cache; caching is off when unset
+                - cache_size: Responses kept in memory (default: 1024)
+                - cache_dir: Optional directory for the on-disk cache tier
+                - cache_max_age: Seconds responses are kept on disk for
+                  revalidation (default: 86400)
+                - cache_max_files: Responses kept on disk (default: 10000)
         """
         self.config = config
         self.is_running = False
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.seen = LRUCache(
+            maxsize=config.get("dedup_size", 100000),
+            ttl=config.get("retention_days", 30) * 86400
+        )
+        self.cursors = CursorStore(config.get("state_file"))
+        self.max_retries = config.get("max_retries", 3)
+        self.retry_backoff = config.get("retry_backoff", 0.5)
+        self.retry_backoff_max = config.get("retry_backoff_max", 30.0)
+        self.rate_limiter = None
+        if config.get("rate_limit"):
+            self.rate_limiter = get_rate_limiter(
+                self.__class__.__name__,
+                config.get("api_key", ""),
+                config["rate_limit"],
+                config.get("rate_limit_burst")
+            )
+        self.response_cache = None
+        if config.get("cache_ttl"):
+            self.response_cache = ResponseCache(
+                ttl=config["cache_ttl"],
+                maxsize=config.get("cache_size", 1024),
+                cache_dir=config.get("cache_dir"),
+                max_age=config.get("cache_max_age", 86400),
+                max_files=config.get("cache_max_files", 10000)
+            )
+
+    async def fetch_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """
+        GET a JSON resource, paced by the rate limiter and retried on failure.
+        
+        Rate limiting (429) and server errors (5xx) as well as network errors
+        are retried up to ``max_retries`` times with jittered exponential
+        backoff, or after the delay given by a Retry-After header. A 429 also
+        slows down the shared rate limiter.
+        
+        With a response cache, fresh responses are served without a request
+        and stale ones are revalidated with If-None-Match/If-Modified-Since.
+        
+        Args:
+            url: Resource URL
+            params: Optional query parameters
+            headers: Optional request headers
+            
+        Returns:
+            Decoded JSON response
+        """
+        cached = None
+        if self.response_cache:
+            cache_key = self.response_cache.make_key(url, params)
+            cached = self.response_cache.get(cache_key)
+            if cached and self.response_cache.is_fresh(cached):
+                return cached["body"]
+            if cached:
+                headers = {**(headers or {}), **self.response_cache.conditional_headers(cached)}
+                
+        session = await self.open_session()
+        
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+                
+            retry_after = None
+            try:
+                response = await session.get(url, headers=headers, params=params)
+                async with response:
+                    if response.status == 200:
+                        if self.rate_limiter:
+                            self.rate_limiter.recover()
+                        body = await response.json()
+                        if self.response_cache:
+                            self.response_cache.set(
+                                cache_key,
+                                body,
+                                response.headers.get("ETag"),
+                                response.headers.get("Last-Modified")
+                            )
+                        return body
+                    if response.status == 304 and cached:
+                        return self.response_cache.refresh(cache_key, cached)["body"]
+                        
+                    error = Exception(f"API request failed with status {response.status}")
+                    if response.status != 429 and response.status < 500:
+                        raise error
+                    if response.status == 429:
+                        retry_after = self._retry_after(response)
+                        if self.rate_limiter:
+                            self.rate_limiter.throttle()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+                
+            if attempt < self.max_retries:
+                if retry_after is not None:
+                    delay = retry_after
+                    if self.rate_limiter:
+                        self.rate_limiter.pause(retry_after)
+                else:
+                    delay = backoff_delay(attempt, self.retry_backoff, self.retry_backoff_max)
+                self.logger.warning(f"Retrying {url} in {delay:.2f}s: {str(error)}")
+                await asyncio.sleep(delay)
+                
+        raise error
+
+    @staticmethod
+    def _retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+        """
+        Get the delay requested by a Retry-After header.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            Delay in seconds, or None if absent or not in seconds
+        """
+        try:
+            return max(0.0, float(response.headers.get("Retry-After")))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def content_id(prefix: str, *parts: Optional[str]) -> str:
+        """
+        Build a deterministic item ID from its identifying content.
+        
+        Args:
+            prefix: Source prefix (e.g. "newsapi")
+            parts: Identifying fields such as URL and content
+            
+        Returns:
+            Stable ID of the form ``<prefix>_<hash>``
+        """
+        digest = hashlib.sha256("\0".join(part or "" for part in parts).encode("utf-8"))
+        return f"{prefix}_{digest.hexdigest()[:32]}"
+
+    def filter_seen(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop items that were already collected and remember the rest.
+        
+        Args:
+            items: Collected items carrying an "id" key
+            
+        Returns:
+            Items not seen within the retention window
+        """
+        fresh = []
+        for item in items:
+            if item["id"] in self.seen:
+                continue
+            self.seen.set(item["id"], True)
+            fresh.append(item)
+        return fresh
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Build a pooled HTTP session sized from the collector configuration.
+        
+        Returns:
+            New client session with a keep-alive connection pool
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.config.get("max_connections", 100),
+            limit_per_host=self.config.get("max_connections_per_host", 10),
+            keepalive_timeout=self.config.get("keepalive_timeout", 30),
+            ttl_dns_cache=self.config.get("dns_cache_ttl", 300),
+        )
+        timeout = aiohttp.ClientTimeout(total=self.config.get("timeout", 10))
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def open_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+        
+        The session is owned by the collector and reused across calls so
+        that connections (and their TCP/TLS handshakes) are kept alive.
+        
+        Returns:
+            Shared client session
+        """
+        if self.session is None or self.session.closed:
+            self.session = self._create_session()
+        return self.session
+
+    async def close_session(self):
+        """Close the shared HTTP session and release pooled connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
 
     @abstractmethod
     async def connect(self) -> bool:
@@ -50,6 +276,52 @@ class BaseCollector(ABC):
         """
         pass
 
+    async def stream(self, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Collect data from the source incrementally.
+        
+        Collectors that fetch in pages should override this so consumers can
+        start processing before the whole result set is in memory. The
+        default implementation yields the result of ``collect`` as a single
+        batch.
+        
+        Args:
+            params: Optional parameters for data collection
+            
+        Yields:
+            Batches of collected data items
+        """
+        data = await self.collect(params)
+        if data:
+            yield data
+
+    async def poll(
+        self,
+        interval: float,
+        params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream new data from the source every ``interval`` seconds.
+        
+        Collectors that keep a cursor only fetch items newer than the
+        previous poll, so each cycle is a small delta.
+        
+        Args:
+            interval: Seconds between polls, usually
+                ``services.prediction.update_interval``
+            params: Optional parameters for data collection
+            
+        Yields:
+            Batches of collected data items
+        """
+        while True:
+            try:
+                async for batch in self.stream(params):
+                    yield batch
+            except Exception as e:
+                self.logger.error(f"Poll failed: {str(e)}")
+            await asyncio.sleep(interval)
+
     @abstractmethod
     async def validate(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -61,4 +333,4 @@ class BaseCollector(ABC):
         Returns:
             List of validated data items
         """
-        pass 
\ No newline at end of file
+        pass
\ No newline at end of file
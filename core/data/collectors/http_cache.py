@@ -0,0 +1,191 @@
+from typing import Any, Callable, Dict, Optional
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from ...utils.cache import LRUCache
+
+class ResponseCache:
+    """
+    Cache of decoded JSON responses for collector HTTP calls.
+    Entries live in memory with an optional on-disk tier, and keep their
+    ETag/Last-Modified validators so stale entries can be revalidated with
+    a conditional request. Files of the on-disk tier older than
+    ``max_age`` are deleted, as are the oldest beyond ``max_files``.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = 1024,
+        cache_dir: Optional[str] = None,
+        timer: Callable[[], float] = time.time,
+        max_age: float = 86400,
+        max_files: int = 10000
+    ):
+        """
+        Initialize the response cache.
+        
+        Args:
+            ttl: Seconds a response is served without revalidation
+            maxsize: Maximum number of responses kept in memory
+            cache_dir: Optional directory for the on-disk tier
+            timer: Wall clock, shared with the on-disk tier
+            max_age: Seconds a response is kept on disk for revalidation
+            max_files: Maximum number of responses kept on disk
+        """
+        self.ttl = ttl
+        self.timer = timer
+        self.memory = LRUCache(maxsize=maxsize)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_age = max_age
+        self.max_files = max_files
+        self.pruned_at: Optional[float] = None
+        
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key of a request.
+        
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        query = json.dumps(params or {}, sort_keys=True, default=str)
+        return hashlib.sha256(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry, fresh or stale.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Entry with "body", "stored_at", "etag" and "last_modified", or None
+        """
+        entry = self.memory.get(key)
+        if entry is None and self.cache_dir:
+            path = self.cache_dir / f"{key}.json"
+            try:
+                with open(path) as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            if self.timer() - entry["stored_at"] >= self.max_age:
+                return None
+            self.memory.set(key, entry)
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """
+        Check whether an entry can be served without revalidation.
+        
+        Args:
+            entry: Cached entry
+            
+        Returns:
+            True if the entry is younger than the TTL
+        """
+        return self.timer() - entry["stored_at"] < self.ttl
+
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Get the headers revalidating an entry with the upstream.
+        
+        Args:
+            entry: Cached entry
+            
+        Returns:
+            If-None-Match/If-Modified-Since headers, if validators are known
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(
+        self,
+        key: str,
+        body: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Store a response.
+        
+        Args:
+            key: Cache key
+            body: Decoded JSON body
+            etag: Optional ETag header of the response
+            last_modified: Optional Last-Modified header of the response
+            
+        Returns:
+            Stored entry
+        """
+        entry = {
+            "body": body,
+            "stored_at": self.timer(),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        self.memory.set(key, entry)
+        
+        if self.cache_dir:
+            path = self.cache_dir / f"{key}.json"
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            # The modification time is the entry's age, by the cache's clock
+            os.utime(tmp_path, (entry["stored_at"], entry["stored_at"]))
+            os.replace(tmp_path, path)
+            if self.pruned_at is None or self.timer() - self.pruned_at >= self.ttl:
+                self.prune()
+                
+        return entry
+
+    def prune(self):
+        """Delete on-disk responses that are too old or too many."""
+        now = self.timer()
+        self.pruned_at = now
+        files = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                modified = path.stat().st_mtime
+                if now - modified >= self.max_age:
+                    path.unlink()
+                else:
+                    files.append((modified, path))
+            except OSError:
+                # Deleted concurrently
+                continue
+                
+        files.sort()
+        for _, path in files[:max(len(files) - self.max_files, 0)]:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+
+    def refresh(self, key: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Mark a stale entry as fresh after the upstream reported it unchanged.
+        
+        Args:
+            key: Cache key
+            entry: Revalidated entry
+            
+        Returns:
+            Refreshed entry
+        """
+        return self.set(key, entry["body"], entry.get("etag"), entry.get("last_modified"))
\ No newline at end of file
@@ -1,10 +1,29 @@
-from typing import Any, Dict, List, Optional
-import aiohttp
+from typing import Any, AsyncIterator, Dict, List, Optional
 import asyncio
+import math
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from ....utils.lazy import lazy_import
 from ..base import BaseCollector
 
+# Only needed for columnar validation of large batches
+pd = lazy_import("pandas")
+
+REQUIRED_FIELDS = ["title", "content", "url", "published_at"]
+MIN_CONTENT_LENGTH = 100
+
+# Canonical timestamp shapes (optional 3 or 6 digit fraction, optional "Z" or
+# +HH:MM offset) accepted by datetime.fromisoformat on every supported Python.
+# Each combination has a distinct length, so the length identifies the shape.
+CANONICAL_TIMESTAMP_SHAPES = {
+    19 + (fraction + 1 if fraction else 0) + offset: (fraction, offset)
+    for fraction in (0, 3, 6)
+    for offset in (0, 1, 6)
+}
+DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
 class NewsAPICollector(BaseCollector):
     """
     NewsAPI collector implementation.
@@ -21,6 +40,14 @@ class NewsAPICollector(BaseCollector):
                 - keywords: List of keywords to track
                 - language: Language of articles (default: en)
                 - max_articles: Maximum number of articles per request
+                - max_pages: Pages to fetch per keyword shard (default: 1)
+                - keyword_shard_size: Keywords per query; all keywords are
+                  joined into a single query when unset
+                - concurrency: Maximum concurrent requests (default: 5)
+                - vectorize_threshold: Batch size from which validation runs
+                  in columnar form (default: 1000)
+                - max_retries, rate_limit, dedup_size, retention_days,
+                  state_file: See ``BaseCollector``
         """
         super().__init__(config)
         self.base_url = "https://newsapi.org/v2"
@@ -28,121 +55,417 @@ class NewsAPICollector(BaseCollector):
         self.keywords = config.get("keywords", [])
         self.language = config.get("language", "en")
         self.max_articles = config.get("max_articles", 100)
+        self.max_pages = config.get("max_pages", 1)
+        self.keyword_shard_size = config.get("keyword_shard_size")
+        self.concurrency = config.get("concurrency", 5)
+        self.vectorize_threshold = config.get("vectorize_threshold", 1000)
 
     async def connect(self) -> bool:
         """
-        Test connection to NewsAPI.
+        Open the shared session and test connection to NewsAPI.
         
         Returns:
             bool: True if connection successful
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {"X-Api-Key": self.api_key}
-                async with session.get(
-                    f"{self.base_url}/top-headlines",
-                    headers=headers,
-                    params={"language": self.language, "pageSize": 1}
-                ) as response:
-                    return response.status == 200
+            session = await self.open_session()
+            headers = {"X-Api-Key": self.api_key}
+            response = await session.get(
+                f"{self.base_url}/top-headlines",
+                headers=headers,
+                params={"language": self.language, "pageSize": 1}
+            )
+            async with response:
+                self.is_running = response.status == 200
+                return self.is_running
         except Exception as e:
             self.logger.error(f"Failed to connect to NewsAPI: {str(e)}")
             return False
 
+    async def disconnect(self) -> bool:
+        """
+        Close the shared session.
+        
+        Returns:
+            bool: True if disconnection successful
+        """
+        try:
+            await self.close_session()
+            self.is_running = False
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to disconnect from NewsAPI: {str(e)}")
+            return False
+
     async def collect(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Collect news articles from NewsAPI.
         
         Args:
             params: Optional parameters including:
-                - start_date: Start date for articles
+                - start_date: Start date for articles; defaults to the
+                  newest article seen by the previous poll
                 - end_date: End date for articles
                 - sort_by: Sorting method (relevancy, popularity, publishedAt)
+                - max_pages: Override for the configured page limit
                 
         Returns:
             List of collected articles
         """
         try:
-            # Prepare parameters
-            search_params = {
-                "language": self.language,
-                "pageSize": self.max_articles,
-                "q": " OR ".join(self.keywords) if self.keywords else None,
-                "sortBy": params.get("sort_by", "publishedAt")
-            }
+            collected = []
+            async for articles in self.stream(params):
+                collected.extend(articles)
+            return collected
             
-            if params and "start_date" in params:
-                search_params["from"] = params["start_date"]
-            if params and "end_date" in params:
-                search_params["to"] = params["end_date"]
-            
-            # Remove None values
-            search_params = {k: v for k, v in search_params.items() if v is not None}
-            
-            # Make API request
-            async with aiohttp.ClientSession() as session:
-                headers = {"X-Api-Key": self.api_key}
-                async with session.get(
-                    f"{self.base_url}/everything",
-                    headers=headers,
-                    params=search_params
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"API request failed with status {response.status}")
-                    
-                    data = await response.json()
-                    articles = data.get("articles", [])
-                    
-                    # Transform to standard format
-                    return [
-                        {
-                            "id": f"newsapi_{i}",
-                            "source": article["source"]["name"],
-                            "title": article["title"],
-                            "content": article["content"],
-                            "url": article["url"],
-                            "published_at": article["publishedAt"],
-                            "collected_at": datetime.utcnow().isoformat(),
-                            "metadata": {
-                                "author": article.get("author"),
-                                "description": article.get("description"),
-                                "url_to_image": article.get("urlToImage")
-                            }
-                        }
-                        for i, article in enumerate(articles)
-                    ]
-                    
         except Exception as e:
             self.logger.error(f"Failed to collect news: {str(e)}")
             return []
 
+    async def stream(self, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream news articles from NewsAPI page by page.
+        
+        Pages and keyword shards are fetched concurrently, bounded by
+        ``concurrency``, and yielded in the order they arrive.
+        
+        Args:
+            params: Optional parameters, as for ``collect``
+            
+        Yields:
+            Pages of articles in the standard format
+        """
+        params = dict(params or {})
+        
+        # Resume from the newest article seen by the previous poll
+        cursor_key = self._cursor_key()
+        cursor = self.cursors.get(cursor_key)
+        if cursor and "start_date" not in params:
+            params["start_date"] = cursor
+            
+        errors = []
+        truncated = []
+        latest = None
+        async for page in self._iter_pages(params, errors, truncated):
+            # Drops overlaps between keyword shards and articles from earlier polls
+            articles = self.filter_seen([self._transform(article) for article in page])
+            for article in articles:
+                published_at = self._parse_timestamp(article["published_at"])
+                if published_at and (latest is None or published_at > latest[0]):
+                    latest = (published_at, article["published_at"])
+            if articles:
+                yield articles
+                
+        # Failed or unfetched pages hold older articles, so only advance on a full fetch
+        if latest and not errors and not truncated and (cursor is None or latest[0] > self._parse_timestamp(cursor)):
+            self.cursors.set(cursor_key, latest[1])
+
+    def _cursor_key(self) -> str:
+        """
+        Get the cursor key identifying this collector's query.
+        
+        Returns:
+            Cursor key for the configured language and keywords
+        """
+        return f"newsapi:{self.language}:{' OR '.join(self.keywords)}"
+
+    @staticmethod
+    def _parse_timestamp(value: str) -> Optional[datetime]:
+        """
+        Parse a NewsAPI timestamp.
+        
+        Args:
+            value: ISO 8601 timestamp, possibly with a "Z" suffix
+            
+        Returns:
+            Parsed datetime, or None if invalid
+        """
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except (AttributeError, ValueError):
+            return None
+
+    def _build_queries(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build the search parameters for each keyword shard.
+        
+        Args:
+            params: Collection parameters
+            
+        Returns:
+            List of search parameter dictionaries, one per shard
+        """
+        search_params = {
+            "language": self.language,
+            "pageSize": self.max_articles,
+            "sortBy": params.get("sort_by", "publishedAt"),
+            "from": params.get("start_date"),
+            "to": params.get("end_date"),
+        }
+        
+        # Remove None values
+        search_params = {k: v for k, v in search_params.items() if v is not None}
+        
+        if not self.keywords:
+            return [search_params]
+            
+        shard_size = self.keyword_shard_size or len(self.keywords)
+        return [
+            {**search_params, "q": " OR ".join(self.keywords[i:i + shard_size])}
+            for i in range(0, len(self.keywords), shard_size)
+        ]
+
+    async def _iter_pages(
+        self,
+        params: Dict[str, Any],
+        errors: Optional[List[Exception]] = None,
+        truncated: Optional[List[Dict[str, Any]]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Fetch result pages concurrently and yield them in completion order.
+        
+        The first page of each shard is requested up front; its
+        ``totalResults`` determines how many further pages are scheduled.
+        
+        Args:
+            params: Collection parameters
+            errors: Optional list receiving the errors of failed pages
+            truncated: Optional list receiving the queries of shards with
+                more results than ``max_pages`` pages hold
+                
+        Yields:
+            Raw NewsAPI articles, one page at a time
+        """
+        max_pages = params.get("max_pages", self.max_pages)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = {}
+
+        def schedule(query: Dict[str, Any], page: int):
+            task = asyncio.ensure_future(self._fetch_page(query, page, semaphore))
+            pending[task] = (query, page)
+            
+        for query in self._build_queries(params):
+            schedule(query, 1)
+            
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    query, page = pending.pop(task)
+                    try:
+                        data = task.result()
+                    except Exception as e:
+                        # A single page is not worth failing the whole fan-out
+                        self.logger.error(f"Failed to fetch page {page} of {query.get('q')}: {str(e)}")
+                        if errors is not None:
+                            errors.append(e)
+                        continue
+                        
+                    if page == 1:
+                        total_pages = math.ceil(data.get("totalResults", 0) / self.max_articles)
+                        if total_pages > max_pages and truncated is not None:
+                            truncated.append(query)
+                        for next_page in range(2, min(max_pages, total_pages) + 1):
+                            schedule(query, next_page)
+                            
+                    yield data.get("articles", [])
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _fetch_page(
+        self,
+        query: Dict[str, Any],
+        page: int,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """
+        Fetch a single result page.
+        
+        Args:
+            query: Search parameters for the shard
+            page: Page number (1-based)
+            semaphore: Semaphore bounding concurrent requests
+            
+        Returns:
+            Decoded JSON response
+        """
+        headers = {"X-Api-Key": self.api_key}
+        search_params = {**query, "page": page} if page > 1 else query
+        
+        async with semaphore:
+            return await self.fetch_json(
+                f"{self.base_url}/everything",
+                params=search_params,
+                headers=headers
+            )
+
+    def _transform(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Transform a raw NewsAPI article to the standard format.
+        
+        Args:
+            article: Raw article from the API
+            
+        Returns:
+            Article in the standard collector format
+        """
+        return {
+            "id": self.content_id("newsapi", article["url"], article["content"]),
+            "source": article["source"]["name"],
+            "title": article["title"],
+            "content": article["content"],
+            "url": article["url"],
+            "published_at": article["publishedAt"],
+            "collected_at": datetime.utcnow().isoformat(),
+            "metadata": {
+                "author": article.get("author"),
+                "description": article.get("description"),
+                "url_to_image": article.get("urlToImage")
+            }
+        }
+
     async def validate(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Validate collected articles.
         
+        Batches of at least ``vectorize_threshold`` articles are checked
+        with ``validation_mask``; smaller ones item by item.
+        
         Args:
             data: List of collected articles
             
         Returns:
             List of validated articles
         """
-        validated_articles = []
+        if len(data) >= self.vectorize_threshold:
+            mask = self.validation_mask(data)
+            return [article for article, valid in zip(data, mask) if valid]
+            
+        return [article for article in data if self._is_valid(article)]
+
+    def validation_mask(self, data: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Validate a batch of articles in columnar form.
         
-        for article in data:
-            # Basic validation
-            if not all(k in article for k in ["title", "content", "url", "published_at"]):
-                continue
-                
-            # Content length validation
-            if not article["content"] or len(article["content"]) < 100:
-                continue
+        Key presence, content length and timestamp format are checked on
+        whole columns. Rows the vectorized checks cannot accept outright
+        (non-string fields, unusual timestamp formats) fall back to the
+        per-item rules, so the result always matches ``_is_valid``.
+        
+        Args:
+            data: List of collected articles
+            
+        Returns:
+            Boolean mask, True for valid articles
+        """
+        if not data:
+            return np.zeros(0, dtype=bool)
+            
+        frame = pd.DataFrame.from_records(data, columns=REQUIRED_FIELDS)
+        
+        # Missing keys come through as NaN and are left to the fallback
+        regular = np.ones(len(frame), dtype=bool)
+        for field in REQUIRED_FIELDS:
+            column = frame[field]
+            if pd.api.types.infer_dtype(column, skipna=False) != "string":
+                regular &= (column.map(type) == str).to_numpy()
                 
-            # Date validation
-            try:
-                datetime.fromisoformat(article["published_at"].replace("Z", "+00:00"))
-            except ValueError:
+        content = frame["content"] if regular.all() else frame["content"].where(regular, "")
+        long_enough = (content.str.len() >= MIN_CONTENT_LENGTH).to_numpy()
+        
+        published_at = frame["published_at"].to_numpy(dtype=object)
+        published_at[~regular] = ""
+        canonical = self._canonical_timestamps(published_at)
+        
+        mask = regular & long_enough & canonical
+        for i in np.flatnonzero(~regular | (long_enough & ~canonical)):
+            mask[i] = self._is_valid(data[i])
+        return mask
+
+    @staticmethod
+    def _canonical_timestamps(values: np.ndarray) -> np.ndarray:
+        """
+        Check timestamps against the canonical ISO 8601 shapes.
+        
+        Strings are laid out as a fixed-width code point matrix so that
+        character classes and field ranges are checked column-wise.
+        
+        Args:
+            values: Array of timestamp strings
+            
+        Returns:
+            Boolean mask, True for valid canonical timestamps
+        """
+        # One spare column so that longer strings keep a distinct length
+        width = max(CANONICAL_TIMESTAMP_SHAPES) + 1
+        values = np.asarray(values, dtype=f"<U{width}")
+        lengths = np.char.str_len(values)
+        codes = values.view(np.uint32).reshape(len(values), width)
+        digits = codes - np.uint32(ord("0"))
+        is_digit = digits <= 9  # unsigned, so code points below "0" wrap around
+
+        def number(digits: np.ndarray, pos: int, count: int = 2) -> np.ndarray:
+            value = np.zeros(len(digits), dtype=np.int64)
+            for i in range(pos, pos + count):
+                value = value * 10 + digits[:, i]
+            return value
+            
+        # YYYY-MM-DDTHH:MM:SS
+        valid = is_digit[:, [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]].all(axis=1)
+        valid &= (codes[:, 4] == ord("-")) & (codes[:, 7] == ord("-")) & (codes[:, 10] == ord("T"))
+        valid &= (codes[:, 13] == ord(":")) & (codes[:, 16] == ord(":"))
+        
+        year, month, day = number(digits, 0, 4), number(digits, 5), number(digits, 8)
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        days = DAYS_IN_MONTH[np.clip(month - 1, 0, 11)] + ((month == 2) & leap)
+        valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= days)
+        valid &= (number(digits, 11) <= 23) & (number(digits, 14) <= 59) & (number(digits, 17) <= 59)
+        
+        # Fraction and offset, identified by length
+        tail = np.zeros(len(values), dtype=bool)
+        for length, (fraction, offset) in CANONICAL_TIMESTAMP_SHAPES.items():
+            ok = lengths == length
+            if not ok.any():
                 continue
                 
-            validated_articles.append(article)
+            pos = 19
+            if fraction:
+                ok &= (codes[:, pos] == ord(".")) & is_digit[:, pos + 1:pos + 1 + fraction].all(axis=1)
+                pos += fraction + 1
+            if offset == 1:
+                ok &= codes[:, pos] == ord("Z")
+            elif offset:
+                ok &= (codes[:, pos] == ord("+")) | (codes[:, pos] == ord("-"))
+                ok &= is_digit[:, [pos + 1, pos + 2, pos + 4, pos + 5]].all(axis=1)
+                ok &= codes[:, pos + 3] == ord(":")
+                ok &= (number(digits, pos + 1) <= 23) & (number(digits, pos + 4) <= 59)
+            tail |= ok
+            
+        return valid & tail
+
+    def _is_valid(self, article: Dict[str, Any]) -> bool:
+        """
+        Validate a single article.
+        
+        Args:
+            article: Collected article
+            
+        Returns:
+            True if the article passes validation
+        """
+        # Basic validation
+        if not all(k in article for k in REQUIRED_FIELDS):
+            return False
+            
+        # Content length validation
+        if not article["content"] or len(article["content"]) < MIN_CONTENT_LENGTH:
+            return False
+            
+        # Date validation
+        try:
+            datetime.fromisoformat(article["published_at"].replace("Z", "+00:00"))
+        except ValueError:
+            return False
             
-        return validated_articles 
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -0,0 +1,55 @@
+from typing import Any, Dict, Optional
+import json
+import os
+from pathlib import Path
+
+class CursorStore:
+    """
+    Persistent per-source cursors for incremental collection.
+    Cursors are kept in a small JSON state file, or only in memory when
+    no path is configured.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cursor store.
+        
+        Args:
+            path: Optional path of the JSON state file
+        """
+        self.path = Path(path) if path else None
+        self.cursors: Dict[str, Any] = {}
+        
+        if self.path and self.path.exists():
+            with open(self.path) as f:
+                self.cursors = json.load(f)
+
+    def get(self, source: str) -> Optional[Any]:
+        """
+        Get the cursor of a source.
+        
+        Args:
+            source: Source key
+            
+        Returns:
+            Last stored cursor, or None
+        """
+        return self.cursors.get(source)
+
+    def set(self, source: str, cursor: Any):
+        """
+        Store the cursor of a source and persist the state file.
+        
+        Args:
+            source: Source key
+            cursor: JSON-serializable cursor value
+        """
+        self.cursors[source] = cursor
+        
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self.cursors, f)
+            # Atomic so a crash never leaves a truncated state file
+            os.replace(tmp_path, self.path)
\ No newline at end of file
@@ -0,0 +1,133 @@
+from typing import Callable, Dict, Optional, Tuple
+import asyncio
+import random
+import time
+
+class TokenBucket:
+    """
+    Asynchronous token bucket rate limiter.
+    The refill rate backs off multiplicatively when the source signals
+    rate limiting and recovers additively on success.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate: Sustained requests per second
+            capacity: Maximum burst size (default: one second of requests)
+            min_rate: Lowest rate reached by backing off (default: rate / 16)
+            timer: Clock used for refills
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate or rate / 16
+        self.capacity = capacity or max(rate, 1.0)
+        self.timer = timer
+        self.tokens = self.capacity
+        self.updated_at = timer()
+        self.paused_until = 0.0
+
+    def _refill(self):
+        """Add the tokens accrued since the last update."""
+        now = self.timer()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """
+        Wait until tokens are available and take them.
+        
+        Tokens are reserved without awaiting, so concurrent callers queue
+        up by the debt they leave behind and no lock is needed; buckets
+        are shared process-wide and may be used from several event loops.
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        while True:
+            self._refill()
+            now = self.timer()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+                
+            self.tokens -= tokens
+            if self.tokens >= 0:
+                return
+            try:
+                await asyncio.sleep(-self.tokens / self.rate)
+            except asyncio.CancelledError:
+                # Give the reservation back to the callers behind this one
+                self.tokens += tokens
+                raise
+            # A pause that began while waiting applies to this request too
+            if self.timer() >= self.paused_until:
+                return
+            self.tokens += tokens
+
+    def pause(self, seconds: float):
+        """
+        Stop handing out tokens for a while, e.g. to honour Retry-After.
+        
+        Args:
+            seconds: Pause duration in seconds
+        """
+        self.paused_until = max(self.paused_until, self.timer() + seconds)
+
+    def throttle(self):
+        """Halve the refill rate after the source signalled rate limiting."""
+        self._refill()
+        self.rate = max(self.min_rate, self.rate / 2)
+
+    def recover(self):
+        """Step the refill rate back towards its configured maximum."""
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 16)
+
+_buckets: Dict[Tuple[str, str], TokenBucket] = {}
+
+def get_rate_limiter(source: str, api_key: str, rate: float, capacity: Optional[float] = None) -> TokenBucket:
+    """
+    Get the process-wide token bucket for a source and API key.
+    
+    Collectors sharing a source and key share one budget, so several
+    instances cannot overrun the upstream quota together.
+    
+    Args:
+        source: Source name
+        api_key: API key the quota belongs to
+        rate: Sustained requests per second
+        capacity: Maximum burst size
+        
+    Returns:
+        Shared token bucket
+    """
+    key = (source, api_key)
+    if key not in _buckets:
+        _buckets[key] = TokenBucket(rate, capacity)
+    return _buckets[key]
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """
+    Get a jittered exponential backoff delay.
+    
+    Uses "full jitter" so that clients retrying together spread out.
+    
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay of the first retry in seconds
+        cap: Maximum delay in seconds
+        
+    Returns:
+        Delay in seconds
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
\ No newline at end of file
@@ -1,20 +1,36 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
+import asyncio
+
+from .offload import get_process_pool, pack_batch, process_packed, unpack_batch
 
 class BaseProcessor(ABC):
     """
     Abstract base class for all data processors.
     Defines the interface for data processing pipeline components.
+    
+    Processors doing CPU-heavy work in ``process`` should set ``cpu_bound``
+    so that ``run`` executes them in a process pool instead of blocking the
+    event loop. Such processors must be picklable.
     """
+    
+    cpu_bound = False
 
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the processor with configuration.
         
         Args:
-            config: Dictionary containing processor configuration
+            config: Dictionary containing processor configuration. Pipeline
+                settings are usually taken from ``data.processors``:
+                - batch_size: Items per processed batch (default: 50)
+                - max_workers: Batches processed concurrently (default: 4)
+                - timeout: Seconds allowed per batch (default: 30)
         """
         self.config = config
+        self.batch_size = config.get("batch_size", 50)
+        self.max_workers = config.get("max_workers", 4)
+        self.timeout = config.get("timeout", 30)
 
     @abstractmethod
     async def process(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -29,6 +45,31 @@ class BaseProcessor(ABC):
         """
         pass
 
+    async def run(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process the input data, offloading CPU-bound processors.
+        
+        CPU-bound processors run in a process pool of ``max_workers``
+        processes, with batches passed in packed columnar form.
+        
+        Args:
+            data: List of data items to process
+            
+        Returns:
+            List of processed data items
+        """
+        if not self.cpu_bound:
+            return await self.process(data)
+            
+        loop = asyncio.get_running_loop()
+        payload = await loop.run_in_executor(
+            get_process_pool(self.max_workers),
+            process_packed,
+            self,
+            pack_batch(data)
+        )
+        return unpack_batch(payload)
+
     @abstractmethod
     async def validate_output(self, data: List[Dict[str, Any]]) -> bool:
         """
@@ -50,4 +91,4 @@ class BaseProcessor(ABC):
         Returns:
             Dictionary containing processor metadata
         """
-        pass 
\ No newline at end of file
+        pass
\ No newline at end of file
@@ -0,0 +1,83 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+import asyncio
+import pickle
+
+class _Missing:
+    """Placeholder for keys absent from an item in a packed batch."""
+
+    def __reduce__(self):
+        # Pickled by reference, so identity survives the round trip
+        return "MISSING"
+
+MISSING = _Missing()
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+
+def get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Get the shared process pool of a given size.
+    
+    Args:
+        max_workers: Number of worker processes
+        
+    Returns:
+        Process pool shared by all processors of that size
+    """
+    if max_workers not in _pools:
+        _pools[max_workers] = ProcessPoolExecutor(max_workers=max_workers)
+    return _pools[max_workers]
+
+def shutdown_process_pools():
+    """Shut down all shared process pools."""
+    for pool in _pools.values():
+        pool.shutdown()
+    _pools.clear()
+
+def pack_batch(data: List[Dict[str, Any]]) -> bytes:
+    """
+    Serialize a batch in columnar form.
+    
+    Field names are stored once per batch rather than once per item.
+    
+    Args:
+        data: List of data items
+        
+    Returns:
+        Serialized batch
+    """
+    keys = list(dict.fromkeys(key for item in data for key in item))
+    columns = [[item.get(key, MISSING) for item in data] for key in keys]
+    return pickle.dumps((len(data), keys, columns), protocol=pickle.HIGHEST_PROTOCOL)
+
+def unpack_batch(payload: bytes) -> List[Dict[str, Any]]:
+    """
+    Deserialize a batch packed by ``pack_batch``.
+    
+    Args:
+        payload: Serialized batch
+        
+    Returns:
+        List of data items
+    """
+    size, keys, columns = pickle.loads(payload)
+    items = [{} for _ in range(size)]
+    for key, column in zip(keys, columns):
+        for item, value in zip(items, column):
+            if value is not MISSING:
+                item[key] = value
+    return items
+
+def process_packed(processor: Any, payload: bytes) -> bytes:
+    """
+    Run a processor on a packed batch inside a worker process.
+    
+    Args:
+        processor: Processor to run
+        payload: Batch packed by ``pack_batch``
+        
+    Returns:
+        Packed processing result
+    """
+    result = asyncio.run(processor.process(unpack_batch(payload)))
+    return pack_batch(result)
\ No newline at end of file
@@ -0,0 +1,228 @@
+from typing import Any, AsyncIterator, Dict, List, Optional
+import asyncio
+import logging
+
+from ..collectors.base import BaseCollector
+from .base import BaseProcessor
+
+# Marks the end of a stream on a queue
+_DONE = object()
+
+class Pipeline:
+    """
+    Streaming pipeline from a collector through a chain of processors.
+    Stages are connected by bounded queues, so they run concurrently and a
+    slow stage applies backpressure to everything upstream of it.
+    """
+
+    def __init__(
+        self,
+        collector: BaseCollector,
+        processors: List[BaseProcessor],
+        config: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the pipeline.
+        
+        Each stage is micro-batched to its processor's ``batch_size`` and runs
+        up to ``max_workers`` batches concurrently, each bounded by
+        ``timeout``.
+        
+        Args:
+            collector: Collector providing the input stream
+            processors: Processors applied in order
+            config: Optional pipeline configuration:
+                - queue_size: Batches buffered between stages (default: 8)
+                - linger: Seconds a partial batch waits for more items
+                  before being processed (default: 0.1)
+        """
+        config = config or {}
+        self.collector = collector
+        self.processors = processors
+        self.queue_size = config.get("queue_size", 8)
+        self.linger = config.get("linger", 0.1)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.stats = [
+            {"processor": processor.__class__.__name__, "batches": 0, "items": 0, "failed": 0, "timeouts": 0}
+            for processor in processors
+        ]
+
+    async def run(self, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Run the pipeline over one collection.
+        
+        Args:
+            params: Optional parameters passed to the collector
+            
+        Yields:
+            Batches of items that passed every stage
+        """
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(len(self.processors) + 1)]
+        tasks = [asyncio.ensure_future(self._source(params, queues[0]))]
+        for i, processor in enumerate(self.processors):
+            tasks.append(asyncio.ensure_future(
+                self._stage(processor, self.stats[i], queues[i], queues[i + 1])
+            ))
+            
+        try:
+            while True:
+                batch = await queues[-1].get()
+                if batch is _DONE:
+                    break
+                yield batch
+                
+            # Surface errors of the source
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _source(self, params: Optional[Dict[str, Any]], outbox: asyncio.Queue):
+        """
+        Feed validated batches from the collector into the first stage.
+        
+        Args:
+            params: Optional parameters passed to the collector
+            outbox: Queue of the first stage
+        """
+        cancelled = False
+        try:
+            async for batch in self.collector.stream(params):
+                batch = await self.collector.validate(batch)
+                if batch:
+                    await outbox.put(batch)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if not cancelled:
+                await outbox.put(_DONE)
+
+    async def _stage(
+        self,
+        processor: BaseProcessor,
+        stats: Dict[str, Any],
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue
+    ):
+        """
+        Run one processor over its input queue.
+        
+        Args:
+            processor: Processor of the stage
+            stats: Counters of the stage
+            inbox: Queue of incoming item lists
+            outbox: Queue of the next stage
+        """
+        work = asyncio.Queue(maxsize=processor.max_workers)
+        workers = [
+            asyncio.ensure_future(self._worker(processor, stats, work, outbox))
+            for _ in range(processor.max_workers)
+        ]
+        
+        cancelled = False
+        try:
+            await self._batch(processor.batch_size, inbox, work)
+            for _ in workers:
+                await work.put(_DONE)
+            await asyncio.gather(*workers)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # Downstream stages still drain and finish after an upstream error
+            if not cancelled:
+                await outbox.put(_DONE)
+
+    async def _batch(self, batch_size: int, inbox: asyncio.Queue, work: asyncio.Queue):
+        """
+        Regroup incoming item lists into batches of ``batch_size``.
+        
+        A partial batch is flushed when no more items arrive within
+        ``linger`` seconds, so a slow source does not stall the stage.
+        
+        Args:
+            batch_size: Items per batch
+            inbox: Queue of incoming item lists
+            work: Queue of batches for the workers
+        """
+        buffer = []
+        # One long-lived get: cancelling a get wrapped by wait_for may
+        # drop an item arriving as the timeout fires on Python < 3.12
+        getter: Optional[asyncio.Future] = None
+        try:
+            while True:
+                if getter is None and not inbox.empty():
+                    items = inbox.get_nowait()
+                else:
+                    if getter is None:
+                        getter = asyncio.ensure_future(inbox.get())
+                    if buffer:
+                        done, _ = await asyncio.wait({getter}, timeout=self.linger)
+                        if not done:
+                            await work.put(buffer)
+                            buffer = []
+                            continue
+                    items = await getter
+                    getter = None
+                    
+                if items is _DONE:
+                    break
+                    
+                buffer.extend(items)
+                while len(buffer) >= batch_size:
+                    await work.put(buffer[:batch_size])
+                    buffer = buffer[batch_size:]
+        finally:
+            if getter is not None:
+                getter.cancel()
+                await asyncio.gather(getter, return_exceptions=True)
+                
+        if buffer:
+            await work.put(buffer)
+
+    async def _worker(
+        self,
+        processor: BaseProcessor,
+        stats: Dict[str, Any],
+        work: asyncio.Queue,
+        outbox: asyncio.Queue
+    ):
+        """
+        Process batches until the end of the stream.
+        
+        Failed, timed out and invalid batches are logged and dropped.
+        
+        Args:
+            processor: Processor of the stage
+            stats: Counters of the stage
+            work: Queue of batches to process
+            outbox: Queue of the next stage
+        """
+        name = processor.__class__.__name__
+        while True:
+            batch = await work.get()
+            if batch is _DONE:
+                return
+                
+            try:
+                result = await asyncio.wait_for(processor.run(batch), processor.timeout)
+                if not await processor.validate_output(result):
+                    raise ValueError("output validation failed")
+            except asyncio.TimeoutError:
+                stats["timeouts"] += 1
+                self.logger.error(f"{name} timed out on a batch of {len(batch)} items")
+                continue
+            except Exception as e:
+                stats["failed"] += 1
+                self.logger.error(f"{name} failed on a batch of {len(batch)} items: {str(e)}")
+                continue
+                
+            stats["batches"] += 1
+            stats["items"] += len(batch)
+            if result:
+                await outbox.put(result)
\ No newline at end of file
@@ -0,0 +1,428 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Union
+import logging
+
+import numpy as np
+
+from ..utils.cache import LRUCache
+
+# Scale the median and mean absolute deviation to a standard deviation
+MAD_SCALE = 1.4826
+MEAN_AD_SCALE = 1.2533
+
+METHODS = ("zscore", "ewma", "mad")
+
+# Spreads below this fraction of the baseline are rounding noise
+RELATIVE_TOLERANCE = 1e-9
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def decay_scan(inputs: np.ndarray, decay: float, start: float, block: int = 64) -> np.ndarray:
+    """
+    Evaluate ``y[t] = decay * y[t - 1] + inputs[t]`` without a Python loop.
+    
+    The recurrence is solved in closed form over blocks short enough for
+    the powers of ``decay`` to stay well within floating point range.
+    
+    Args:
+        inputs: Input sequence
+        decay: Factor applied to the previous value, in [0, 1)
+        start: Value before the first input
+        
+    Returns:
+        Sequence of outputs
+    """
+    if decay == 0:
+        return inputs.astype(float)
+        
+    out = np.empty(len(inputs))
+    powers = decay ** np.arange(1, block + 1)
+    for begin in range(0, len(inputs), block):
+        chunk = inputs[begin:begin + block]
+        weights = powers[:len(chunk)]
+        out[begin:begin + len(chunk)] = weights * (start + np.cumsum(chunk / weights))
+        start = out[begin + len(chunk) - 1]
+    return out
+
+class RingBuffer:
+    """
+    Fixed-size buffer of the most recent values of a series.
+    Appends are O(1) per value and batches are written in one vectorized
+    step, without shifting stored values.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initialize an empty buffer.
+        
+        Args:
+            size: Number of values kept
+        """
+        self.values = np.empty(size)
+        self.head = 0
+        self.count = 0
+
+    def extend(self, values: np.ndarray):
+        """
+        Append values, evicting the oldest ones.
+        
+        Args:
+            values: Values in arrival order
+        """
+        size = len(self.values)
+        if len(values) >= size:
+            self.values[:] = values[-size:]
+            self.head = 0
+        else:
+            self.values[(self.head + np.arange(len(values))) % size] = values
+            self.head = (self.head + len(values)) % size
+        self.count += len(values)
+
+    def window(self) -> np.ndarray:
+        """
+        Get the stored values.
+        
+        Returns:
+            Values from oldest to newest
+        """
+        if self.count < len(self.values):
+            return self.values[:self.count]
+        return np.concatenate((self.values[self.head:], self.values[:self.head]))
+
+class SeriesState:
+    """Window and exponentially weighted moments of one series."""
+
+    def __init__(self, window: int):
+        """
+        Initialize the state.
+        
+        Args:
+            window: Number of recent values kept
+        """
+        self.buffer = RingBuffer(window)
+        self.ewma_mean: Optional[float] = None
+        self.ewma_var = 0.0
+
+class StreamingAnomalyDetector:
+    """
+    Online anomaly detector for numeric series.
+    Each series keeps a ring buffer of recent values and exponentially
+    weighted moments, updated in O(1) per point. Batches of new points are
+    scored in vectorized passes by three methods: rolling z-score over the
+    window, EWMA z-score, and a robust score from the median and MAD. A
+    point's score is that of the method deviating most.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        escalate: Optional[Callable[[List[Dict[str, Any]], Dict[str, Any]], Awaitable[Dict[str, Any]]]] = None
+    ):
+        """
+        Initialize the detector.
+        
+        Args:
+            config: Optional settings:
+                - window: Values per series for the rolling and robust
+                  scores (default: 100)
+                - min_samples: Values a series needs before its points are
+                  scored (default: 5)
+                - alpha: EWMA smoothing factor (default: 0.1)
+                - threshold: Score above which a point is an anomaly
+                  (default: 3.5)
+                - methods: Scores to use (default: zscore, ewma and mad)
+                - escalation_threshold: Score above which candidates are
+                  passed to ``escalate`` (default: none)
+                - max_series: Series kept; the least recently updated are
+                  dropped beyond this and start over (default: 10000)
+            escalate: Optional coroutine function, e.g. a remote
+                ``detect_anomalies``, confirming candidate anomalies
+        """
+        config = config or {}
+        self.window = config.get("window", 100)
+        self.min_samples = config.get("min_samples", 5)
+        self.alpha = config.get("alpha", 0.1)
+        self.threshold = config.get("threshold", 3.5)
+        self.methods = list(config.get("methods", METHODS))
+        self.escalation_threshold = config.get("escalation_threshold")
+        self.escalate = escalate
+        self.series = LRUCache(maxsize=config.get("max_series", 10000))
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        if self.window < self.min_samples:
+            raise Exception("window must hold at least min_samples values")
+
+    def update(self, key: Hashable, values: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Score new points of a series and add them to its state.
+        
+        Every point is scored against the points before it; points
+        arriving before the series has ``min_samples`` values score zero.
+        
+        Args:
+            key: Series identifier
+            values: New values in arrival order
+            
+        Returns:
+            Scores by method, one per value
+        """
+        values = np.asarray(values, dtype=float)
+        if not len(values):
+            return {method: np.zeros(0) for method in self.methods}
+            
+        state = self.series.get(key)
+        if state is None:
+            state = SeriesState(self.window)
+            self.series.set(key, state)
+            
+        history = state.buffer.window()
+        seen = state.buffer.count
+        # First point with enough values before it
+        warm = min(max(self.min_samples - seen, 0), len(values))
+        scores = {}
+        
+        if "zscore" in self.methods:
+            scores["zscore"] = self._rolling_scores(history, values, warm)
+        if "ewma" in self.methods:
+            scores["ewma"] = self._ewma_scores(state, history, values, warm)
+        if "mad" in self.methods:
+            scores["mad"] = self._robust_scores(history, values, warm)
+            
+        state.buffer.extend(values)
+        return scores
+
+    def _rolling_scores(self, history: np.ndarray, values: np.ndarray, warm: int) -> np.ndarray:
+        """
+        Score points against the mean and deviation of the preceding window.
+        
+        Args:
+            history: Stored values of the series
+            values: New values
+            warm: Index of the first scored value
+            
+        Returns:
+            Rolling z-scores
+        """
+        combined = np.concatenate((history, values))
+        # Shifting by a sample keeps the running sums small
+        shifted = combined - combined[0]
+        sums = np.concatenate(([0.0], np.cumsum(shifted)))
+        squares = np.concatenate(([0.0], np.cumsum(shifted ** 2)))
+        
+        ends = np.arange(len(history), len(combined))
+        starts = np.maximum(ends - self.window, 0)
+        counts = np.maximum(ends - starts, 1)
+        means = (sums[ends] - sums[starts]) / counts
+        variances = np.maximum((squares[ends] - squares[starts]) / counts - means ** 2, 0.0)
+        
+        scores = self._divide(shifted[len(history):] - means, np.sqrt(variances), means + combined[0])
+        scores[:warm] = 0.0
+        return scores
+
+    def _ewma_scores(self, state: SeriesState, history: np.ndarray, values: np.ndarray, warm: int) -> np.ndarray:
+        """
+        Score points against the exponentially weighted moments before them.
+        
+        The moments start from the first ``min_samples`` values and are
+        then updated with every point.
+        
+        Args:
+            state: Series state, updated in place
+            history: Stored values of the series
+            values: New values
+            warm: Index of the first scored value
+            
+        Returns:
+            EWMA z-scores
+        """
+        scores = np.zeros(len(values))
+        if state.ewma_mean is None:
+            if len(history) + warm < self.min_samples:
+                return scores
+            initial = np.concatenate((history, values[:warm]))
+            state.ewma_mean = float(initial.mean())
+            state.ewma_var = float(initial.var())
+            
+        tail = values[warm:]
+        if not len(tail):
+            return scores
+            
+        decay = 1 - self.alpha
+        means = decay_scan(self.alpha * tail, decay, state.ewma_mean)
+        previous_means = np.concatenate(([state.ewma_mean], means[:-1]))
+        deviations = tail - previous_means
+        variances = decay_scan(self.alpha * decay * deviations ** 2, decay, state.ewma_var)
+        previous_variances = np.concatenate(([state.ewma_var], variances[:-1]))
+        
+        scores[warm:] = self._divide(deviations, np.sqrt(previous_variances), previous_means)
+        state.ewma_mean = float(means[-1])
+        state.ewma_var = float(variances[-1])
+        return scores
+
+    def _robust_scores(self, history: np.ndarray, values: np.ndarray, warm: int) -> np.ndarray:
+        """
+        Score points against the median and MAD of the window.
+        
+        The window includes the new points; the median and MAD are barely
+        moved by the outliers among them.
+        
+        Args:
+            history: Stored values of the series
+            values: New values
+            warm: Index of the first scored value
+            
+        Returns:
+            Robust z-scores
+        """
+        window = np.concatenate((history, values))[-self.window:]
+        median = np.median(window)
+        spread = np.median(np.abs(window - median)) * MAD_SCALE
+        if not spread:
+            # More than half the values are equal; use the mean deviation
+            spread = np.mean(np.abs(window - median)) * MEAN_AD_SCALE
+            
+        scores = self._divide(values - median, np.full(len(values), spread), np.full(len(values), median))
+        scores[:warm] = 0.0
+        return scores
+
+    @staticmethod
+    def _divide(deviations: np.ndarray, spreads: np.ndarray, baselines: np.ndarray) -> np.ndarray:
+        """
+        Divide deviations by spreads, scoring zero where the spread is zero.
+        
+        Args:
+            deviations: Deviations from the baseline
+            spreads: Standard deviations
+            baselines: Expected values, scaling the zero tolerance
+            
+        Returns:
+            Scores
+        """
+        scores = np.zeros(len(deviations))
+        valid = spreads > RELATIVE_TOLERANCE * (np.abs(baselines) + 1)
+        np.divide(deviations, spreads, out=scores, where=valid)
+        return scores
+
+    async def detect_anomalies(
+        self,
+        data: Union[List[Dict[str, Any]], Dict[str, Any]],
+        detection_config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Detect anomalies in new data of the tracked series.
+        
+        Takes the same arguments as ``DeepSeekBase.detect_anomalies``. Every
+        numeric field is a series, continued across calls.
+        
+        Args:
+            data: New records, a single record, or a mapping of field names
+                to value series
+            detection_config: Optional settings:
+                - fields: Fields to check (default: all numeric fields)
+                - group_by: Record field splitting records into separate
+                  series, e.g. a market symbol
+                - stream: Name separating independent callers
+                - threshold, methods: Override the detector settings
+                
+        Returns:
+            Anomalies with their record index, field, value and scores, and
+            the escalation result if candidates were escalated
+        """
+        detection_config = detection_config or {}
+        threshold = detection_config.get("threshold", self.threshold)
+        stream = detection_config.get("stream")
+        group_by = detection_config.get("group_by")
+        
+        if isinstance(data, dict):
+            columns = {key: value for key, value in data.items() if isinstance(value, (list, tuple, np.ndarray))}
+            if not columns:
+                # No value series, so a single record
+                data = [data]
+            elif any(_is_number(value) for value in data.values()):
+                raise Exception("data mixes value series with single values")
+                
+        if isinstance(data, dict):
+            size = max((len(value) for value in columns.values()), default=0)
+            groups = {None: np.arange(size)}
+        else:
+            keys = dict.fromkeys(key for record in data for key in record)
+            columns = {key: [record.get(key) for record in data] for key in keys}
+            size = len(data)
+            indices: Dict[Any, List[int]] = {}
+            for i, record in enumerate(data):
+                indices.setdefault(record.get(group_by) if group_by else None, []).append(i)
+            groups = {group: np.array(positions) for group, positions in indices.items()}
+            
+        fields = detection_config.get("fields") or [
+            key for key, values in columns.items()
+            if key != group_by and any(_is_number(v) for v in values)
+        ]
+        methods = detection_config.get("methods", self.methods)
+        
+        anomalies = []
+        for field in fields:
+            column = np.array([v if _is_number(v) else np.nan for v in columns.get(field, [])], dtype=float)
+            for group, positions in groups.items():
+                positions = positions[positions < len(column)]
+                # Missing values neither update nor get scored
+                positions = positions[np.isfinite(column[positions])]
+                if not len(positions):
+                    continue
+                    
+                scores = self.update((stream, group, field), column[positions])
+                selected = [method for method in methods if method in scores] or list(scores)
+                stacked = np.vstack([scores[method] for method in selected])
+                best = np.abs(stacked).argmax(axis=0)
+                combined = stacked[best, np.arange(stacked.shape[1])]
+                
+                for i in np.flatnonzero(np.abs(combined) > threshold):
+                    anomalies.append({
+                        "index": int(positions[i]),
+                        "field": field,
+                        "group": group,
+                        "value": float(column[positions[i]]),
+                        "score": float(combined[i]),
+                        "scores": {method: float(scores[method][i]) for method in scores},
+                    })
+                    
+        anomalies.sort(key=lambda anomaly: -abs(anomaly["score"]))
+        result = {
+            "anomalies": anomalies,
+            "count": len(anomalies),
+            "checked": size,
+            "threshold": threshold,
+        }
+        
+        if self.escalate is not None and self.escalation_threshold is not None:
+            candidates = [a for a in anomalies if abs(a["score"]) > self.escalation_threshold]
+            if candidates:
+                result["escalation"] = await self._escalate(data, candidates, detection_config)
+        return result
+
+    async def _escalate(
+        self,
+        data: Union[List[Dict[str, Any]], Dict[str, Any]],
+        candidates: List[Dict[str, Any]],
+        detection_config: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Pass candidate anomalies on for confirmation.
+        
+        Args:
+            data: Data the candidates were found in
+            candidates: Candidate anomalies
+            detection_config: Detection settings of the call
+            
+        Returns:
+            Escalation result, or None if escalation failed
+        """
+        if isinstance(data, dict):
+            records = [{"field": a["field"], "index": a["index"], "value": a["value"]} for a in candidates]
+        else:
+            records = [data[i] for i in dict.fromkeys(a["index"] for a in candidates)]
+            
+        try:
+            return await self.escalate(records, detection_config)
+        except Exception as e:
+            self.logger.error(f"Error escalating {len(records)} candidates: {str(e)}")
+            return None
\ No newline at end of file
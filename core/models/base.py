@@ -1,6 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
-import torch
+from typing import Any, Dict, List, Optional, Tuple, Union
+import asyncio
+import json
+
+from ..utils.lazy import lazy_import
+from .checkpoint import is_checkpoint, is_plain, load_torch_tensors, save_tensors
+
+# Imported on first use so that importing the models package stays cheap
+torch = lazy_import("torch")
 
 class BaseModel(ABC):
     """
@@ -13,17 +20,214 @@ class BaseModel(ABC):
         Initialize the model with configuration.
         
         Args:
-            config: Dictionary containing model configuration
+            config: Dictionary containing model configuration, optionally
+                with a "device" overriding automatic device selection
         """
         self.config = config
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self._device = None
         self.model = None
+        self.optimization: Dict[str, Any] = {}
+
+    @property
+    def device(self) -> "torch.device":
+        """
+        Device the model runs on.
+        
+        Resolved on first access, normally from ``load``, so constructing a
+        model does not import torch or probe for CUDA.
+        
+        Returns:
+            Torch device
+        """
+        if self._device is None:
+            self._device = self.resolve_device()
+        return self._device
+
+    @device.setter
+    def device(self, device: Union[str, "torch.device"]):
+        self._device = torch.device(device)
+
+    def resolve_device(self) -> "torch.device":
+        """
+        Select the device from configuration or available hardware.
+        
+        Returns:
+            Configured device, else CUDA if available, else CPU
+        """
+        if self.config.get("device"):
+            return torch.device(self.config["device"])
+        return torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+    async def optimize(self, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Optimize the loaded model for inference.
+        
+        The model is put in evaluation mode with gradients disabled, then
+        optionally quantized and compiled. Checkpoints written with
+        ``save_optimized`` keep the optimized form.
+        
+        Args:
+            options: Optional settings overriding the "optimization" config:
+                - quantize: Dynamic int8 quantization of linear layers,
+                  applied on CPU only (default: True)
+                - compile: "torchscript" to trace or script the model, or
+                  "torch.compile" (default: none)
+                  
+        Returns:
+            Applied optimizations, also kept in ``self.optimization``
+        """
+        if self.model is None:
+            raise Exception("Model must be loaded before it is optimized")
+            
+        options = {**self.config.get("optimization", {}), **(options or {})}
+        loop = asyncio.get_running_loop()
+        self.model, self.optimization = await loop.run_in_executor(
+            None, self.apply_optimization, self.model, options
+        )
+        return self.optimization
+
+    def apply_optimization(self, model: "torch.nn.Module", options: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Optimize a model for inference.
+        
+        Args:
+            model: Model to optimize
+            options: Optimization settings as for ``optimize``
+            
+        Returns:
+            Optimized model and the optimizations applied
+        """
+        model = model.eval()
+        for parameter in model.parameters():
+            parameter.requires_grad_(False)
+            
+        applied = {"inference_mode": True, "quantization": None, "compile": None, "torch_version": torch.__version__}
+        if options.get("quantize", True) and self.device.type == "cpu":
+            quantization = torch.ao.quantization if hasattr(torch, "ao") else torch.quantization
+            model = quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            applied["quantization"] = "dynamic_int8"
+            
+        mode = options.get("compile")
+        if mode == "torchscript":
+            example = self.example_inputs()
+            if example is not None:
+                model = torch.jit.trace(model, example, strict=False)
+            else:
+                model = torch.jit.script(model)
+        elif mode == "torch.compile":
+            model = torch.compile(model)
+        elif mode:
+            raise Exception(f"Unknown compile mode: {mode}")
+        applied["compile"] = mode
+        return model, applied
+
+    def example_inputs(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Get example inputs for tracing the model.
+        
+        Returns:
+            Positional model inputs, or None to script the model instead
+        """
+        return None
+
+    def inference(self):
+        """
+        Get the context that model calls should run in.
+        
+        Returns:
+            Context manager disabling autograd tracking
+        """
+        return torch.inference_mode()
+
+    def save_optimized(self, path: str):
+        """
+        Save the optimized model.
+        
+        TorchScript models are saved whole. Other models are saved as a
+        state dict that ``load_optimized`` applies to a re-optimized model:
+        plain tensors in the memory-mappable flat format, quantized weights
+        with ``torch.save``. The applied optimizations are written next to
+        it as ``<path>.json``.
+        
+        Args:
+            path: File to save to
+        """
+        if self.optimization.get("compile") == "torchscript":
+            torch.jit.save(self.model, path)
+        else:
+            # torch.compile wraps the module it compiles
+            model = getattr(self.model, "_orig_mod", self.model)
+            state = model.state_dict()
+            if is_plain(state):
+                save_tensors(path, state)
+            else:
+                # Quantized layers hold packed parameter objects
+                torch.save(state, path)
+                
+        with open(f"{path}.json", "w") as f:
+            json.dump(self.optimization, f)
+
+    def load_optimized(self, path: str, model: Optional["torch.nn.Module"] = None) -> Any:
+        """
+        Load a model saved by ``save_optimized``.
+        
+        Args:
+            path: File to load from
+            model: Unoptimized model of the same architecture, needed unless
+                the model was saved as TorchScript
+                
+        Returns:
+            Optimized model; the applied optimizations are restored to
+            ``self.optimization``
+        """
+        with open(f"{path}.json") as f:
+            optimization = json.load(f)
+            
+        if optimization.get("compile") == "torchscript":
+            model = torch.jit.load(path, map_location=self.device)
+        else:
+            options = {"quantize": optimization.get("quantization") is not None}
+            model, _ = self.apply_optimization(model, options)
+            if is_checkpoint(path):
+                state, _ = load_torch_tensors(path)
+                self.assign_weights(model, state)
+            else:
+                model.load_state_dict(torch.load(path, map_location=self.device))
+            if optimization.get("compile") == "torch.compile":
+                model = torch.compile(model)
+                
+        self.optimization = optimization
+        return model
+
+    def assign_weights(self, model: "torch.nn.Module", state: Dict[str, "torch.Tensor"]):
+        """
+        Load a state dict into a model, keeping memory-mapped tensors.
+        
+        On CPU the tensors become the model's parameters instead of being
+        copied into them, so weights stay shared with the mapped file.
+        
+        Args:
+            model: Model to load into
+            state: State dict, e.g. from ``load_torch_tensors``
+        """
+        if self.device.type == "cpu":
+            try:
+                model.load_state_dict(state, assign=True)
+                return
+            except TypeError:
+                # torch < 2.1 has no assign
+                pass
+        model.load_state_dict(state)
 
     @abstractmethod
     async def load(self) -> bool:
         """
         Load the model and its weights.
         
+        Implementations should import heavy dependencies and move the model
+        to ``self.device`` here rather than in ``__init__``, and restore
+        optimized checkpoints with ``load_optimized``.
+        
         Returns:
             bool: True if loading successful, False otherwise
         """
@@ -70,10 +274,12 @@ class BaseModel(ABC):
         """
         Save model checkpoint.
         
+        Optimized models should be saved with ``save_optimized``.
+        
         Args:
             path: Path to save the checkpoint
             
         Returns:
             True if saving successful, False otherwise
         """
-        pass 
\ No newline at end of file
+        pass
\ No newline at end of file
@@ -0,0 +1,180 @@
+from typing import Any, Dict, Optional, Tuple
+import json
+import mmap
+import os
+import struct
+
+from ..utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+torch = lazy_import("torch")
+
+# Element types of the flat format, as in safetensors, by NumPy type
+DTYPES = {
+    "F64": "float64",
+    "F32": "float32",
+    "F16": "float16",
+    "BF16": "int16",  # no NumPy equivalent, viewed as bfloat16 by torch
+    "I64": "int64",
+    "I32": "int32",
+    "I16": "int16",
+    "I8": "int8",
+    "U8": "uint8",
+    "BOOL": "bool",
+}
+DTYPE_NAMES = {dtype: name for name, dtype in DTYPES.items() if name != "BF16"}
+
+def is_plain(state_dict: Dict[str, Any]) -> bool:
+    """
+    Check whether a state dict holds only dense tensors.
+    
+    Quantized modules store packed parameter objects, which the flat
+    format cannot represent.
+    
+    Args:
+        state_dict: Model state dict
+        
+    Returns:
+        True if every value is a dense, unquantized tensor
+    """
+    return all(
+        hasattr(value, "detach") and not value.is_quantized and not value.is_sparse
+        for value in state_dict.values()
+    )
+
+def _to_numpy(value: Any) -> Tuple[str, "np.ndarray"]:
+    """
+    Get the stored type name and data of a tensor.
+    
+    Args:
+        value: NumPy array or torch tensor
+        
+    Returns:
+        Type name and array sharing the tensor's memory where possible
+    """
+    if not isinstance(value, np.ndarray):
+        tensor = value.detach().cpu()
+        if tensor.dtype == torch.bfloat16:
+            return "BF16", tensor.view(torch.int16).numpy()
+        value = tensor.numpy()
+    if value.dtype.name not in DTYPE_NAMES:
+        raise Exception(f"Unsupported tensor type: {value.dtype}")
+    return DTYPE_NAMES[value.dtype.name], value
+
+def save_tensors(path: str, tensors: Dict[str, Any], metadata: Optional[Dict[str, str]] = None):
+    """
+    Save tensors in a flat, memory-mappable file.
+    
+    The layout follows safetensors: an 8-byte little-endian header length,
+    a JSON header giving each tensor's type, shape and byte range, then the
+    raw data. Tensors are ordered by element size so each one is aligned.
+    
+    Args:
+        path: File to write
+        tensors: Tensors or NumPy arrays by name
+        metadata: Optional string metadata stored in the header
+    """
+    arrays = {name: _to_numpy(value) for name, value in tensors.items()}
+    order = sorted(arrays, key=lambda name: -arrays[name][1].itemsize)
+    
+    header: Dict[str, Any] = {}
+    offset = 0
+    for name in order:
+        dtype, array = arrays[name]
+        header[name] = {"dtype": dtype, "shape": list(array.shape), "data_offsets": [offset, offset + array.nbytes]}
+        offset += array.nbytes
+    if metadata:
+        header["__metadata__"] = {key: str(value) for key, value in metadata.items()}
+        
+    encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    # Pad so the data starts 8-byte aligned
+    encoded += b" " * (-len(encoded) % 8)
+    
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(struct.pack("<Q", len(encoded)))
+        f.write(encoded)
+        for name in order:
+            f.write(np.ascontiguousarray(arrays[name][1]).data)
+    os.replace(tmp, path)
+
+def _map(path: str) -> Tuple[Dict[str, Any], Dict[str, "np.ndarray"]]:
+    """
+    Memory-map a flat-format file.
+    
+    Args:
+        path: File to map
+        
+    Returns:
+        Parsed header and arrays by name
+    """
+    with open(path, "rb") as f:
+        # Copy-on-write: arrays are writable but never change the file
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        
+    size = struct.unpack_from("<Q", data, 0)[0]
+    header = json.loads(data[8:8 + size])
+    start = 8 + size
+    
+    arrays = {}
+    for name, info in header.items():
+        if name == "__metadata__":
+            continue
+        begin, end = info["data_offsets"]
+        dtype = np.dtype(DTYPES[info["dtype"]])
+        arrays[name] = np.frombuffer(
+            data, dtype=dtype, count=(end - begin) // dtype.itemsize, offset=start + begin
+        ).reshape(info["shape"])
+    return header, arrays
+
+def load_tensors(path: str) -> Tuple[Dict[str, "np.ndarray"], Dict[str, str]]:
+    """
+    Memory-map tensors saved by ``save_tensors``.
+    
+    Arrays are views into a private mapping of the file, so loading copies
+    nothing, and processes loading the same file share its pages through
+    the page cache until they write to them. BF16 data is returned as int16.
+    
+    Args:
+        path: File to load
+        
+    Returns:
+        Arrays by name and the header metadata
+    """
+    header, arrays = _map(path)
+    return arrays, header.get("__metadata__", {})
+
+def load_torch_tensors(path: str) -> Tuple[Dict[str, "torch.Tensor"], Dict[str, str]]:
+    """
+    Memory-map tensors saved by ``save_tensors`` as torch tensors.
+    
+    Args:
+        path: File to load
+        
+    Returns:
+        CPU tensors sharing the mapped memory and the header metadata
+    """
+    header, arrays = _map(path)
+    tensors = {}
+    for name, array in arrays.items():
+        tensor = torch.from_numpy(array)
+        if header[name]["dtype"] == "BF16":
+            tensor = tensor.view(torch.bfloat16)
+        tensors[name] = tensor
+    return tensors, header.get("__metadata__", {})
+
+def is_checkpoint(path: str) -> bool:
+    """
+    Check whether a file is in the flat tensor format.
+    
+    Args:
+        path: File to check
+        
+    Returns:
+        True if the file starts with a flat-format header
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(9)
+    if len(prefix) < 9 or prefix[8:9] != b"{":
+        return False
+    return struct.unpack("<Q", prefix[:8])[0] < os.path.getsize(path)
\ No newline at end of file
@@ -1,29 +1,287 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from abc import ABC, abstractmethod
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+
+from ...utils.batching import RequestBatcher
+from .cache import ResultCache, make_key
+from .media import ImageSource, downsize_image, read_image
+from .prediction import PredictionCache
+
+# Analysis methods whose results are cached, by model kind
+CACHED_METHODS = {
+    "analyze_text": "text",
+    "analyze_image": "vision",
+    "multimodal_analysis": "multimodal",
+}
+DEFAULT_CACHE_SIZES = {"text": 1000, "vision": 100, "multimodal": 50}
+
+# Image parameter of each analysis method and the size limit it is fitted to
+IMAGE_ARGUMENTS = {"analyze_image": "image_data", "multimodal_analysis": "image"}
+IMAGE_SIZE_SETTINGS = {"vision": ("image_size", 512), "multimodal": ("max_image_size", 1024)}
+
+# Set while a batch of texts is being analyzed, so texts the backend
+# analyzes one by one are not queued behind the batch itself
+_in_text_batch = contextvars.ContextVar("_in_text_batch", default=False)
+
+def _cached(model: str, method: Callable, image_argument: Optional[str] = None) -> Callable:
+    """
+    Wrap an analysis method with the result cache of its model kind.
+    
+    An image argument is read without copying and hashed as is; it is
+    only downsized for the model when the result is not cached.
+    
+    Args:
+        model: Model kind
+        method: Analysis coroutine function
+        image_argument: Name of the image parameter, if any
+        
+    Returns:
+        Wrapped coroutine function
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        image = bound.arguments.get(image_argument) if image_argument else None
+        if image is not None:
+            image = await read_image(image, self.config.get("max_image_bytes"))
+            bound.arguments[image_argument] = image
+            
+        cache = self.caches.get(model)
+        if cache is not None:
+            key = make_key(self.cache_version, model, dict(list(bound.arguments.items())[1:]))
+            result, = await cache.get_many([key])
+            if result is not None:
+                return result
+                
+        if image is not None:
+            bound.arguments[image_argument] = await self.prepare_image(image, model)
+        result = await method(*bound.args, **bound.kwargs)
+        if cache is not None:
+            cache.set(key, result)
+        return result
+        
+    wrapper._cached = True
+    return wrapper
+
+def _cached_batch(method: Callable) -> Callable:
+    """
+    Wrap ``analyze_texts`` so only uncached texts reach the backend.
+    
+    Args:
+        method: Batch text analysis coroutine function
+        
+    Returns:
+        Wrapped coroutine function
+    """
+    @functools.wraps(method)
+    async def wrapper(self, texts: List[str]) -> List[Dict[str, Any]]:
+        cache = self.caches.get("text")
+        if cache is None:
+            return await method(self, texts)
+            
+        keys = [make_key(self.cache_version, "text", {"text": text}) for text in texts]
+        results = await cache.get_many(keys)
+        missing = [i for i, result in enumerate(results) if result is None]
+        
+        if missing:
+            fresh = await method(self, [texts[i] for i in missing])
+            for i, result in zip(missing, fresh):
+                cache.set(keys[i], result)
+                results[i] = result
+        return results
+        
+    wrapper._cached = True
+    return wrapper
+
+def _batched(method: Callable) -> Callable:
+    """
+    Route ``analyze_text`` through the text batcher.
+    
+    Backends without a batch endpoint of their own keep calling ``method``,
+    as batching them would only add latency.
+    
+    Args:
+        method: Single text analysis coroutine function
+        
+    Returns:
+        Wrapped coroutine function
+    """
+    @functools.wraps(method)
+    async def wrapper(self, text: str) -> Dict[str, Any]:
+        if type(self).analyze_texts is DeepSeekBase.analyze_texts or _in_text_batch.get():
+            return await method(self, text)
+        return await self.text_batcher.submit(text)
+        
+    wrapper._batched = True
+    return wrapper
 
 class DeepSeekBase(ABC):
     """
     Base interface for DeepSeek AI integration.
     Provides standardized access to DeepSeek's multimodal capabilities.
+    
+    Results of ``analyze_text``, ``analyze_texts``, ``analyze_image`` and
+    ``multimodal_analysis`` are cached per model kind, keyed by the model
+    version and a hash of the inputs. Images may be given as bytes-like
+    data, file paths or async byte streams; implementations receive a
+    bytes-like object already downsized for the model. Implementations get
+    this automatically when they define those methods.
+    
+    Concurrent ``analyze_text`` calls of implementations that override
+    ``analyze_texts`` are coalesced into batched ``analyze_texts`` calls of
+    up to ``text.batch_size`` texts.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        method = cls.__dict__.get("analyze_text")
+        if method is not None and not getattr(method, "_batched", False) and not getattr(method, "_cached", False):
+            cls.analyze_text = _batched(method)
+        for name, model in CACHED_METHODS.items():
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "_cached", False):
+                setattr(cls, name, _cached(model, method, IMAGE_ARGUMENTS.get(name)))
+        method = cls.__dict__.get("analyze_texts")
+        if method is not None and not getattr(method, "_cached", False):
+            cls.analyze_texts = _cached_batch(method)
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize DeepSeek interface.
         
         Args:
-            config: Configuration containing API keys and model settings
+            config: Configuration containing API keys and model settings.
+                Per-model settings are read from an optional "models"
+                mapping shaped like ``deepseek.models``:
+                - text.batch_size: Texts per batched request (default: 32)
+                - text.batch_delay_ms: Milliseconds a text waits for others
+                  to batch with (default: 5)
+                - <model>.cache_size: Results cached per model kind
+                  (default: 1000 text, 100 vision, 50 multimodal; 0 disables)
+                - <model>.cache_ttl: Seconds results stay cached
+                  (default: 3600)
+                - vision.image_size, multimodal.max_image_size: Longest
+                  image side in pixels sent to the model (default: 512, 1024)
+                Top-level settings:
+                - cache_path: SQLite file persisting cached results across
+                  restarts
+                - cache_max_rows: Most results kept in the SQLite file
+                  (default: 10000)
+                - max_image_bytes: Largest accepted image input
+                - image_workers: Images downsized concurrently (default: 2)
+                - prediction: Batched prediction settings, mirroring
+                  ``services.prediction``: min_confidence (default: 0.8),
+                  cache_ttl (default: 300), tolerance (relative input
+                  change treated as unchanged, default: 0) and cache_size
+                  (default: 10000)
         """
         self.config = config
         self.api_key = config.get("api_key")
         self.model_version = config.get("model_version", "latest")
         self.base_url = config.get("base_url", "https://api.deepseek.ai/v1")
+        self.text_batcher = RequestBatcher(
+            self._analyze_text_batch,
+            max_batch_size=self.model_setting("text", "batch_size", 32),
+            max_delay=self.model_setting("text", "batch_delay_ms", 5) / 1000
+        )
+        self.caches: Dict[str, ResultCache] = {}
+        for model, default_size in DEFAULT_CACHE_SIZES.items():
+            size = self.model_setting(model, "cache_size", default_size)
+            if size:
+                self.caches[model] = ResultCache(
+                    maxsize=size,
+                    ttl=self.model_setting(model, "cache_ttl", 3600),
+                    path=config.get("cache_path"),
+                    # The model kinds share the file and its row limit
+                    max_rows=config.get("cache_max_rows", 10000)
+                )
+        self.image_workers = config.get("image_workers", 2)
+        self._image_slots: Optional[asyncio.Semaphore] = None
+        
+        prediction = config.get("prediction", {})
+        self.min_confidence = prediction.get("min_confidence", 0.8)
+        self.prediction_cache = PredictionCache(
+            ttl=prediction.get("cache_ttl", 300),
+            tolerance=prediction.get("tolerance", 0.0),
+            maxsize=prediction.get("cache_size", 10000)
+        )
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def cache_version(self) -> str:
+        """
+        Identify the model producing results, as part of their cache keys.
+        
+        Returns:
+            Model version
+        """
+        return self.model_version
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get result cache statistics.
+        
+        Returns:
+            Hit/miss counters per model kind
+        """
+        return {model: cache.stats() for model, cache in self.caches.items()}
+
+    async def flush_caches(self):
+        """Write pending results to the persistent cache tier."""
+        await asyncio.gather(*(cache.flush() for cache in self.caches.values()))
+
+    async def prepare_image(self, data: memoryview, model: str) -> Union[memoryview, bytes]:
+        """
+        Downsize an image for a model in a worker thread.
+        
+        At most ``image_workers`` images are decoded at a time, which bounds
+        memory during bursts of large media.
+        
+        Args:
+            data: Raw image data
+            model: Model kind ("vision" or "multimodal")
+            
+        Returns:
+            Image data fitting the model's size limit
+        """
+        setting, default = IMAGE_SIZE_SETTINGS[model]
+        max_size = self.model_setting(model, setting, default)
+        if self._image_slots is None:
+            self._image_slots = asyncio.Semaphore(self.image_workers)
+            
+        async with self._image_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, downsize_image, data, max_size)
+
+    def model_setting(self, model: str, key: str, default: Any = None) -> Any:
+        """
+        Get a per-model setting.
+        
+        Args:
+            model: Model kind ("text", "vision" or "multimodal")
+            key: Setting name
+            default: Value used if the setting is absent
+            
+        Returns:
+            Setting value
+        """
+        return self.config.get("models", {}).get(model, {}).get(key, default)
 
     @abstractmethod
     async def analyze_text(self, text: str) -> Dict[str, Any]:
         """
         Analyze text using DeepSeek's NLP capabilities.
         
+        Calls arriving within ``text.batch_delay_ms`` of each other are sent
+        to ``analyze_texts`` together when the implementation overrides it.
+        
         Args:
             text: Input text to analyze
             
@@ -32,14 +290,48 @@ class DeepSeekBase(ABC):
         """
         pass
 
+    async def analyze_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze several texts.
+        
+        Implementations backed by a batch endpoint should override this to
+        send all texts in one request; the default analyzes them concurrently.
+        
+        Args:
+            texts: Input texts to analyze
+            
+        Returns:
+            Analysis results, one per text and in the same order
+        """
+        return await asyncio.gather(*(self.analyze_text(text) for text in texts))
+
+    async def _analyze_text_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Send a batch of coalesced ``analyze_text`` calls to the backend.
+        
+        Their results were already looked up in the cache, so the batch
+        goes to the backend's ``analyze_texts`` directly.
+        
+        Args:
+            texts: Input texts to analyze
+            
+        Returns:
+            Analysis results, one per text and in the same order
+        """
+        method = type(self).analyze_texts
+        _in_text_batch.set(True)
+        return await getattr(method, "__wrapped__", method)(self, texts)
+
     @abstractmethod
-    async def analyze_image(self, image_data: bytes) -> Dict[str, Any]:
+    async def analyze_image(self, image_data: ImageSource) -> Dict[str, Any]:
         """
         Analyze image using DeepSeek's computer vision capabilities.
         
         Args:
-            image_data: Raw image data
-            
+            image_data: Raw image data, file path or async byte stream;
+                implementations receive bytes-like data, which should be
+                uploaded without copying it to ``bytes``
+                
         Returns:
             Analysis results including objects, features, etc.
         """
@@ -47,9 +339,9 @@ class DeepSeekBase(ABC):
 
     @abstractmethod
     async def multimodal_analysis(
-        self, 
+        self,
         text: Optional[str] = None,
-        image: Optional[bytes] = None,
+        image: Optional[ImageSource] = None,
         context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
@@ -57,7 +349,7 @@ class DeepSeekBase(ABC):
         
         Args:
             text: Optional text input
-            image: Optional image data
+            image: Optional image data, file path or async byte stream
             context: Additional context for analysis
             
         Returns:
@@ -85,6 +377,84 @@ class DeepSeekBase(ABC):
         """
         pass
 
+    async def generate_predictions(
+        self,
+        payloads: List[Dict[str, Any]],
+        confidence_threshold: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate predictions for many markets.
+        
+        Payloads whose cached prediction can be reused are answered from
+        the prediction cache; the rest are grouped by prediction type and
+        scored with ``predict_batch``, so each cycle only scores markets
+        whose inputs changed.
+        
+        Args:
+            payloads: Markets to score, each with "prediction_type", "data"
+                and an optional "id" identifying the market across cycles
+            confidence_threshold: Minimum confidence threshold
+                (default: prediction.min_confidence)
+                
+        Returns:
+            Prediction results in payload order; payloads that failed get
+            an "error" entry
+        """
+        threshold = self.min_confidence if confidence_threshold is None else confidence_threshold
+        results: List[Optional[Dict[str, Any]]] = [None] * len(payloads)
+        groups: Dict[str, List[int]] = {}
+        
+        for i, payload in enumerate(payloads):
+            results[i] = self.prediction_cache.get(payload, threshold)
+            if results[i] is None:
+                groups.setdefault(payload["prediction_type"], []).append(i)
+                
+        scored = await asyncio.gather(
+            *(
+                self.predict_batch([payloads[i]["data"] for i in indices], prediction_type, threshold)
+                for prediction_type, indices in groups.items()
+            ),
+            return_exceptions=True
+        )
+        
+        for (prediction_type, indices), outputs in zip(groups.items(), scored):
+            if isinstance(outputs, Exception):
+                outputs = [outputs] * len(indices)
+            for i, result in zip(indices, outputs):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error predicting {prediction_type}: {str(result)}")
+                    results[i] = {"prediction_type": prediction_type, "error": str(result)}
+                else:
+                    self.prediction_cache.set(payloads[i], result)
+                    results[i] = result
+        return results
+
+    async def predict_batch(
+        self,
+        data: List[Dict[str, Any]],
+        prediction_type: str,
+        confidence_threshold: float = 0.8
+    ) -> List[Any]:
+        """
+        Generate predictions of one type for several inputs.
+        
+        Implementations backed by a batch endpoint should override this;
+        the default calls ``generate_prediction`` concurrently.
+        
+        Args:
+            data: Input data for each prediction
+            prediction_type: Type of prediction to make
+            confidence_threshold: Minimum confidence threshold
+            
+        Returns:
+            Prediction results in input order, or the exception raised for
+            an input
+        """
+        return await asyncio.gather(
+            *(self.generate_prediction(item, prediction_type, confidence_threshold) for item in data),
+            return_exceptions=True
+        )
+
     @abstractmethod
     async def detect_anomalies(
         self,
@@ -111,4 +481,4 @@ class DeepSeekBase(ABC):
         Returns:
             Model information including versions and capabilities
         """
-        pass 
\ No newline at end of file
+        pass
\ No newline at end of file
@@ -0,0 +1,302 @@
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from ...utils.cache import LRUCache
+
+def make_key(model_version: str, model: str, arguments: Dict[str, Any]) -> str:
+    """
+    Build a content-addressed cache key.
+    
+    Binary inputs (image bytes, memoryviews) are hashed by content, other
+    inputs by their canonical JSON form.
+    
+    Args:
+        model_version: Model version producing the result
+        model: Model kind ("text", "vision" or "multimodal")
+        arguments: Call arguments by name
+        
+    Returns:
+        Hex digest identifying the call
+    """
+    digest = hashlib.sha256(f"{model_version}\0{model}".encode("utf-8"))
+    for name in sorted(arguments):
+        value = arguments[name]
+        digest.update(f"\0{name}=".encode("utf-8"))
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            digest.update(b"b")
+            digest.update(value)
+        else:
+            digest.update(json.dumps(value, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+class ResultCache:
+    """
+    LRU cache of analysis results with a TTL and an optional SQLite tier.
+    The persistent tier keeps results across restarts; entries read from
+    it are promoted to memory. Async lookups read it in a worker thread.
+    Writes to it are collected for ``write_delay`` seconds and committed
+    together in a worker thread, which also deletes expired rows and the
+    oldest rows beyond ``max_rows``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        path: Optional[str] = None,
+        timer=time.time,
+        max_rows: Optional[int] = None,
+        write_delay: float = 1.0
+    ):
+        """
+        Initialize the result cache.
+        
+        Args:
+            maxsize: Maximum number of results kept in memory
+            ttl: Optional result lifetime in seconds
+            path: Optional SQLite file for the persistent tier
+            timer: Wall clock, shared with the persistent tier
+            max_rows: Maximum number of rows in the SQLite file
+                (default: 10 times maxsize)
+            write_delay: Seconds results wait to be written with others
+        """
+        self.ttl = ttl
+        self.timer = timer
+        self.memory = LRUCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        self.max_rows = max_rows if max_rows is not None else 10 * maxsize
+        self.write_delay = write_delay
+        self.hits = 0
+        self.misses = 0
+        self.db = None
+        # Rows not yet committed, by key
+        self._writes: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flushing: Optional[asyncio.Future] = None
+        self._db_lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        if path:
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self.db.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached result.
+        
+        Reads the SQLite tier on the calling thread; async code should use
+        ``get_many``, which reads it in a worker thread.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Copy of the cached result, or None on a miss
+        """
+        return self._resolve([key], self._read_rows(self._missing([key])))[0]
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get cached results, reading the SQLite tier in a worker thread.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Copies of the cached results in key order, None for a miss
+        """
+        missing = self._missing(keys)
+        rows = {}
+        if missing:
+            rows = await asyncio.get_running_loop().run_in_executor(None, self._read_rows, missing)
+        return self._resolve(keys, rows)
+
+    def _missing(self, keys: List[str]) -> List[str]:
+        """
+        Get the keys that can only be answered by the SQLite tier.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Keys neither in memory nor waiting to be written
+        """
+        if self.db is None:
+            return []
+        return [key for key in keys if self.memory.get(key) is None and key not in self._writes]
+
+    def _read_rows(self, keys: List[str]) -> Dict[str, Tuple[str, Optional[float]]]:
+        """
+        Read rows of the SQLite tier.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Serialized values and expiry times of the stored keys
+        """
+        rows = {}
+        with self._db_lock:
+            # Chunked below SQLite's limit on query parameters
+            for i in range(0, len(keys), 500):
+                if self.db is None:
+                    break
+                chunk = keys[i:i + 500]
+                query = f"SELECT key, value, expires_at FROM results WHERE key IN ({', '.join('?' * len(chunk))})"
+                for key, value, expires_at in self.db.execute(query, chunk):
+                    rows[key] = (value, expires_at)
+        return rows
+
+    def _resolve(self, keys: List[str], rows: Dict[str, Tuple[str, Optional[float]]]) -> List[Optional[Any]]:
+        """
+        Answer lookups from memory, pending writes and rows read from SQLite.
+        
+        Args:
+            keys: Cache keys
+            rows: Rows read for keys missing from memory
+            
+        Returns:
+            Copies of the cached results in key order, None for a miss
+        """
+        results = []
+        for key in keys:
+            value = self.memory.get(key)
+            if value is None and self.db is not None:
+                row = self._writes.get(key) or rows.get(key)
+                if row and (row[1] is None or row[1] > self.timer()):
+                    value = json.loads(row[0])
+                    ttl = row[1] - self.timer() if row[1] is not None else None
+                    self.memory.set(key, value, ttl=ttl)
+                    
+            if value is None:
+                self.misses += 1
+                results.append(None)
+            else:
+                self.hits += 1
+                # Callers may mutate results; the cached copy must stay intact
+                results.append(copy.deepcopy(value))
+        return results
+
+    def set(self, key: str, value: Any):
+        """
+        Store a result.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable result
+        """
+        self.memory.set(key, copy.deepcopy(value))
+        
+        if self.db is not None:
+            expires_at = self.timer() + self.ttl if self.ttl is not None else None
+            self._writes[key] = (json.dumps(value, default=str), expires_at)
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Not called from async code: nothing to keep responsive
+                self._write(self._writes)
+                self._writes = {}
+                return
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.write_delay, self._start_flush)
+
+    async def flush(self):
+        """Write pending results to the persistent tier and wait for it."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while self._flushing is not None or self._writes:
+            if self._flushing is None:
+                self._start_flush()
+            await asyncio.shield(self._flushing)
+
+    def _start_flush(self):
+        """Commit pending results in a worker thread."""
+        self._flush_handle = None
+        if self._flushing is not None or not self._writes or self.db is None:
+            return
+        batch = dict(self._writes)
+        loop = asyncio.get_running_loop()
+        self._flushing = loop.run_in_executor(None, self._write, batch)
+        self._flushing.add_done_callback(lambda future: self._flushed(batch, future))
+
+    def _flushed(self, batch: Dict[str, Tuple[str, Optional[float]]], future: asyncio.Future):
+        """
+        Forget committed results and write those set meanwhile.
+        
+        Args:
+            batch: Rows that were written
+            future: Result of the write
+        """
+        self._flushing = None
+        error = None if future.cancelled() else future.exception()
+        if future.cancelled() or error is not None:
+            # The rows stay pending and are retried with the next batch
+            self.logger.warning(f"Writing cached results failed: {str(error)}")
+        else:
+            for key, row in batch.items():
+                if self._writes.get(key) is row:
+                    del self._writes[key]
+        if self._writes and self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.write_delay, self._start_flush)
+
+    def _write(self, rows: Dict[str, Tuple[str, Optional[float]]]):
+        """
+        Commit rows, then delete expired rows and the oldest beyond ``max_rows``.
+        
+        Args:
+            rows: Serialized values and expiry times by key
+        """
+        with self._db_lock:
+            if self.db is None:
+                return
+            self.db.executemany(
+                "INSERT OR REPLACE INTO results (key, value, expires_at) VALUES (?, ?, ?)",
+                [(key, value, expires_at) for key, (value, expires_at) in rows.items()]
+            )
+            self.db.execute("DELETE FROM results WHERE expires_at <= ?", (self.timer(),))
+            # Replaced rows get a new rowid, so the lowest rowids are the oldest
+            self.db.execute(
+                "DELETE FROM results WHERE rowid IN "
+                "(SELECT rowid FROM results ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                (self.max_rows,)
+            )
+            self.db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Hit and miss counters, hit rate and number of entries in memory
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.memory),
+        }
+
+    def close(self):
+        """Write pending results and close the persistent tier."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self.db is not None:
+            if self._writes:
+                self._write(self._writes)
+                self._writes = {}
+            with self._db_lock:
+                self.db.close()
+                self.db = None
\ No newline at end of file
@@ -0,0 +1,349 @@
+from collections import deque
+from typing import Any, Dict, Optional
+import asyncio
+import logging
+import time
+
+import aiohttp
+
+class LatencyTracker:
+    """Recent request latencies for percentile estimates."""
+
+    def __init__(self, size: int = 1000):
+        """
+        Initialize the tracker.
+        
+        Args:
+            size: Number of recent latencies kept
+        """
+        self.samples = deque(maxlen=size)
+
+    def record(self, latency: float):
+        """
+        Record a latency.
+        
+        Args:
+            latency: Seconds a request took
+        """
+        self.samples.append(latency)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Get a latency percentile.
+        
+        Args:
+            q: Percentile between 0 and 100
+            
+        Returns:
+            Latency in seconds, or None without samples
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+class CircuitBreaker:
+    """
+    Fails calls fast while an upstream is down.
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are rejected for ``reset_timeout`` seconds. Then one trial call
+    is let through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30, timer=time.monotonic):
+        """
+        Initialize a closed circuit.
+        
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open
+            timer: Clock used for the open period
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.timer = timer
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial = False
+
+    @property
+    def state(self) -> str:
+        """
+        Current state.
+        
+        Returns:
+            "closed", "open" or "half-open"
+        """
+        if self.opened_at is None:
+            return "closed"
+        if self.timer() - self.opened_at < self.reset_timeout:
+            return "open"
+        return "half-open"
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be made.
+        
+        Returns:
+            True if the circuit is closed, or half-open without a trial
+            call in flight
+        """
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self.trial:
+            self.trial = True
+            return True
+        return False
+
+    def retry_in(self) -> float:
+        """
+        Get the time until calls are let through again.
+        
+        Returns:
+            Seconds until the circuit half-opens
+        """
+        if self.opened_at is None:
+            return 0.0
+        return max(self.reset_timeout - (self.timer() - self.opened_at), 0.0)
+
+    def record_success(self):
+        """Record a successful call, closing the circuit."""
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit at the threshold."""
+        self.failures += 1
+        if self.trial or self.failures >= self.failure_threshold:
+            self.opened_at = self.timer()
+        self.trial = False
+
+    def release(self):
+        """Record a call abandoned without an outcome, freeing the trial."""
+        self.trial = False
+
+class DeepSeekClient:
+    """
+    Request layer for DeepSeek API implementations.
+    Calls share a keep-alive connection pool and are bounded by a per-call
+    deadline. Idempotent calls may opt into hedging: one still running
+    after the recent p95 latency gets a duplicate, and whichever response
+    arrives first is used, so a single slow upstream response does not set
+    the tail latency. A circuit breaker rejects calls while the API keeps
+    failing.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the client.
+        
+        Args:
+            config: DeepSeek configuration:
+                - base_url: API base URL
+                - api_key: API key sent as a bearer token
+                - timeout: Default deadline per call in seconds (default: 30)
+                - hedge_percentile: Latency percentile after which a call
+                  is hedged (default: 95)
+                - hedge_min_samples: Latencies needed before hedging
+                  (default: 20)
+                - hedge_budget: Largest fraction of calls hedged
+                  (default: 0.1)
+                - failure_threshold: Consecutive failures opening the
+                  circuit (default: 5)
+                - reset_timeout: Seconds the circuit stays open
+                  (default: 30)
+                - max_connections: Connection pool size (default: 100)
+                - keepalive_timeout: Seconds idle connections are kept
+                  (default: 30)
+        """
+        self.config = config
+        self.base_url = config.get("base_url", "https://api.deepseek.ai/v1").rstrip("/")
+        self.api_key = config.get("api_key")
+        self.timeout = config.get("timeout", 30)
+        self.hedge_percentile = config.get("hedge_percentile", 95)
+        self.hedge_min_samples = config.get("hedge_min_samples", 20)
+        self.hedge_budget = config.get("hedge_budget", 0.1)
+        self.latencies = LatencyTracker()
+        self.breaker = CircuitBreaker(
+            failure_threshold=config.get("failure_threshold", 5),
+            reset_timeout=config.get("reset_timeout", 30)
+        )
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "rejected": 0, "deadline_exceeded": 0}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def open(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled session, creating it on first use.
+        
+        Returns:
+            Shared client session
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.get("max_connections", 100),
+                keepalive_timeout=self.config.get("keepalive_timeout", 30),
+            )
+            headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else None
+            self.session = aiohttp.ClientSession(connector=connector, headers=headers)
+        return self.session
+
+    async def close(self):
+        """Close the pooled session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def post(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        timeout: Optional[float] = None,
+        hedge: bool = False
+    ) -> Any:
+        """
+        POST a JSON payload.
+        
+        Args:
+            path: Endpoint path relative to the base URL
+            payload: JSON request body
+            timeout: Optional deadline in seconds (default: ``timeout``)
+            hedge: Whether a slow call may be duplicated; only for
+                idempotent calls such as analyses
+                
+        Returns:
+            Decoded JSON response
+        """
+        return await self.request("POST", path, payload, timeout, hedge)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        hedge: bool = False
+    ) -> Any:
+        """
+        Make an API call within a deadline.
+        
+        Server errors, rate limiting, network errors, invalid responses and
+        missed deadlines count as failures for the circuit breaker; other
+        client errors are raised without tripping it. A cancelled call
+        counts as neither.
+        
+        Args:
+            method: HTTP method
+            path: Endpoint path relative to the base URL
+            payload: Optional JSON request body
+            timeout: Optional deadline in seconds (default: ``timeout``)
+            hedge: Whether a slow call may be duplicated; only for
+                idempotent calls (default: False)
+                
+        Returns:
+            Decoded JSON response
+        """
+        if not self.breaker.allow():
+            self.stats["rejected"] += 1
+            raise Exception(f"DeepSeek API circuit open, retry in {self.breaker.retry_in():.1f}s")
+            
+        deadline = self.timeout if timeout is None else timeout
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        self.stats["calls"] += 1
+        try:
+            result = await asyncio.wait_for(self._hedged(method, url, payload, hedge), deadline)
+        except asyncio.TimeoutError:
+            self.stats["deadline_exceeded"] += 1
+            self.breaker.record_failure()
+            raise Exception(f"DeepSeek API call to {path} exceeded its {deadline}s deadline")
+        except aiohttp.ClientResponseError as e:
+            if e.status == 429 or e.status >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise Exception(f"DeepSeek API call to {path} failed with status {e.status}")
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled: a trial call must not keep the circuit half-open
+            self.breaker.release()
+            raise
+            
+        self.breaker.record_success()
+        return result
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        Get the delay after which a call is hedged.
+        
+        Returns:
+            Recent latency percentile, or None until enough calls were seen
+        """
+        if len(self.latencies.samples) < self.hedge_min_samples:
+            return None
+        return self.latencies.percentile(self.hedge_percentile)
+
+    async def _hedged(self, method: str, url: str, payload: Optional[Dict[str, Any]], hedge: bool) -> Any:
+        """
+        Send a call and, if it is slow, a duplicate, using the first result.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            payload: Optional JSON request body
+            hedge: Whether the call may be duplicated
+            
+        Returns:
+            Decoded JSON response of the first successful attempt
+        """
+        primary = asyncio.ensure_future(self._attempt(method, url, payload))
+        pending = {primary}
+        try:
+            delay = self.hedge_delay() if hedge else None
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done and self.stats["hedged"] < self.hedge_budget * self.stats["calls"]:
+                    self.stats["hedged"] += 1
+                    pending.add(asyncio.ensure_future(self._attempt(method, url, payload)))
+                    
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.stats["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _attempt(self, method: str, url: str, payload: Optional[Dict[str, Any]]) -> Any:
+        """
+        Send one request.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            payload: Optional JSON request body
+            
+        Returns:
+            Decoded JSON response
+        """
+        session = await self.open()
+        started = time.monotonic()
+        response = await session.request(method, url, json=payload)
+        async with response:
+            response.raise_for_status()
+            try:
+                body = await response.json()
+            except (aiohttp.ContentTypeError, ValueError) as e:
+                # ContentTypeError is a ClientResponseError with the 2xx status
+                raise Exception(f"DeepSeek API returned an invalid JSON response from {url}: {str(e)}")
+        self.latencies.record(time.monotonic() - started)
+        return body
\ No newline at end of file
@@ -0,0 +1,40 @@
+from typing import Any, Dict
+import importlib
+
+from .base import DeepSeekBase
+
+# Backend implementations by name, imported only when selected
+BACKENDS = {
+    "remote": ".remote.RemoteDeepSeek",
+    "local": ".local.LocalDeepSeek",
+}
+
+def register_backend(name: str, path: str):
+    """
+    Register a DeepSeek backend.
+    
+    Args:
+        name: Backend name used in configuration
+        path: Dotted path of the ``DeepSeekBase`` implementation, relative
+            to this package if it starts with a dot
+    """
+    BACKENDS[name] = path
+
+def create_client(config: Dict[str, Any]) -> DeepSeekBase:
+    """
+    Create the DeepSeek backend selected by configuration.
+    
+    Args:
+        config: DeepSeek configuration with a "backend" name: "remote"
+            for the hosted API (default) or "local" for in-process models
+            
+    Returns:
+        Backend instance
+    """
+    backend = config.get("backend", "remote")
+    if backend not in BACKENDS:
+        raise Exception(f"Unknown DeepSeek backend: {backend} (available: {', '.join(sorted(BACKENDS))})")
+        
+    module_name, class_name = BACKENDS[backend].rsplit(".", 1)
+    cls = getattr(importlib.import_module(module_name, __package__), class_name)
+    return cls(config)
\ No newline at end of file
@@ -0,0 +1,355 @@
+from typing import Any, Dict, List, Optional, Union
+import asyncio
+import json
+import logging
+import os
+
+import numpy as np
+
+from ...utils.lazy import lazy_import
+from ..anomaly import StreamingAnomalyDetector
+from ..base import BaseModel, torch
+from ..registry import get_model_registry
+from .base import DeepSeekBase
+from .media import ImageSource
+
+transformers = lazy_import("transformers")
+
+DEFAULT_TEXT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+
+# Optimized weights inside a checkpoint directory
+OPTIMIZED_CHECKPOINT = "optimized.pt"
+
+class LocalDeepSeek(DeepSeekBase, BaseModel):
+    """
+    In-process DeepSeek backend running models on the local CPU.
+    Text analysis runs a transformers sequence classifier and anomaly
+    detection runs a streaming NumPy detector, so neither needs the
+    network. Image, multimodal and prediction calls are not available
+    locally.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the local backend.
+        
+        Args:
+            config: DeepSeek configuration; besides the settings of
+                ``DeepSeekBase`` and ``BaseModel``:
+                - text.model: Name or path of the sentiment classifier
+                  (default: DistilBERT fine-tuned on SST-2)
+                - text.max_length: Tokens per text (default: 512)
+                - device: Torch device (default: "cpu")
+                - optimization: Settings of ``BaseModel.optimize``, applied
+                  on load when given
+                - anomaly: Settings of ``StreamingAnomalyDetector``
+        """
+        DeepSeekBase.__init__(self, config)
+        BaseModel.__init__(self, config)
+        self.model_name = self.model_setting("text", "model", DEFAULT_TEXT_MODEL)
+        self.max_length = self.model_setting("text", "max_length", 512)
+        self.batch_size = self.model_setting("text", "batch_size", 32)
+        self.tokenizer = None
+        self.model_config = None
+        self.labels: List[str] = []
+        self.loaded = False
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._load_lock: Optional[asyncio.Lock] = None
+        self.anomaly_detector = StreamingAnomalyDetector(config.get("anomaly"))
+
+    @property
+    def cache_version(self) -> str:
+        """
+        Identify the model producing results, as part of their cache keys.
+        
+        Returns:
+            Model version and classifier name or path, so results of
+            another classifier are not reused
+        """
+        return f"{self.model_version}:{self.model_name}"
+
+    def resolve_device(self) -> "torch.device":
+        """
+        Select the device, defaulting to CPU.
+        
+        Returns:
+            Configured device, else CPU
+        """
+        return torch.device(self.config.get("device", "cpu"))
+
+    async def load(self) -> bool:
+        """
+        Load the tokenizer and classifier.
+        
+        Models are shared through the process-wide registry, so instances
+        with the same model, device and optimization settings, and worker
+        processes forked after loading, use one copy of the weights.
+        
+        Returns:
+            True if loading successful, False otherwise
+        """
+        key = (
+            self.__class__.__name__,
+            self.model_name,
+            str(self.device),
+            json.dumps(self.config.get("optimization", {}), sort_keys=True)
+        )
+        try:
+            loop = asyncio.get_running_loop()
+            self.tokenizer, self.model_config, self.model, self.optimization = await get_model_registry().get(
+                key, lambda: loop.run_in_executor(None, self._load_pretrained)
+            )
+            self.labels = [
+                self.model_config.id2label[i].lower()
+                for i in range(self.model_config.num_labels)
+            ]
+            self.loaded = True
+            return True
+        except Exception as e:
+            self.logger.error(f"Error loading {self.model_name}: {str(e)}")
+            return False
+
+    def _load_pretrained(self):
+        """
+        Load the pretrained tokenizer and model.
+        
+        Checkpoints saved by ``save_checkpoint`` are restored through
+        ``load_optimized``, in optimized form if they were optimized; other
+        models are optimized if an "optimization" config is given.
+        
+        Returns:
+            Tokenizer, model configuration, the model in evaluation mode on
+            ``self.device`` and its applied optimizations
+        """
+        tokenizer = transformers.AutoTokenizer.from_pretrained(self.model_name)
+        model_config = transformers.AutoConfig.from_pretrained(self.model_name)
+        optimized = os.path.join(self.model_name, OPTIMIZED_CHECKPOINT)
+        optimization = {}
+        
+        if os.path.exists(optimized):
+            model = transformers.AutoModelForSequenceClassification.from_config(model_config)
+            model = self.load_optimized(optimized, model.to(self.device).eval())
+            optimization = self.optimization
+        else:
+            model = transformers.AutoModelForSequenceClassification.from_pretrained(self.model_name)
+            model = model.to(self.device).eval()
+        if not optimization and self.config.get("optimization"):
+            # The tokenizer is needed for example inputs when tracing
+            self.tokenizer = tokenizer
+            model, optimization = self.apply_optimization(model, self.config["optimization"])
+        return tokenizer, model_config, model, optimization
+
+    async def _ensure_loaded(self):
+        """Load the model on first use."""
+        if self.loaded:
+            return
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if not self.loaded and not await self.load():
+                raise Exception(f"Failed to load local model {self.model_name}")
+
+    async def analyze_text(self, text: str) -> Dict[str, Any]:
+        """
+        Analyze the sentiment of a text.
+        
+        Args:
+            text: Input text to analyze
+            
+        Returns:
+            Sentiment in [-1, 1], predicted label, confidence and the
+            probability of every label
+        """
+        results = await self._classify([text])
+        return results[0]
+
+    async def analyze_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze the sentiment of several texts in batched forward passes.
+        
+        Args:
+            texts: Input texts to analyze
+            
+        Returns:
+            Analysis results, one per text and in the same order
+        """
+        return await self._classify(texts)
+
+    async def _classify(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Classify texts in chunks of ``text.batch_size``.
+        
+        Inference runs in a worker thread so the event loop stays
+        responsive; torch releases the GIL while computing.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            Analysis results in input order
+        """
+        await self._ensure_loaded()
+        loop = asyncio.get_running_loop()
+        results = []
+        for i in range(0, len(texts), self.batch_size):
+            chunk = texts[i:i + self.batch_size]
+            probabilities = await loop.run_in_executor(None, self._forward, chunk)
+            results.extend(self._sentiment(row) for row in probabilities)
+        return results
+
+    def _forward(self, texts: List[str]) -> np.ndarray:
+        """
+        Run the classifier on one batch.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            Label probabilities, one row per text
+        """
+        # Traced models take positional inputs of the traced shape
+        traced = self.optimization.get("compile") == "torchscript"
+        inputs = self.tokenizer(
+            texts,
+            padding="max_length" if traced else True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="pt"
+        ).to(self.device)
+        with self.inference():
+            if traced:
+                outputs = self.model(inputs["input_ids"], inputs["attention_mask"])
+            else:
+                outputs = self.model(**inputs)
+        logits = outputs[0] if isinstance(outputs, tuple) else outputs["logits"]
+        return torch.softmax(logits, dim=-1).cpu().numpy()
+
+    def example_inputs(self):
+        """
+        Get example inputs for tracing the classifier.
+        
+        Returns:
+            Token ids and attention mask of one text padded to ``max_length``
+        """
+        inputs = self.tokenizer(
+            ["example"],
+            padding="max_length",
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="pt"
+        ).to(self.device)
+        return inputs["input_ids"], inputs["attention_mask"]
+
+    def _sentiment(self, probabilities: np.ndarray) -> Dict[str, Any]:
+        """
+        Build the analysis result of one text.
+        
+        Args:
+            probabilities: Label probabilities
+            
+        Returns:
+            Analysis result
+        """
+        scores = {label: float(p) for label, p in zip(self.labels, probabilities)}
+        best = int(np.argmax(probabilities))
+        return {
+            "sentiment": scores.get("positive", 0.0) - scores.get("negative", 0.0),
+            "label": self.labels[best],
+            "confidence": float(probabilities[best]),
+            "scores": scores,
+        }
+
+    async def analyze_image(self, image_data: ImageSource) -> Dict[str, Any]:
+        raise Exception("Image analysis is not available in the local backend")
+
+    async def multimodal_analysis(
+        self,
+        text: Optional[str] = None,
+        image: Optional[ImageSource] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        raise Exception("Multimodal analysis is not available in the local backend")
+
+    async def generate_prediction(
+        self,
+        data: Dict[str, Any],
+        prediction_type: str,
+        confidence_threshold: float = 0.8
+    ) -> Dict[str, Any]:
+        raise Exception("Predictions are not available in the local backend")
+
+    async def detect_anomalies(
+        self,
+        data: Union[List[Dict[str, Any]], Dict[str, Any]],
+        detection_config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Detect anomalies with the streaming detector.
+        
+        Series are continued across calls, so each call only scores its
+        new points.
+        
+        Args:
+            data: New records, or a mapping of field names to value series
+            detection_config: Settings of
+                ``StreamingAnomalyDetector.detect_anomalies``
+                
+        Returns:
+            Anomalies with their record index, field, value and scores
+        """
+        return await self.anomaly_detector.detect_anomalies(data, detection_config)
+
+    async def predict(self, inputs: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Analyze the sentiment of one or more inputs with a "text" field.
+        
+        Args:
+            inputs: Input record or records
+            
+        Returns:
+            Analysis results under "predictions"
+        """
+        records = inputs if isinstance(inputs, list) else [inputs]
+        return {"predictions": await self.analyze_texts([record["text"] for record in records])}
+
+    async def validate(self, data: Dict[str, Any]) -> bool:
+        return isinstance(data.get("text"), str) and bool(data["text"])
+
+    async def get_model_info(self) -> Dict[str, Any]:
+        return {
+            "backend": "local",
+            "model": self.model_name,
+            "version": self.model_version,
+            "device": str(self.device),
+            "loaded": self.loaded,
+            "labels": self.labels,
+            "optimization": self.optimization,
+            "capabilities": ["text", "anomaly"],
+        }
+
+    async def save_checkpoint(self, path: str) -> bool:
+        """
+        Save the tokenizer, configuration and classifier weights.
+        
+        Weights are written by ``save_optimized``: plain classifiers,
+        including those optimized without quantization, in the flat format
+        that loads memory-mapped without copying; quantized ones with
+        ``torch.save``, as packed int8 weights cannot be mapped; TorchScript
+        ones whole. Optimized classifiers reload in optimized form.
+        
+        Args:
+            path: Directory to save to, loadable as ``text.model``
+            
+        Returns:
+            True if saving successful, False otherwise
+        """
+        if not self.loaded:
+            return False
+        try:
+            self.tokenizer.save_pretrained(path)
+            self.model_config.save_pretrained(path)
+            self.save_optimized(os.path.join(path, OPTIMIZED_CHECKPOINT))
+            return True
+        except Exception as e:
+            self.logger.error(f"Error saving checkpoint to {path}: {str(e)}")
+            return False
\ No newline at end of file
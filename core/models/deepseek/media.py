@@ -0,0 +1,127 @@
+from typing import AsyncIterator, Optional, Union
+import io
+import logging
+import mmap
+import os
+
+# Bytes-like data, a file path or an async stream of chunks
+ImageSource = Union[bytes, bytearray, memoryview, str, os.PathLike, AsyncIterator[bytes]]
+
+logger = logging.getLogger(__name__)
+
+class BufferReader(io.RawIOBase):
+    """
+    Seekable read-only file over a buffer.
+    Lets decoders read image data in place instead of from a copy.
+    """
+
+    def __init__(self, buffer: memoryview):
+        """
+        Initialize the reader.
+        
+        Args:
+            buffer: Data to read
+        """
+        self.buffer = buffer.cast("B")
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        chunk = self.buffer[self.position:self.position + len(target)]
+        target[:len(chunk)] = chunk
+        self.position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.buffer)
+        self.position = max(offset, 0)
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+async def read_image(source: ImageSource, max_bytes: Optional[int] = None) -> memoryview:
+    """
+    Get the raw data of an image without copying it where possible.
+    
+    Bytes-like data is wrapped as is, files are memory-mapped and streams
+    are read into a single growing buffer.
+    
+    Args:
+        source: Image data, file path or async stream of chunks
+        max_bytes: Optional limit on the image size
+        
+    Returns:
+        Read-only view of the image data
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = memoryview(source)
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if max_bytes is not None and size > max_bytes:
+                raise Exception(f"Image {source} exceeds {max_bytes} bytes")
+            if not size:
+                raise Exception(f"Image {source} is empty")
+            # The mapping stays valid after the file is closed
+            data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    else:
+        buffer = bytearray()
+        async for chunk in source:
+            buffer += chunk
+            if max_bytes is not None and len(buffer) > max_bytes:
+                raise Exception(f"Image stream exceeds {max_bytes} bytes")
+        data = memoryview(buffer)
+        
+    if max_bytes is not None and data.nbytes > max_bytes:
+        raise Exception(f"Image exceeds {max_bytes} bytes")
+    return data.toreadonly()
+
+def downsize_image(data: memoryview, max_size: int) -> Union[memoryview, bytes]:
+    """
+    Shrink an image to fit within ``max_size`` pixels on its longest side.
+    
+    Only the header is decoded for images that already fit, and JPEGs are
+    decoded at reduced scale, so memory stays bounded by the target size
+    rather than the source. Data is returned unchanged if Pillow is not
+    installed or cannot decode it.
+    
+    Args:
+        data: Raw image data
+        max_size: Maximum width and height in pixels
+        
+    Returns:
+        Original data, or the re-encoded smaller image
+    """
+    try:
+        from PIL import Image, UnidentifiedImageError
+    except ImportError:
+        logger.warning("Pillow is not installed, images are sent at full size")
+        return data
+        
+    try:
+        image = Image.open(io.BufferedReader(BufferReader(data)))
+    except UnidentifiedImageError:
+        return data
+        
+    with image:
+        if max(image.size) <= max_size:
+            return data
+            
+        image_format = image.format or "PNG"
+        image.draft("RGB", (max_size, max_size))
+        image.thumbnail((max_size, max_size))
+        if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+            
+        output = io.BytesIO()
+        image.save(output, format=image_format)
+        return output.getvalue()
\ No newline at end of file
@@ -0,0 +1,122 @@
+from typing import Any, Dict, Hashable, Optional, Tuple
+import copy
+import time
+
+from ...utils.cache import LRUCache
+from .cache import make_key
+
+def within_tolerance(old: Any, new: Any, tolerance: float) -> bool:
+    """
+    Check whether inputs changed by no more than a relative tolerance.
+    
+    Numbers are compared relative to their magnitude; mappings and
+    sequences element-wise; anything else must be equal.
+    
+    Args:
+        old: Previous input
+        new: Current input
+        tolerance: Largest accepted relative change of a number
+        
+    Returns:
+        True if every value is within tolerance
+    """
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)) \
+            and not isinstance(old, bool) and not isinstance(new, bool):
+        return abs(new - old) <= tolerance * max(abs(old), abs(new))
+    if isinstance(old, dict) and isinstance(new, dict):
+        return old.keys() == new.keys() and all(within_tolerance(old[k], new[k], tolerance) for k in old)
+    if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+        return len(old) == len(new) and all(within_tolerance(a, b, tolerance) for a, b in zip(old, new))
+    return old == new
+
+class PredictionCache:
+    """
+    Recent predictions by market and prediction type.
+    A prediction is reused while it is younger than the TTL and its inputs
+    are unchanged. Inputs that moved within the tolerance also reuse it,
+    unless it was below the confidence threshold: uncertain predictions are
+    the ones a small move can flip.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        tolerance: float = 0.0,
+        maxsize: int = 10000,
+        timer=time.monotonic
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Seconds a prediction may be reused
+            tolerance: Relative input change still treated as unchanged
+            maxsize: Maximum number of predictions kept
+            timer: Clock used for expiry
+        """
+        self.tolerance = tolerance
+        self.entries = LRUCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        self.reused = 0
+        self.scored = 0
+
+    @staticmethod
+    def key(payload: Dict[str, Any]) -> Hashable:
+        """
+        Get the cache key of a payload.
+        
+        Args:
+            payload: Prediction payload
+            
+        Returns:
+            Prediction type and market id, or a hash of the data for
+            payloads without an id
+        """
+        if payload.get("id") is not None:
+            return payload["prediction_type"], payload["id"]
+        return payload["prediction_type"], make_key("", "prediction", {"data": payload["data"]})
+
+    def get(self, payload: Dict[str, Any], confidence_threshold: float) -> Optional[Dict[str, Any]]:
+        """
+        Get a reusable prediction for a payload.
+        
+        Args:
+            payload: Prediction payload
+            confidence_threshold: Confidence a prediction needs to be reused
+                for inputs that changed within tolerance
+                
+        Returns:
+            Copy of the cached prediction, or None if it must be scored
+        """
+        entry: Optional[Tuple[Any, Dict[str, Any]]] = self.entries.get(self.key(payload))
+        if entry is None:
+            return None
+            
+        data, result = entry
+        if data != payload["data"]:
+            if result.get("confidence", 0.0) < confidence_threshold:
+                return None
+            if not within_tolerance(data, payload["data"], self.tolerance):
+                return None
+                
+        self.reused += 1
+        return copy.deepcopy(result)
+
+    def set(self, payload: Dict[str, Any], result: Dict[str, Any]):
+        """
+        Store the prediction of a payload.
+        
+        Args:
+            payload: Prediction payload
+            result: Prediction result
+        """
+        self.scored += 1
+        self.entries.set(self.key(payload), (copy.deepcopy(payload["data"]), copy.deepcopy(result)))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get reuse statistics.
+        
+        Returns:
+            Reused and scored counters and number of cached predictions
+        """
+        return {"reused": self.reused, "scored": self.scored, "size": len(self.entries)}
\ No newline at end of file
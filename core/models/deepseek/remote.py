@@ -0,0 +1,101 @@
+from typing import Any, Dict, List, Optional, Union
+import base64
+import logging
+
+from .base import DeepSeekBase
+from .client import DeepSeekClient
+from .media import ImageSource
+
+class RemoteDeepSeek(DeepSeekBase):
+    """
+    DeepSeek backend calling the hosted API.
+    Requests go through ``DeepSeekClient``, so they share its connection
+    pool, deadlines and circuit breaker. Analyses, predictions and model
+    info are idempotent and may be hedged; images are sent base64-encoded.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the remote backend.
+        
+        Args:
+            config: DeepSeek configuration; besides the settings of
+                ``DeepSeekBase``, an optional "api" mapping shaped like
+                ``deepseek.api`` with the settings of ``DeepSeekClient``
+                and the API key under "key"
+        """
+        super().__init__(config)
+        api = config.get("api", {})
+        self.client = DeepSeekClient({
+            **api,
+            "api_key": api.get("key", self.api_key),
+            "base_url": api.get("base_url", self.base_url),
+        })
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def close(self):
+        """Close the API connection pool."""
+        await self.client.close()
+
+    async def analyze_text(self, text: str) -> Dict[str, Any]:
+        return await self.client.post("text/analyze", {"text": text, "model_version": self.model_version}, hedge=True)
+
+    async def analyze_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze several texts in one request.
+        
+        Args:
+            texts: Input texts to analyze
+            
+        Returns:
+            Analysis results, one per text and in the same order
+        """
+        response = await self.client.post(
+            "text/analyze/batch",
+            {"texts": texts, "model_version": self.model_version},
+            hedge=True
+        )
+        return response["results"]
+
+    async def analyze_image(self, image_data: ImageSource) -> Dict[str, Any]:
+        return await self.client.post(
+            "vision/analyze",
+            {"image": base64.b64encode(image_data).decode("ascii"), "model_version": self.model_version},
+            hedge=True
+        )
+
+    async def multimodal_analysis(
+        self,
+        text: Optional[str] = None,
+        image: Optional[ImageSource] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        payload = {"text": text, "context": context, "model_version": self.model_version}
+        if image is not None:
+            payload["image"] = base64.b64encode(image).decode("ascii")
+        return await self.client.post("multimodal/analyze", payload, hedge=True)
+
+    async def generate_prediction(
+        self,
+        data: Dict[str, Any],
+        prediction_type: str,
+        confidence_threshold: float = 0.8
+    ) -> Dict[str, Any]:
+        return await self.client.post("predict", {
+            "data": data,
+            "prediction_type": prediction_type,
+            "confidence_threshold": confidence_threshold,
+            "model_version": self.model_version,
+        }, hedge=True)
+
+    async def detect_anomalies(
+        self,
+        data: Union[List[Dict[str, Any]], Dict[str, Any]],
+        detection_config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        # Not hedged: the service may continue series across calls
+        return await self.client.post("anomalies/detect", {"data": data, "config": detection_config or {}})
+
+    async def get_model_info(self) -> Dict[str, Any]:
+        info = await self.client.request("GET", "models/info", hedge=True)
+        return {**info, "backend": "remote", "version": self.model_version}
\ No newline at end of file
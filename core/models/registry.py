@@ -0,0 +1,110 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import asyncio
+import os
+
+# Result of a load that was cancelled; its waiters start their own
+_CANCELLED = object()
+
+class ModelRegistry:
+    """
+    Process-wide registry of loaded models.
+    Every caller asking for the same key shares one loaded instance, and
+    concurrent requests for a model still loading wait for that load
+    rather than starting their own. Models loaded before worker processes
+    are forked are inherited by them without reloading.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._models: Dict[Hashable, Any] = {}
+        self._loading: Dict[Hashable, asyncio.Future] = {}
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get a model, loading it on first use.
+        
+        Args:
+            key: Identifies the model, e.g. its name, device and options
+            loader: Coroutine function loading the model
+            
+        Returns:
+            Shared model
+        """
+        while key in self._loading:
+            model = await asyncio.shield(self._loading[key])
+            if model is not _CANCELLED:
+                return model
+        if key in self._models:
+            return self._models[key]
+            
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            model = await loader()
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; a waiter takes over the load
+            future.set_result(_CANCELLED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters receive the error; nobody else needs to retrieve it
+            future.exception()
+            raise
+        finally:
+            del self._loading[key]
+            
+        self._models[key] = model
+        future.set_result(model)
+        return model
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a model only if it is already loaded.
+        
+        Args:
+            key: Model key
+            
+        Returns:
+            Shared model, or None
+        """
+        return self._models.get(key)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """
+        Remove a model so the next request reloads it.
+        
+        Args:
+            key: Model key
+            
+        Returns:
+            Removed model, or None
+        """
+        return self._models.pop(key, None)
+
+    def clear(self):
+        """Remove all models."""
+        self._models.clear()
+
+    def _after_fork(self):
+        # Loads in flight belong to the parent's event loop
+        self._loading = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+_registry = ModelRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_registry._after_fork)
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Get the process-wide model registry.
+    
+    Returns:
+        Shared registry
+    """
+    return _registry
\ No newline at end of file
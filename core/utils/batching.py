@@ -0,0 +1,104 @@
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+import asyncio
+
+class RequestBatcher:
+    """
+    Coalesces concurrent single-item requests into batched calls.
+    Items are collected until ``max_batch_size`` is reached or ``max_delay``
+    has passed since the first one, then sent to the batch handler in one
+    call; every caller receives its own result.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 32,
+        max_delay: float = 0.005
+    ):
+        """
+        Initialize the batcher.
+        
+        Args:
+            handler: Coroutine function taking a list of items and returning
+                one result per item, in order. A result that is an exception
+                instance is raised to that item's caller only.
+            max_batch_size: Maximum items per batch
+            max_delay: Seconds the first item of a batch waits for more
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Submit an item and wait for its result.
+        
+        Args:
+            item: Item to process
+            
+        Returns:
+            Result of the item
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+            
+        return await future
+
+    async def flush(self):
+        """Send pending items now and wait for all batches in flight."""
+        while self._pending:
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self):
+        """Start a batch with the pending items."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            
+        batch = self._pending[:self.max_batch_size]
+        self._pending = self._pending[self.max_batch_size:]
+        if self._pending:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush)
+            
+        # Callers that gave up do not need to be sent
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """
+        Run the handler on a batch and resolve its futures.
+        
+        Args:
+            batch: Items and the futures of their callers
+        """
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+            
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
\ No newline at end of file
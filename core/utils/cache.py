@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+import time
+
+class LRUCache:
+    """
+    Bounded in-memory cache with least-recently-used eviction.
+    Entries optionally expire after a fixed time-to-live.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Optional entry lifetime in seconds
+            timer: Clock used for expiry
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as recently used.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+            
+        Returns:
+            Cached value, or default if missing or expired
+        """
+        try:
+            expires_at, value = self._data[key]
+        except KeyError:
+            return default
+            
+        if expires_at is not None and expires_at <= self.timer():
+            del self._data[key]
+            return default
+            
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        Store a value, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional lifetime overriding the cache default
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self.timer() + ttl if ttl is not None else None
+        
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove a value from the cache.
+        
+        Args:
+            key: Cache key
+            default: Value returned if the key is missing
+            
+        Returns:
+            Removed value, or default
+        """
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        """Remove all entries."""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def __len__(self) -> int:
+        return len(self._data)
\ No newline at end of file
@@ -0,0 +1,53 @@
+from typing import Any, Optional
+import importlib
+import types
+
+class LazyModule:
+    """
+    Module proxy that defers the import until first attribute access.
+    Keeps heavy dependencies (torch, transformers, web3) out of the import
+    path of code that never uses them.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the proxy.
+        
+        Args:
+            name: Fully qualified module name
+        """
+        self._name = name
+        self._module: Optional[types.ModuleType] = None
+
+    def load(self) -> types.ModuleType:
+        """
+        Import the module if needed.
+        
+        Returns:
+            Imported module
+        """
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        # Private names are looked up before __init__ ran, e.g. when copying
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Get a lazily imported module.
+    
+    Args:
+        name: Fully qualified module name
+        
+    Returns:
+        Proxy importing the module on first use
+    """
+    return LazyModule(name)
\ No newline at end of file
@@ -0,0 +1,124 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.blockchain.registry import ContractRegistry
+from core.blockchain.rpc import JsonRpcPool
+
+eth_abi = pytest.importorskip("eth_abi")
+
+HOLDER = "0x" + "ab" * 20
+
+TOKEN_ABI = [
+    {
+        "type": "function", "name": "balanceOf", "stateMutability": "view",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+    },
+    {
+        "type": "function", "name": "transfer", "stateMutability": "nonpayable",
+        "inputs": [{"name": "to", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "bool"}],
+    },
+    {
+        "type": "event", "name": "Transfer", "anonymous": False,
+        "inputs": [
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    },
+    {
+        "type": "event", "name": "Named", "anonymous": False,
+        "inputs": [
+            {"name": "label", "type": "string", "indexed": True},
+            {"name": "scores", "type": "tuple[]", "indexed": False, "components": [
+                {"name": "id", "type": "uint8"}, {"name": "ok", "type": "bool"},
+            ]},
+        ],
+    },
+]
+
+@pytest_asyncio.fixture
+async def node():
+    """Serve a stand-in node answering balanceOf with the block number"""
+    calls = []
+
+    async def handle(request):
+        replies = []
+        for call in await request.json():
+            calls.append(call["params"])
+            block = int(call["params"][1], 16)
+            result = "0x" + eth_abi.encode(["uint256"], [block]).hex()
+            replies.append({"jsonrpc": "2.0", "id": call["id"], "result": result})
+        return web.json_response(replies)
+        
+    app = web.Application()
+    app.router.add_post("/", handle)
+    server = TestServer(app)
+    await server.start_server()
+    rpc = JsonRpcPool({"rpc_url": str(server.make_url("/"))})
+    yield rpc, calls
+    await rpc.close()
+    await server.close()
+
+def test_selectors_and_topics():
+    """Test selectors, topics and calldata match the ABI spec"""
+    registry = ContractRegistry(1)
+    token = registry.register("0xToken", TOKEN_ABI)
+    
+    assert token.function("transfer").selector == "0xa9059cbb"
+    assert token.event("Transfer").topic == "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    assert token.event("Named").signature == "Named(string,(uint8,bool)[])"
+    assert token.function("balanceOf").encode([HOLDER]) == "0x70a08231" + "0" * 24 + "ab" * 20
+    assert "0xtoken" in registry
+    
+    # Contracts sharing an ABI share the compiled functions
+    other = registry.register("0xOther", TOKEN_ABI)
+    assert other.function("transfer") is token.function("transfer")
+    with pytest.raises(Exception, match="no function mint"):
+        token.function("mint")
+
+def test_decode_log():
+    """Test logs are decoded by topic, with hashed indexed values kept"""
+    registry = ContractRegistry(1)
+    token = registry.register("0xToken", TOKEN_ABI)
+    transfer = {
+        "address": "0xtoken",
+        "topics": [token.event("Transfer").topic, "0x" + "0" * 24 + "ab" * 20, "0x" + "0" * 24 + "cd" * 20],
+        "data": "0x" + eth_abi.encode(["uint256"], [500]).hex(),
+    }
+    named = {
+        "address": "0xTOKEN",
+        "topics": [token.event("Named").topic, "0x" + "11" * 32],
+        "data": "0x" + eth_abi.encode(["(uint8,bool)[]"], [[(1, True)]]).hex(),
+    }
+    
+    decoded = registry.decode_log(transfer)
+    assert decoded["event"] == "Transfer"
+    assert decoded["args"] == {"from": HOLDER, "to": "0x" + "cd" * 20, "value": 500}
+    assert registry.decode_log(named)["args"] == {"label": "0x" + "11" * 32, "scores": ((1, True),)}
+    assert registry.decode_log({**transfer, "address": "0xunknown"}) is None
+
+@pytest.mark.asyncio
+async def test_view_calls_are_memoized_per_block(node):
+    """Test view results at a block number are reused within the LRU bound"""
+    rpc, calls = node
+    registry = ContractRegistry(1, rpc, {"call_cache_size": 2})
+    registry.register("0xToken", TOKEN_ABI)
+    
+    results = await asyncio.gather(*(registry.call("0xtoken", "balanceOf", [HOLDER], 7) for _ in range(3)))
+    assert results == [7, 7, 7]
+    assert await registry.call("0xToken", "balanceOf", [HOLDER], 7) == 7
+    assert await registry.call("0xToken", "balanceOf", [HOLDER], 8) == 8
+    assert await registry.call("0xToken", "balanceOf", [HOLDER], 9) == 9
+    
+    # Block 7 was evicted by the two newer blocks
+    await registry.call("0xToken", "balanceOf", [HOLDER], 7)
+    assert registry.stats["memo_hits"] == 1
+    assert len(calls) == 6
+    
+    with pytest.raises(Exception, match="Unknown contract"):
+        await registry.call("0xunknown", "balanceOf", [HOLDER], 7)
\ No newline at end of file
@@ -0,0 +1,153 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.blockchain.index import EventIndex
+from core.blockchain.rpc import JsonRpcPool
+from core.blockchain.scanner import LogScanner
+
+@pytest_asyncio.fixture
+async def chain():
+    """Serve a stand-in node with one log per block and a movable tip"""
+    state = {"tip": 80, "hashes": {}, "log_queries": [], "header_delay": 0}
+
+    def block_hash(block):
+        return state["hashes"].get(block, f"0x{block:064x}")
+
+    def answer(call):
+        if call["method"] == "eth_blockNumber":
+            return hex(state["tip"])
+        if call["method"] == "eth_getBlockByNumber":
+            block = int(call["params"][0], 16)
+            return {"number": hex(block), "hash": block_hash(block)} if block <= state["tip"] else None
+        log_filter = call["params"][0]
+        if log_filter["address"] == "0xbroken" and int(log_filter["fromBlock"], 16) >= 40:
+            raise ValueError("query timeout")
+        start, end = int(log_filter["fromBlock"], 16), int(log_filter["toBlock"], 16)
+        state["log_queries"].append((start, end))
+        return [
+            {"blockNumber": hex(block), "logIndex": "0x0", "blockHash": block_hash(block), "address": log_filter["address"]}
+            for block in range(start, min(end, state["tip"]) + 1)
+        ]
+
+    async def handle(request):
+        calls = await request.json()
+        if any(call["method"] == "eth_getBlockByNumber" for call in calls):
+            await asyncio.sleep(state["header_delay"])
+        replies = []
+        for call in calls:
+            try:
+                replies.append({"jsonrpc": "2.0", "id": call["id"], "result": answer(call)})
+            except ValueError as e:
+                replies.append({"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32000, "message": str(e)}})
+        return web.json_response(replies)
+        
+    app = web.Application()
+    app.router.add_post("/", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield str(server.make_url("/")), state
+    await server.close()
+
+def make_index(url, **config):
+    config = {"rpc_url": url, "chain_id": 1, "confirmation_blocks": 2, **config}
+    return EventIndex(LogScanner(JsonRpcPool(config), config), config)
+
+@pytest.mark.asyncio
+async def test_history_is_answered_locally(chain, tmp_path):
+    """Test confirmed blocks are indexed once and kept across restarts"""
+    url, state = chain
+    path = str(tmp_path / "events.db")
+    index = make_index(url, event_index_path=path)
+    
+    logs = await index.get_events("0xMarket", "BetPlaced", None, 10)
+    assert [int(log["blockNumber"], 16) for log in logs] == list(range(10, 81))
+    assert state["log_queries"] == [(10, 78), (79, 80)]
+    await index.rpc.close()
+    index.close()
+    
+    # A restarted index only fetches blocks past its checkpoint
+    state["tip"] = 85
+    state["log_queries"].clear()
+    index = make_index(url, event_index_path=path)
+    logs = await index.get_events("0xmarket", "BetPlaced", None, 50, 82)
+    await index.rpc.close()
+    
+    assert [int(log["blockNumber"], 16) for log in logs] == list(range(50, 83))
+    assert state["log_queries"] == [(79, 83)]
+    assert index.stats["local"] == 33 and index.stats["fetched"] == 0
+
+@pytest.mark.asyncio
+async def test_earlier_history_is_backfilled(chain):
+    """Test a query before the indexed range extends the stream"""
+    url, state = chain
+    index = make_index(url)
+    
+    await index.get_events("0xmarket", "BetPlaced", None, 40)
+    state["log_queries"].clear()
+    logs = await index.get_events("0xmarket", "BetPlaced", None, 20, 60)
+    await index.rpc.close()
+    
+    assert [int(log["blockNumber"], 16) for log in logs] == list(range(20, 61))
+    assert state["log_queries"] == [(20, 39)]
+
+@pytest.mark.asyncio
+async def test_deep_reorg_rolls_back(chain):
+    """Test a reorg past the confirmations is rolled back to a surviving checkpoint"""
+    url, state = chain
+    index = make_index(url)
+    
+    await index.sync("0xmarket", "BetPlaced", None, 0)
+    state["tip"] = 100
+    await index.sync("0xmarket", "BetPlaced", None, 0)
+    
+    # Blocks from 85 on are replaced, deeper than two confirmations
+    state["hashes"] = {block: f"0x{block + 10 ** 6:064x}" for block in range(85, 102)}
+    state["tip"] = 101
+    state["log_queries"].clear()
+    logs = await index.get_events("0xmarket", "BetPlaced", None, 70, 99)
+    await index.rpc.close()
+    
+    assert index.stats["rollbacks"] == 1
+    assert state["log_queries"][0] == (79, 99)
+    assert [log["blockHash"] for log in logs] == \
+        [f"0x{block:064x}" for block in range(70, 85)] + [f"0x{block + 10 ** 6:064x}" for block in range(85, 100)]
+
+@pytest.mark.asyncio
+async def test_failed_stream_keeps_other_streams(chain):
+    """Test a failing sync does not discard logs of a concurrent one"""
+    url, state = chain
+    state["header_delay"] = 0.05
+    index = make_index(url, log_chunk_size=10)
+    
+    good, broken = await asyncio.gather(
+        index.sync("0xgood", "BetPlaced", None, 60),
+        index.sync("0xbroken", "BetPlaced", None, 0),
+        return_exceptions=True
+    )
+    logs = await index.get_events("0xgood", "BetPlaced", None, 60, 78)
+    await index.rpc.close()
+    
+    assert good == 78 and "query timeout" in str(broken)
+    assert len(logs) == 19 and index.stats["fetched"] == 0
+
+@pytest.mark.asyncio
+async def test_streams_keyed_by_topic_filters(chain):
+    """Test logs indexed for one topic filter are not served for another"""
+    url, state = chain
+    index = make_index(url)
+    transfer = "0x" + "dd" * 32
+    
+    await index.sync("0xtoken", "Transfer", [transfer, "0x" + "0a" * 32], 70)
+    state["log_queries"].clear()
+    await index.sync("0xtoken", "Transfer", [transfer, "0x" + "0b" * 32], 70)
+    assert state["log_queries"] == [(70, 78)]
+    
+    # Trailing wildcards select the same logs
+    await index.sync("0xtoken", "Transfer", [transfer], 70)
+    state["log_queries"].clear()
+    await index.sync("0xToken", "Transfer", [transfer.upper().replace("0X", "0x"), None], 70)
+    await index.rpc.close()
+    assert state["log_queries"] == []
\ No newline at end of file
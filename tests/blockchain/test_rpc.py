@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.blockchain.rpc import JsonRpcPool
+
+@pytest_asyncio.fixture
+async def node():
+    """Serve a stand-in JSON-RPC node answering batches out of order"""
+    state = {"http_requests": 0, "failing": False}
+
+    def answer(call):
+        if call["method"] == "eth_blockNumber":
+            return {"result": hex(1000)}
+        if call["method"] == "eth_call":
+            # Echo the calldata as the return value
+            return {"result": call["params"][0]["data"]}
+        return {"error": {"code": -32601, "message": "method not found"}}
+
+    async def handle(request):
+        state["http_requests"] += 1
+        if state["failing"]:
+            return web.Response(status=502)
+        calls = await request.json()
+        replies = [{"jsonrpc": "2.0", "id": call["id"], **answer(call)} for call in calls]
+        return web.json_response(list(reversed(replies)))
+        
+    app = web.Application()
+    app.router.add_post("/", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield str(server.make_url("/")), state
+    await server.close()
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_batches(node):
+    """Test concurrent calls are coalesced into few batch requests"""
+    url, state = node
+    pool = JsonRpcPool({"rpc_url": url, "rpc_batch_size": 100})
+    
+    results = await asyncio.gather(*(pool.call("0xmarket", hex(i)) for i in range(250)))
+    block = await pool.block_number()
+    await pool.close()
+    
+    assert results == [hex(i) for i in range(250)]
+    assert block == 1000
+    assert state["http_requests"] == 4
+    assert pool.stats["requests"] == 251
+
+@pytest.mark.asyncio
+async def test_errors_stay_with_their_call(node):
+    """Test a failing call does not fail the rest of its batch"""
+    url, state = node
+    pool = JsonRpcPool({"rpc_url": url})
+    
+    results = await asyncio.gather(
+        pool.call("0xmarket", "0x01"),
+        pool.request("eth_unknown"),
+        return_exceptions=True
+    )
+    explicit = await pool.batch([("eth_blockNumber", []), ("eth_unknown", [])])
+    await pool.close()
+    
+    assert results[0] == "0x01"
+    assert "method not found" in str(results[1])
+    assert explicit[0] == hex(1000) and isinstance(explicit[1], Exception)
+
+@pytest.mark.asyncio
+async def test_fails_over_to_next_endpoint(node):
+    """Test batches move on from unreachable or failing endpoints"""
+    url, state = node
+    pool = JsonRpcPool({"rpc_urls": ["http://127.0.0.1:9/", url]})
+    
+    assert await pool.block_number() == 1000
+    assert pool.stats["failovers"] == 1
+    
+    state["failing"] = True
+    with pytest.raises(Exception, match="status 502"):
+        await pool.block_number()
+    await pool.close()
\ No newline at end of file
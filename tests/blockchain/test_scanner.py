@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.blockchain.rpc import JsonRpcPool
+from core.blockchain.scanner import LogScanner, is_too_many_results
+
+@pytest_asyncio.fixture
+async def node():
+    """Serve a stand-in node with two logs per block, limiting results per query"""
+    state = {"queries": [], "limit": 50, "latest": 999, "slow": None}
+
+    def get_logs(log_filter):
+        start, end = int(log_filter["fromBlock"], 16), int(log_filter["toBlock"], 16)
+        state["queries"].append((start, end))
+        if 2 * (end - start + 1) > state["limit"]:
+            return {"error": {"code": -32005, "message": "query returned more than 50 results"}}
+        logs = [
+            {"blockNumber": hex(block), "logIndex": hex(index), "address": log_filter["address"]}
+            for block in range(start, end + 1) for index in (1, 0)
+        ]
+        return {"result": logs}
+
+    async def handle(request):
+        replies = []
+        for call in await request.json():
+            if call["method"] == "eth_blockNumber":
+                reply = {"result": hex(state["latest"])}
+            else:
+                log_filter = call["params"][0]
+                start, end = int(log_filter["fromBlock"], 16), int(log_filter["toBlock"], 16)
+                # Later chunks answer first
+                await asyncio.sleep(0.01 * (1000 - start) / 1000)
+                if state["slow"] is not None and end - start + 1 > state["slow"]:
+                    # Ranges too large for the node never finish in time
+                    await asyncio.sleep(1)
+                reply = get_logs(log_filter)
+            replies.append({"jsonrpc": "2.0", "id": call["id"], **reply})
+        return web.json_response(replies)
+        
+    app = web.Application()
+    app.router.add_post("/", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield JsonRpcPool({"rpc_url": str(server.make_url("/"))}), state
+    await server.close()
+
+@pytest.mark.asyncio
+async def test_scan_splits_and_orders_logs(node):
+    """Test chunks with too many results are split and logs stay in order"""
+    rpc, state = node
+    scanner = LogScanner(rpc, {"log_chunk_size": 100, "log_concurrency": 3})
+    
+    logs = await scanner.get_logs("0xmarket", None, 0)
+    await rpc.close()
+    
+    assert [(int(log["blockNumber"], 16), int(log["logIndex"], 16)) for log in logs] == \
+        [(block, index) for block in range(1000) for index in (0, 1)]
+    assert scanner.stats["splits"] > 0
+    # Growth settles below the size the node rejects
+    assert 25 <= scanner.chunk_size < 50
+    assert scanner.too_many <= 28
+    failed = [query for query in state["queries"] if query[1] - query[0] >= 25]
+    assert len(failed) == scanner.stats["splits"] < 20
+
+@pytest.mark.asyncio
+async def test_fast_chunks_grow(node):
+    """Test chunks answered quickly make later chunks larger"""
+    rpc, state = node
+    state["limit"] = 10 ** 6
+    scanner = LogScanner(rpc, {"log_chunk_size": 10, "log_concurrency": 1, "log_max_chunk_size": 160})
+    
+    logs = await scanner.get_logs("0xmarket", None, 0, 499)
+    await rpc.close()
+    
+    assert len(logs) == 1000
+    assert [end - start + 1 for start, end in state["queries"][:5]] == [10, 20, 40, 80, 160]
+
+@pytest.mark.asyncio
+async def test_stopping_early_cancels_chunks(node):
+    """Test a consumer can stop the stream part way"""
+    rpc, state = node
+    scanner = LogScanner(rpc, {"log_chunk_size": 10, "log_concurrency": 4})
+    
+    stream = scanner.scan("0xmarket", None, 0)
+    first = [await stream.__anext__() for _ in range(5)]
+    await stream.aclose()
+    await rpc.close()
+    
+    assert [int(log["blockNumber"], 16) for log in first] == [0, 0, 1, 1, 2]
+    assert len(state["queries"]) <= 8
+
+@pytest.mark.asyncio
+async def test_timed_out_chunks_are_split(node):
+    """Test chunks the node cannot answer in time are split like oversized ones"""
+    rpc, state = node
+    state["limit"] = 10 ** 6
+    state["slow"] = 30
+    rpc.config["rpc_timeout"] = 0.2
+    scanner = LogScanner(rpc, {"log_chunk_size": 100, "log_concurrency": 4})
+    
+    logs = await scanner.get_logs("0xmarket", None, 0, 199)
+    await rpc.close()
+    
+    assert len(logs) == 400
+    assert scanner.stats["splits"] > 0
+    assert scanner.chunk_size < scanner.too_many <= 50
+
+def test_too_many_results_errors():
+    """Test errors of oversized queries are told apart from other failures"""
+    assert is_too_many_results(Exception("eth_getLogs failed: Log response size exceeded (-32602)"))
+    assert is_too_many_results(Exception("eth_getLogs failed: query returned more than 10000 results (-32005)"))
+    assert not is_too_many_results(Exception("eth_getLogs failed: invalid address (-32602)"))
+    assert is_too_many_results(asyncio.TimeoutError())
\ No newline at end of file
@@ -0,0 +1,209 @@
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.blockchain.rpc import JsonRpcPool
+from core.blockchain.transactions import FeeOracle, TransactionPipeline
+
+SENDER = "0x" + "aa" * 20
+
+def sign(transaction):
+    """Stand-in signer: the raw transaction is its JSON"""
+    return json.dumps(transaction).encode("utf-8")
+
+@pytest_asyncio.fixture
+async def node():
+    """Serve a stand-in node that mines each sent transaction in the next block"""
+    state = {"tip": 100, "mined": {}, "sent": [], "in_flight": [], "counts": 0, "replaced": 0, "legacy": False, "pipeline": None}
+
+    def answer(call):
+        method, params = call["method"], call["params"]
+        if method == "eth_blockNumber":
+            state["tip"] += 1
+            return hex(state["tip"])
+        if method == "eth_getTransactionCount" and params[1] == "latest":
+            mined = sum(1 for block, _ in state["mined"].values() if block <= state["tip"])
+            return hex(5 + mined + state["replaced"])
+        if method == "eth_getTransactionCount":
+            state["counts"] += 1
+            return hex(5 + len(state["sent"]))
+        if method == "eth_getBlockByNumber":
+            return {"number": hex(state["tip"])} if state["legacy"] else {"baseFeePerGas": hex(100)}
+        if method == "eth_maxPriorityFeePerGas":
+            return hex(2)
+        if method == "eth_gasPrice":
+            return hex(150)
+        if method == "eth_estimateGas":
+            return hex(21000)
+        if method == "eth_sendRawTransaction":
+            transaction = json.loads(bytes.fromhex(params[0][2:]))
+            if transaction["data"] == "0xbad":
+                raise ValueError("nonce too low")
+            if state["pipeline"] is not None:
+                # Sent before this one and not yet confirmed
+                state["in_flight"].append(len(state["sent"]) - state["pipeline"].stats["confirmed"])
+            tx_hash = f"0x{len(state['sent']):064x}"
+            state["sent"].append(transaction)
+            if transaction["data"] == "0xreplaced":
+                # Another transaction with the same nonce is mined instead
+                state["replaced"] += 1
+            elif transaction["data"] != "0xstuck":
+                state["mined"][tx_hash] = (state["tip"] + 1, transaction["data"] != "0xdead")
+            return tx_hash
+        if method == "eth_getTransactionReceipt":
+            if params[0] not in state["mined"]:
+                return None
+            block, success = state["mined"][params[0]]
+            if block > state["tip"]:
+                return None
+            return {"transactionHash": params[0], "blockNumber": hex(block), "status": "0x1" if success else "0x0"}
+        raise ValueError("method not found")
+
+    async def handle(request):
+        replies = []
+        for call in await request.json():
+            try:
+                replies.append({"jsonrpc": "2.0", "id": call["id"], "result": answer(call)})
+            except ValueError as e:
+                replies.append({"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32000, "message": str(e)}})
+        return web.json_response(replies)
+        
+    app = web.Application()
+    app.router.add_post("/", handle)
+    server = TestServer(app)
+    await server.start_server()
+    rpc = JsonRpcPool({"rpc_url": str(server.make_url("/"))})
+    yield rpc, state
+    await rpc.close()
+    await server.close()
+
+def make_pipeline(rpc, state, **config):
+    config = {
+        "chain_id": 1, "confirmation_blocks": 2, "gas_limit": 2000000,
+        "max_in_flight": 3, "receipt_poll_seconds": 0.01, **config
+    }
+    pipeline = TransactionPipeline(rpc, config, signer=sign)
+    state["pipeline"] = pipeline
+    return pipeline
+
+@pytest.mark.asyncio
+async def test_pipeline_keeps_transactions_in_flight(node):
+    """Test nonces are allocated locally and at most max_in_flight are pending"""
+    rpc, state = node
+    pipeline = make_pipeline(rpc, state)
+    
+    transactions = [{"from": SENDER, "to": "0xmarket", "data": f"0x{i:02x}", "value": 0} for i in range(10)]
+    receipts = await pipeline.send_all(transactions)
+    await pipeline.close()
+    
+    assert all(receipt["status"] == "0x1" for receipt in receipts)
+    assert sorted(sent["nonce"] for sent in state["sent"]) == list(range(5, 15))
+    assert state["counts"] == 1
+    assert max(state["in_flight"]) == 2
+    assert pipeline.fees.refreshes == 1
+    
+    sent = state["sent"][0]
+    assert sent["chainId"] == 1 and sent["gas"] == 25200
+    assert sent["maxFeePerGas"] == 202 and sent["maxPriorityFeePerGas"] == 2
+    # Confirmed means two blocks on top of the transaction's block
+    last_block = max(int(receipt["blockNumber"], 16) for receipt in receipts)
+    assert state["tip"] >= last_block + 2
+    assert await pipeline.wait(receipts[0]["transactionHash"]) == receipts[0]
+
+@pytest.mark.asyncio
+async def test_failures_and_nonce_resync(node):
+    """Test reverts reach their caller and a failed send resyncs the nonce"""
+    rpc, state = node
+    pipeline = make_pipeline(rpc, state)
+    
+    with pytest.raises(Exception, match="nonce too low"):
+        await pipeline.send({"from": SENDER, "to": "0xmarket", "data": "0xbad"})
+    results = await pipeline.send_all([
+        {"from": SENDER, "to": "0xmarket", "data": "0xdead"},
+        {"from": SENDER, "to": "0xmarket", "data": "0x01", "gas": 50000, "gasPrice": 7},
+    ])
+    await pipeline.close()
+    
+    assert "reverted" in str(results[0])
+    assert results[1]["status"] == "0x1"
+    assert state["counts"] == 2
+    sent = next(sent for sent in state["sent"] if sent["data"] == "0x01")
+    assert sent["gas"] == 50000 and "maxFeePerGas" not in sent
+    assert pipeline.stats == {"submitted": 2, "confirmed": 1, "failed": 2}
+
+@pytest.mark.asyncio
+async def test_failed_send_keeps_nonces_in_flight(node):
+    """Test a failed send only releases its own nonce while others are being sent"""
+    rpc, state = node
+
+    async def slow_sign(transaction):
+        if transaction["data"] == "0xslow":
+            await asyncio.sleep(0.1)
+        return sign(transaction)
+        
+    config = {"chain_id": 1, "receipt_poll_seconds": 0.01}
+    pipeline = TransactionPipeline(rpc, config, signer=slow_sign)
+    
+    slow = asyncio.ensure_future(pipeline.send({"from": SENDER, "to": "0xmarket", "data": "0xslow"}))
+    await asyncio.sleep(0.05)
+    with pytest.raises(Exception, match="nonce too low"):
+        await pipeline.send({"from": SENDER, "to": "0xmarket", "data": "0xbad"})
+    receipt = await pipeline.send({"from": SENDER, "to": "0xmarket", "data": "0x01"})
+    await slow
+    await pipeline.close()
+    
+    assert receipt["status"] == "0x1"
+    # The slow transaction's nonce is not yet known to the node
+    assert [(sent["data"], sent["nonce"]) for sent in state["sent"]] == [("0x01", 6), ("0xslow", 5)]
+    assert state["counts"] == 1
+
+@pytest.mark.asyncio
+async def test_unmined_transactions_release_their_slots(node):
+    """Test replaced and never mined transactions fail instead of waiting forever"""
+    rpc, state = node
+    pipeline = make_pipeline(rpc, state, max_in_flight=2, confirmation_timeout=0.2)
+    
+    results = await asyncio.wait_for(pipeline.send_all([
+        {"from": SENDER, "to": "0xmarket", "data": "0xreplaced"},
+        {"from": SENDER, "to": "0xmarket", "data": "0xstuck"},
+    ]), 5)
+    receipt = await asyncio.wait_for(pipeline.send({"from": SENDER, "to": "0xmarket", "data": "0x01"}), 5)
+    await pipeline.close()
+    
+    assert "dropped or replaced" in str(results[0])
+    assert "not confirmed within" in str(results[1])
+    assert receipt["status"] == "0x1"
+    assert pipeline.stats == {"submitted": 3, "confirmed": 1, "failed": 2}
+    # The nonce after the stuck one is fetched again from the node
+    assert state["counts"] == 2
+
+@pytest.mark.asyncio
+async def test_idle_pipeline_leaves_no_tasks(node):
+    """Test nothing keeps running once all transactions are confirmed"""
+    rpc, state = node
+    pipeline = make_pipeline(rpc, state)
+    
+    await pipeline.send({"from": SENDER, "to": "0xmarket", "data": "0x01"})
+    await asyncio.sleep(0.05)
+    
+    running = [task.get_coro().__qualname__ for task in asyncio.all_tasks()]
+    assert not [name for name in running if name.startswith(("FeeOracle.", "TransactionPipeline."))]
+
+@pytest.mark.asyncio
+async def test_fee_oracle_refreshes_on_timer(node):
+    """Test fee estimates are cached until they are too old"""
+    rpc, state = node
+    now = [0.0]
+    oracle = FeeOracle(rpc, {"fee_refresh_seconds": 10}, timer=lambda: now[0])
+    
+    assert await oracle.fees() == {"maxFeePerGas": 202, "maxPriorityFeePerGas": 2}
+    state["legacy"] = True
+    now[0] = 5.0
+    assert await oracle.fees() == {"maxFeePerGas": 202, "maxPriorityFeePerGas": 2}
+    
+    now[0] = 10.0
+    assert await oracle.fees() == {"gasPrice": 150}
+    assert oracle.refreshes == 2
\ No newline at end of file
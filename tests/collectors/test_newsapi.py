@@ -3,6 +3,7 @@ import aiohttp
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from core.data.collectors.http_cache import ResponseCache
 from core.data.collectors.news.newsapi import NewsAPICollector
 
 @pytest.fixture
@@ -149,4 +150,287 @@ async def test_validate_articles(collector_config):
     validated = await collector.validate(test_articles)
     assert len(validated) == 1
     assert validated[0]["title"] == "Test Title"
-    assert len(validated[0]["content"]) >= 100 
\ No newline at end of file
+    assert len(validated[0]["content"]) >= 100 
+
+@pytest.mark.asyncio
+async def test_session_reused_across_collects(collector_config, mock_response):
+    """Test that one pooled session is shared and closed on disconnect"""
+    
+    async def mock_get(*args, **kwargs):
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        mock_resp.json = AsyncMock(return_value=mock_response)
+        return mock_resp
+    
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        collector = NewsAPICollector(collector_config)
+        assert await collector.connect() is True
+        session = collector.session
+        
+        await collector.collect()
+        await collector.collect()
+        assert collector.session is session
+        
+        assert await collector.disconnect() is True
+        assert session.closed
+        assert collector.session is None
+
+@pytest.mark.asyncio
+async def test_collect_fan_out(collector_config):
+    """Test concurrent collection across pages and keyword shards"""
+    
+    requests = []
+    
+    async def mock_get(self, url, headers=None, params=None):
+        requests.append(params)
+        page = params.get("page", 1)
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        mock_resp.json = AsyncMock(return_value={
+            "status": "ok",
+            "totalResults": 25,
+            "articles": [
+                {
+                    "source": {"id": "test", "name": "Test Source"},
+                    "title": f"{params['q']} {page} {i}",
+                    "url": f"https://test.com/{params['q']}/{page}/{i}",
+                    "publishedAt": "2024-01-27T12:00:00Z",
+                    "content": "Test content " * 20
+                }
+                for i in range(10 if page < 3 else 5)
+            ]
+        })
+        return mock_resp
+    
+    config = {**collector_config, "keyword_shard_size": 1, "max_pages": 5}
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        collector = NewsAPICollector(config)
+        articles = await collector.collect()
+        await collector.disconnect()
+    
+    # 2 shards x 3 pages (25 results at 10 per page)
+    assert len(requests) == 6
+    assert {r["q"] for r in requests} == {"crypto", "blockchain"}
+    assert len(articles) == 50
+
+@pytest.mark.asyncio
+async def test_collect_retries_rate_limited_page(collector_config, mock_response):
+    """Test that 429 responses are retried up to max_retries"""
+    
+    statuses = [429, 503, 200]
+    
+    async def mock_get(*args, **kwargs):
+        mock_resp = AsyncMock()
+        mock_resp.status = statuses.pop(0)
+        mock_resp.headers = {"Retry-After": "0"} if mock_resp.status == 429 else {}
+        mock_resp.json = AsyncMock(return_value=mock_response)
+        return mock_resp
+    
+    config = {**collector_config, "retry_backoff": 0}
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        collector = NewsAPICollector(config)
+        articles = await collector.collect()
+        await collector.disconnect()
+    
+    assert statuses == []
+    assert len(articles) == 2
+
+@pytest.mark.asyncio
+async def test_stream_yields_pages(collector_config, mock_response):
+    """Test streaming articles page by page"""
+    
+    async def mock_get(self, url, headers=None, params=None):
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        page = params.get("page", 1)
+        mock_resp.json = AsyncMock(return_value={
+            **mock_response,
+            "totalResults": 4,
+            "articles": [
+                {**article, "url": f"{article['url']}?page={page}"}
+                for article in mock_response["articles"]
+            ]
+        })
+        return mock_resp
+    
+    config = {**collector_config, "max_articles": 2, "max_pages": 3}
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        collector = NewsAPICollector(config)
+        pages = [page async for page in collector.stream()]
+        await collector.disconnect()
+    
+    assert [len(page) for page in pages] == [2, 2]
+    assert all("collected_at" in article for page in pages for article in page)
+
+@pytest.mark.asyncio
+async def test_collect_skips_seen_articles(collector_config, mock_response):
+    """Test stable content IDs and dropping of already collected articles"""
+    
+    async def mock_get(*args, **kwargs):
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        mock_resp.json = AsyncMock(return_value=mock_response)
+        return mock_resp
+    
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        collector = NewsAPICollector(collector_config)
+        first = await collector.collect()
+        second = await collector.collect()
+        await collector.disconnect()
+        
+        other = NewsAPICollector(collector_config)
+        third = await other.collect()
+        await other.disconnect()
+    
+    assert len(first) == 2
+    assert first[0]["id"] != first[1]["id"]
+    assert second == []
+    assert [a["id"] for a in third] == [a["id"] for a in first]
+
+@pytest.mark.asyncio
+async def test_collect_resumes_from_cursor(collector_config, mock_response, tmp_path):
+    """Test that polls resume from the persisted high-water mark"""
+    
+    requests = []
+    
+    async def mock_get(self, url, headers=None, params=None):
+        requests.append(params)
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        mock_resp.json = AsyncMock(return_value=mock_response)
+        return mock_resp
+    
+    config = {**collector_config, "state_file": str(tmp_path / "state.json")}
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        collector = NewsAPICollector(config)
+        await collector.collect()
+        await collector.disconnect()
+        
+        # A fresh instance picks the cursor up from the state file
+        restarted = NewsAPICollector(config)
+        await restarted.collect()
+        await restarted.collect({"start_date": "2024-01-01"})
+        await restarted.disconnect()
+    
+    assert "from" not in requests[0]
+    assert requests[1]["from"] == "2024-01-27T13:00:00Z"
+    assert requests[2]["from"] == "2024-01-01"
+
+@pytest.mark.asyncio
+async def test_cursor_kept_when_pages_left_unfetched(collector_config, mock_response):
+    """Test that the cursor does not skip results beyond max_pages"""
+    
+    requests = []
+    
+    async def mock_get(self, url, headers=None, params=None):
+        requests.append(params)
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        mock_resp.json = AsyncMock(return_value={**mock_response, "totalResults": 250})
+        return mock_resp
+    
+    config = {**collector_config, "max_pages": 1}
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        collector = NewsAPICollector(config)
+        await collector.collect()
+        await collector.collect()
+        await collector.disconnect()
+    
+    assert len(requests) == 2
+    assert "from" not in requests[1]
+
+@pytest.mark.asyncio
+async def test_vectorized_validation_matches_per_item(collector_config):
+    """Test that the columnar validation path gives identical results"""
+    
+    timestamps = [
+        "2024-01-27T12:00:00Z",
+        "2024-01-27T12:00:00.123456+02:00",
+        "2024-01-27T12:00:00.1Z",
+        "2024-02-30T12:00:00Z",
+        "2024-01-27T24:00:00Z",
+        "2024-01-27",
+        "2024-01-27 12:00:00",
+        "invalid-date",
+        "",
+    ]
+    contents = ["Test content " * 20, "x" * 99, "x" * 100, "", None]
+    
+    test_articles = []
+    for published_at in timestamps:
+        for content in contents:
+            test_articles.append({
+                "title": "Test Title",
+                "content": content,
+                "url": "https://test.com",
+                "published_at": published_at
+            })
+    test_articles.append({"title": "Test Title", "url": "https://test.com"})
+    
+    collector = NewsAPICollector({**collector_config, "vectorize_threshold": 1})
+    expected = [article for article in test_articles if collector._is_valid(article)]
+    
+    mask = collector.validation_mask(test_articles)
+    assert mask.dtype == bool
+    assert [a for a, valid in zip(test_articles, mask) if valid] == expected
+    assert await collector.validate(test_articles) == expected
+
+@pytest.mark.asyncio
+async def test_response_cache_and_revalidation(collector_config, mock_response, tmp_path):
+    """Test cached responses and conditional revalidation with ETags"""
+    
+    requests = []
+    
+    async def mock_get(self, url, headers=None, params=None):
+        headers = headers or {}
+        requests.append(headers)
+        mock_resp = AsyncMock()
+        mock_resp.status = 304 if "If-None-Match" in headers else 200
+        mock_resp.headers = {"ETag": '"v1"'}
+        mock_resp.json = AsyncMock(return_value=mock_response)
+        return mock_resp
+    
+    now = [1000.0]
+    config = {**collector_config, "cache_ttl": 60, "cache_dir": str(tmp_path)}
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        collector = NewsAPICollector(config)
+        collector.response_cache.timer = lambda: now[0]
+        url = f"{collector.base_url}/everything"
+        
+        first = await collector.fetch_json(url, params={"q": "crypto"})
+        second = await collector.fetch_json(url, params={"q": "crypto"})
+        assert len(requests) == 1
+        assert second == first
+        
+        # Stale entries are revalidated and served on 304
+        now[0] += 61
+        third = await collector.fetch_json(url, params={"q": "crypto"})
+        assert len(requests) == 2
+        assert requests[1]["If-None-Match"] == '"v1"'
+        assert third == first
+        
+        # The on-disk tier survives a restart
+        restarted = NewsAPICollector(config)
+        restarted.response_cache.timer = lambda: now[0]
+        assert await restarted.fetch_json(url, params={"q": "crypto"}) == first
+        assert len(requests) == 2
+        
+        await collector.disconnect()
+        await restarted.disconnect()
+
+def test_response_cache_prunes_disk_tier(tmp_path):
+    """Test on-disk responses are deleted once too old or too many"""
+    now = [1000.0]
+    cache = ResponseCache(ttl=60, cache_dir=str(tmp_path), timer=lambda: now[0], max_age=3600, max_files=3)
+    
+    for i in range(5):
+        cache.set(f"key{i}", {"page": i})
+    cache.prune()
+    assert sorted(path.stem for path in tmp_path.glob("*.json")) == ["key2", "key3", "key4"]
+    
+    # Expired entries are neither served nor kept
+    now[0] += 3600
+    restarted = ResponseCache(ttl=60, cache_dir=str(tmp_path), timer=lambda: now[0], max_age=3600)
+    assert restarted.get("key4") is None
+    restarted.set("fresh", {"page": 5})
+    assert [path.stem for path in tmp_path.glob("*.json")] == ["fresh"]
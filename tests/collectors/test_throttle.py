@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+
+from core.data.collectors.throttle import TokenBucket, backoff_delay, get_rate_limiter
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests():
+    """Test that requests beyond the burst wait for refills"""
+    
+    bucket = TokenBucket(rate=100, capacity=2)
+    loop = asyncio.get_running_loop()
+    
+    start = loop.time()
+    for _ in range(5):
+        await bucket.acquire()
+    elapsed = loop.time() - start
+    
+    # 2 from the burst, 3 paced at 10ms each
+    assert elapsed >= 0.025
+
+def test_token_bucket_shared_across_event_loops():
+    """Test that a shared bucket keeps working in a later event loop"""
+    
+    bucket = TokenBucket(rate=1000, capacity=1)
+    
+    async def burst():
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+        
+    asyncio.run(burst())
+    asyncio.run(burst())
+    assert bucket.tokens <= 0
+
+def test_token_bucket_adapts_rate():
+    """Test multiplicative backoff and additive recovery of the rate"""
+    
+    bucket = TokenBucket(rate=16, timer=FakeTimer())
+    bucket.throttle()
+    bucket.throttle()
+    assert bucket.rate == 4
+    
+    for _ in range(20):
+        bucket.recover()
+    assert bucket.rate == 16
+
+def test_rate_limiter_shared_per_source_and_key():
+    """Test that limiters are shared per source and API key"""
+    
+    limiter = get_rate_limiter("TestSource", "key-1", rate=5)
+    assert get_rate_limiter("TestSource", "key-1", rate=5) is limiter
+    assert get_rate_limiter("TestSource", "key-2", rate=5) is not limiter
+
+def test_backoff_delay_is_jittered_and_capped():
+    """Test the bounds of the jittered backoff delay"""
+    
+    delays = [backoff_delay(attempt, base=1, cap=4) for attempt in range(10) for _ in range(20)]
+    assert all(0 <= delay <= 4 for delay in delays)
+    assert len(set(delays)) > 1
\ No newline at end of file
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from core.models.anomaly import RingBuffer, StreamingAnomalyDetector
+
+def test_ring_buffer_keeps_latest_values():
+    """Test the ring buffer wraps around in arrival order"""
+    buffer = RingBuffer(4)
+    buffer.extend(np.array([1.0, 2.0, 3.0]))
+    assert buffer.window().tolist() == [1.0, 2.0, 3.0]
+    
+    buffer.extend(np.array([4.0, 5.0]))
+    assert buffer.window().tolist() == [2.0, 3.0, 4.0, 5.0]
+    
+    buffer.extend(np.arange(10.0))
+    assert buffer.window().tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert buffer.count == 15
+
+def test_batch_scores_match_point_updates():
+    """Test vectorized batch scoring equals scoring one point at a time"""
+    values = np.random.default_rng(7).normal(size=300)
+    values[150] = 12.0
+    config = {"window": 50, "methods": ["zscore", "ewma"]}
+    
+    batched = StreamingAnomalyDetector(config).update("series", values)
+    detector = StreamingAnomalyDetector(config)
+    single = [detector.update("series", values[i:i + 1]) for i in range(len(values))]
+    
+    for method in ("zscore", "ewma"):
+        np.testing.assert_allclose(batched[method], np.concatenate([s[method] for s in single]), atol=1e-8)
+        assert np.abs(batched[method]).argmax() == 150
+    assert not batched["zscore"][:5].any()
+
+@pytest.mark.asyncio
+async def test_series_continue_across_calls():
+    """Test state carries over so each call only scores new points"""
+    detector = StreamingAnomalyDetector()
+    history = [{"symbol": "BTC", "price": 100.0 + i % 3} for i in range(40)]
+    history += [{"symbol": "ETH", "price": 10.0 + i % 2} for i in range(40)]
+    
+    result = await detector.detect_anomalies(history, {"group_by": "symbol"})
+    assert result["count"] == 0
+    
+    # 102 is normal for BTC but far off for ETH
+    result = await detector.detect_anomalies(
+        [{"symbol": "BTC", "price": 102.0}, {"symbol": "ETH", "price": 102.0}],
+        {"group_by": "symbol"}
+    )
+    assert [(a["index"], a["group"]) for a in result["anomalies"]] == [(1, "ETH")]
+
+@pytest.mark.asyncio
+async def test_escalates_only_strong_candidates():
+    """Test only candidates above the escalation threshold are sent on"""
+    sent = []
+
+    async def remote(records, detection_config):
+        sent.append(records)
+        return {"confirmed": len(records)}
+        
+    detector = StreamingAnomalyDetector({"escalation_threshold": 50}, escalate=remote)
+    records = [{"tx": i, "value": 1.0 + i % 2} for i in range(30)]
+    records[10]["value"] = 5.0
+    records[20]["value"] = 500.0
+    
+    result = await detector.detect_anomalies(records)
+    
+    assert result["count"] == 2
+    assert sent == [[records[20]]]
+    assert result["escalation"] == {"confirmed": 1}
+@pytest.mark.asyncio
+async def test_single_record_is_checked():
+    """Test a dict of single values counts as one record"""
+    detector = StreamingAnomalyDetector()
+    await detector.detect_anomalies([{"x": 10.0 + i % 2} for i in range(20)])
+    
+    result = await detector.detect_anomalies({"x": 1000.0})
+    
+    assert result["checked"] == 1
+    assert [(a["index"], a["field"]) for a in result["anomalies"]] == [(0, "x")]
+    
+    with pytest.raises(Exception):
+        await detector.detect_anomalies({"x": [1.0, 2.0], "y": 3.0})
+
+@pytest.mark.asyncio
+async def test_series_are_bounded():
+    """Test the least recently updated series are dropped"""
+    detector = StreamingAnomalyDetector({"max_series": 2})
+    for symbol in ("BTC", "ETH", "BTC", "SOL"):
+        await detector.detect_anomalies([{"symbol": symbol, "price": 1.0}], {"group_by": "symbol"})
+        
+    assert len(detector.series) == 2
+    assert (None, "ETH", "price") not in detector.series
+    assert (None, "BTC", "price") in detector.series
\ No newline at end of file
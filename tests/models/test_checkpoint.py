@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from core.models.checkpoint import is_checkpoint, load_tensors, save_tensors
+
+def test_tensors_roundtrip_memory_mapped(tmp_path):
+    """Test flat checkpoints reload as aligned views of the mapped file"""
+    path = str(tmp_path / "weights.bin")
+    tensors = {
+        "embedding": np.arange(12, dtype=np.float16).reshape(3, 4),
+        "dense.weight": np.random.rand(4, 5).astype(np.float32),
+        "dense.bias": np.zeros(5, dtype=np.float64),
+        "mask": np.array([True, False, True]),
+        "step": np.array(7, dtype=np.int64),
+    }
+    save_tensors(path, tensors, {"format": "pt"})
+    
+    arrays, metadata = load_tensors(path)
+    
+    assert metadata == {"format": "pt"}
+    assert is_checkpoint(path)
+    for name, expected in tensors.items():
+        np.testing.assert_array_equal(arrays[name], expected)
+        assert arrays[name].dtype == expected.dtype
+        # Views of the mapping, not copies
+        assert not arrays[name].flags.owndata
+        assert arrays[name].ctypes.data % arrays[name].itemsize == 0
+        
+    # Writes stay private to the process
+    arrays["dense.bias"][0] = 1.0
+    np.testing.assert_array_equal(load_tensors(path)[0]["dense.bias"], tensors["dense.bias"])
+
+def test_is_checkpoint_rejects_other_files(tmp_path):
+    """Test detection of non-flat files"""
+    path = tmp_path / "model.pt"
+    path.write_bytes(b"PK\x03\x04" + b"\0" * 64)
+    assert not is_checkpoint(str(path))
+    
+    with pytest.raises(Exception, match="Unsupported tensor type"):
+        save_tensors(str(tmp_path / "bad.bin"), {"x": np.array(["a"])})
\ No newline at end of file
@@ -0,0 +1,168 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.models.deepseek.client import CircuitBreaker, DeepSeekClient
+from core.models.deepseek.factory import create_client
+
+@pytest_asyncio.fixture
+async def api():
+    """Serve a stand-in DeepSeek API on a local port"""
+    state = {"slow_calls": 0, "requests": 0}
+
+    async def analyze(request):
+        state["requests"] += 1
+        body = await request.json()
+        return web.json_response({"text": body["text"], "auth": request.headers.get("Authorization")})
+
+    async def analyze_batch(request):
+        state["requests"] += 1
+        body = await request.json()
+        return web.json_response({"results": [{"text": text, "version": body["model_version"]} for text in body["texts"]]})
+
+    async def slow_once(request):
+        # Only the first request is slow, like a stalled upstream replica
+        state["slow_calls"] += 1
+        if state["slow_calls"] == 1:
+            await asyncio.sleep(2)
+        return web.json_response({"attempt": state["slow_calls"]})
+
+    async def stall(request):
+        await asyncio.sleep(2)
+        return web.json_response({})
+
+    async def unavailable(request):
+        state["requests"] += 1
+        return web.json_response({"error": "overloaded"}, status=503)
+
+    async def garbled(request):
+        # A proxy error page served with status 200
+        return web.Response(text="<html>bad gateway</html>", content_type="text/html")
+        
+    app = web.Application()
+    app.router.add_post("/v1/analyze", analyze)
+    app.router.add_post("/v1/text/analyze/batch", analyze_batch)
+    app.router.add_post("/v1/slow", slow_once)
+    app.router.add_post("/v1/stall", stall)
+    app.router.add_post("/v1/unavailable", unavailable)
+    app.router.add_post("/v1/garbled", garbled)
+    
+    server = TestServer(app)
+    await server.start_server()
+    yield str(server.make_url("/v1")), state
+    await server.close()
+
+@pytest.mark.asyncio
+async def test_calls_reuse_pooled_session(api):
+    """Test calls share one session and send the API key"""
+    base_url, state = api
+    client = DeepSeekClient({"base_url": base_url, "api_key": "secret"})
+    
+    first = await client.post("analyze", {"text": "btc"})
+    session = client.session
+    await client.post("/analyze", {"text": "eth"})
+    await client.close()
+    
+    assert first == {"text": "btc", "auth": "Bearer secret"}
+    assert client.stats["calls"] == 2
+    assert session.closed and state["requests"] == 2
+
+@pytest.mark.asyncio
+async def test_remote_backend_batches_texts(api):
+    """Test the remote backend sends concurrent texts as one batch request"""
+    base_url, state = api
+    backend = create_client({"api": {"base_url": base_url, "key": "secret"}, "model_version": "v3"})
+    
+    results = await asyncio.gather(*(backend.analyze_text(text) for text in ["btc", "eth", "sol"]))
+    await backend.close()
+    
+    assert results == [{"text": text, "version": "v3"} for text in ["btc", "eth", "sol"]]
+    assert state["requests"] == 1
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged(api):
+    """Test a duplicate is sent after the p95 latency and wins"""
+    base_url, state = api
+    client = DeepSeekClient({"base_url": base_url, "hedge_min_samples": 5, "hedge_budget": 1.0})
+    for _ in range(5):
+        client.latencies.record(0.05)
+        
+    started = asyncio.get_running_loop().time()
+    result = await client.post("slow", {}, hedge=True)
+    elapsed = asyncio.get_running_loop().time() - started
+    
+    assert result == {"attempt": 2}
+    assert elapsed < 1
+    assert client.stats["hedged"] == 1 and client.stats["hedge_wins"] == 1
+    
+    # Calls are not duplicated unless they opt in
+    state["slow_calls"] = 0
+    with pytest.raises(Exception, match="deadline"):
+        await client.post("slow", {}, timeout=0.5)
+    await client.close()
+    assert state["slow_calls"] == 1 and client.stats["hedged"] == 1
+
+@pytest.mark.asyncio
+async def test_deadline_and_circuit_breaker(api):
+    """Test deadlines bound calls and repeated failures open the circuit"""
+    base_url, state = api
+    client = DeepSeekClient({"base_url": base_url, "failure_threshold": 2, "timeout": 0.1})
+    
+    with pytest.raises(Exception, match="deadline"):
+        await client.post("stall", {})
+    with pytest.raises(Exception, match="status 503"):
+        await client.post("unavailable", {})
+        
+    # Open: rejected without reaching the server
+    with pytest.raises(Exception, match="circuit open"):
+        await client.post("unavailable", {})
+    await client.close()
+    
+    assert state["requests"] == 1
+    assert client.breaker.state == "open"
+    assert client.stats["deadline_exceeded"] == 1 and client.stats["rejected"] == 1
+
+@pytest.mark.asyncio
+async def test_invalid_response_and_cancelled_trial(api):
+    """Test invalid JSON is a failure and a cancelled trial frees the circuit"""
+    base_url, state = api
+    now = [0.0]
+    client = DeepSeekClient({"base_url": base_url, "failure_threshold": 1, "reset_timeout": 10})
+    client.breaker.timer = lambda: now[0]
+    
+    with pytest.raises(Exception, match="invalid JSON"):
+        await client.post("garbled", {})
+    assert client.breaker.state == "open"
+    
+    now[0] = 11.0
+    trial = asyncio.ensure_future(client.post("stall", {}))
+    await asyncio.sleep(0.05)
+    trial.cancel()
+    await asyncio.gather(trial, return_exceptions=True)
+    
+    # The next call is let through as the trial
+    assert (await client.post("analyze", {"text": "btc"}))["text"] == "btc"
+    await client.close()
+    assert client.breaker.state == "closed"
+
+def test_circuit_breaker_half_open_trial():
+    """Test one trial call is let through after the open period"""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, timer=lambda: now[0])
+    breaker.record_failure()
+    assert not breaker.allow()
+    
+    now[0] = 11.0
+    assert breaker.allow()
+    assert not breaker.allow()
+    
+    # A failed trial opens the circuit again
+    breaker.record_failure()
+    assert breaker.state == "open"
+    
+    now[0] = 22.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
\ No newline at end of file
@@ -0,0 +1,207 @@
+import asyncio
+import io
+import pytest
+import sqlite3
+from typing import Any, Dict, List, Optional, Union
+
+from core.models.deepseek.base import DeepSeekBase
+from core.models.deepseek.cache import ResultCache
+from core.models.deepseek.prediction import PredictionCache
+
+class StubDeepSeek(DeepSeekBase):
+    """In-memory DeepSeek implementation recording its calls"""
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.calls = []
+
+    async def analyze_text(self, text: str) -> Dict[str, Any]:
+        self.calls.append(("text", text))
+        return {"text": text, "sentiment": len(text)}
+
+    async def analyze_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        self.calls.append(("texts", list(texts)))
+        return [{"text": text, "sentiment": len(text)} for text in texts]
+
+    async def analyze_image(self, image_data: bytes) -> Dict[str, Any]:
+        self.calls.append(("image", bytes(image_data)))
+        return {"size": len(image_data)}
+
+    async def multimodal_analysis(
+        self,
+        text: Optional[str] = None,
+        image: Optional[bytes] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        self.calls.append(("multimodal", text))
+        return {"text": text, "image_size": len(image) if image else 0}
+
+    async def generate_prediction(
+        self,
+        data: Dict[str, Any],
+        prediction_type: str,
+        confidence_threshold: float = 0.8
+    ) -> Dict[str, Any]:
+        self.calls.append(("prediction", prediction_type))
+        if prediction_type == "unsupported":
+            raise Exception("unsupported prediction type")
+        return {"prediction": sum(data.get("values", [])), "confidence": 0.9}
+
+    async def detect_anomalies(
+        self,
+        data: Union[List[Dict[str, Any]], Dict[str, Any]],
+        detection_config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        self.calls.append(("anomalies", data))
+        return {"anomalies": []}
+
+    async def get_model_info(self) -> Dict[str, Any]:
+        return {"version": self.model_version}
+
+@pytest.mark.asyncio
+async def test_analyze_text_coalesces_calls():
+    """Test that concurrent calls are sent as bounded batches"""
+    
+    client = StubDeepSeek({"models": {"text": {"batch_size": 4, "batch_delay_ms": 20}}})
+    texts = [f"headline {i}" for i in range(10)]
+    
+    results = await asyncio.gather(*(client.analyze_text(text) for text in texts))
+    
+    assert [result["text"] for result in results] == texts
+    assert [len(batch) for kind, batch in client.calls] == [4, 4, 2]
+    assert client.cache_stats()["text"]["misses"] == 10
+
+@pytest.mark.asyncio
+async def test_results_cached_by_content(tmp_path):
+    """Test result caching, hit/miss counters and the persistent tier"""
+    
+    config = {"cache_path": str(tmp_path / "results.db")}
+    client = StubDeepSeek(config)
+    
+    first = await client.analyze_text("BTC breaks out")
+    first["sentiment"] = None
+    second = await client.analyze_text(text="BTC breaks out")
+    await client.analyze_image(b"\x89PNG")
+    await client.analyze_image(memoryview(b"\x89PNG"))
+    await client.multimodal_analysis("chart", b"\x89PNG", {"market": "btc"})
+    await client.multimodal_analysis(text="chart", image=b"\x89PNG", context={"market": "btc"})
+    
+    assert second["sentiment"] == len("BTC breaks out")
+    assert [kind for kind, _ in client.calls] == ["texts", "image", "multimodal"]
+    assert client.cache_stats()["text"]["hits"] == 1
+    assert client.cache_stats()["vision"]["misses"] == 1
+    
+    # Batched calls only send uncached texts
+    await client.analyze_texts(["BTC breaks out", "ETH dips"])
+    assert client.calls[-1] == ("texts", ["ETH dips"])
+    
+    # A restarted client answers from the persistent tier
+    await client.flush_caches()
+    restarted = StubDeepSeek(config)
+    await restarted.analyze_text("ETH dips")
+    assert restarted.calls == []
+    
+    # Results of another model version are not reused
+    upgraded = StubDeepSeek({**config, "model_version": "v2"})
+    await upgraded.analyze_text("ETH dips")
+    assert upgraded.calls == [("texts", ["ETH dips"])]
+
+@pytest.mark.asyncio
+async def test_image_sources_downsized(tmp_path):
+    """Test image paths and streams are read and fitted to the model size"""
+    Image = pytest.importorskip("PIL.Image")
+    
+    path = tmp_path / "chart.png"
+    Image.new("RGB", (800, 400), "white").save(path)
+
+    async def chunks():
+        data = path.read_bytes()
+        for i in range(0, len(data), 256):
+            yield data[i:i + 256]
+            
+    client = StubDeepSeek({"models": {"vision": {"image_size": 200}, "multimodal": {"cache_size": 0}}})
+    await client.analyze_image(str(path))
+    await client.multimodal_analysis("chart", chunks())
+    
+    sent = client.calls[0][1]
+    assert Image.open(io.BytesIO(sent)).size == (200, 100)
+    assert client.calls[1] == ("multimodal", "chart")
+    
+    # Same content by another route is a cache hit
+    await client.analyze_image(chunks())
+    assert len(client.calls) == 2
+    
+    small = StubDeepSeek({"max_image_bytes": 64})
+    with pytest.raises(Exception, match="exceeds 64 bytes"):
+        await small.analyze_image(chunks())
+
+@pytest.mark.asyncio
+async def test_persistent_tier_batched_and_pruned(tmp_path):
+    """Test SQLite writes are committed together and old rows deleted"""
+    path = str(tmp_path / "results.db")
+    now = [0.0]
+    cache = ResultCache(maxsize=2, ttl=10, path=path, timer=lambda: now[0], max_rows=3, write_delay=0.01)
+    
+    def stored():
+        with sqlite3.connect(path) as db:
+            return [key for key, in db.execute("SELECT key FROM results ORDER BY key")]
+            
+    for i in range(5):
+        cache.set(f"key {i}", {"value": i})
+    # Nothing is committed yet, but evicted results are still served
+    assert stored() == []
+    assert cache.get("key 0") == {"value": 0}
+    
+    await cache.flush()
+    assert stored() == ["key 2", "key 3", "key 4"]
+    reopened = ResultCache(maxsize=2, ttl=10, path=path, timer=lambda: now[0])
+    assert await reopened.get_many(["key 4", "key 0", "key 3"]) == [{"value": 4}, None, {"value": 3}]
+    assert reopened.stats()["hits"] == 2 and reopened.stats()["size"] == 2
+    reopened.close()
+    
+    now[0] = 5.0
+    cache.set("key 5", {"value": 5})
+    now[0] = 11.0
+    cache.set("key 6", {"value": 6})
+    await asyncio.sleep(0.05)
+    assert stored() == ["key 5", "key 6"]
+    cache.close()
+
+@pytest.mark.asyncio
+async def test_generate_predictions_rescores_only_changes():
+    """Test batched predictions reuse results for unchanged markets"""
+    now = [0.0]
+    client = StubDeepSeek({})
+    client.prediction_cache = PredictionCache(ttl=300, tolerance=0.01, timer=lambda: now[0])
+    payloads = [
+        {"id": "btc", "prediction_type": "price", "data": {"values": [100.0, 1.0]}},
+        {"id": "eth", "prediction_type": "price", "data": {"values": [10.0, 1.0]}},
+        {"id": "btc", "prediction_type": "volatility", "data": {"values": [0.5]}},
+        {"id": "sol", "prediction_type": "unsupported", "data": {}},
+    ]
+    
+    results = await client.generate_predictions(payloads)
+    assert [r.get("prediction") for r in results] == [101.0, 11.0, 0.5, None]
+    assert results[3]["error"] == "unsupported prediction type"
+    assert len(client.calls) == 4
+    
+    # BTC moved within tolerance, ETH beyond it
+    client.calls.clear()
+    payloads[0]["data"] = {"values": [100.5, 1.0]}
+    payloads[1]["data"] = {"values": [10.5, 1.0]}
+    results = await client.generate_predictions(payloads[:3])
+    assert results[0]["prediction"] == 101.0
+    assert results[1]["prediction"] == 11.5
+    assert client.calls == [("prediction", "price")]
+    
+    # Below the confidence threshold small moves are re-scored too
+    client.calls.clear()
+    payloads[0]["data"] = {"values": [100.2, 1.0]}
+    await client.generate_predictions(payloads[:3], confidence_threshold=0.95)
+    assert client.calls == [("prediction", "price")]
+    
+    # Expired predictions are re-scored
+    client.calls.clear()
+    now[0] = 301.0
+    await client.generate_predictions(payloads[:3])
+    assert len(client.calls) == 3
\ No newline at end of file
@@ -0,0 +1,130 @@
+import os
+import pytest
+
+from core.models.checkpoint import is_checkpoint
+from core.models.deepseek.factory import create_client
+from core.models.deepseek.local import OPTIMIZED_CHECKPOINT, LocalDeepSeek
+from core.models.deepseek.remote import RemoteDeepSeek
+
+@pytest.fixture
+def local_model():
+    """Create a local backend without loading a model"""
+    return create_client({"backend": "local", "models": {"text": {"cache_size": 0}}})
+
+def test_create_client_by_backend():
+    """Test backend selection from configuration"""
+    assert isinstance(create_client({"backend": "local"}), LocalDeepSeek)
+    assert isinstance(create_client({}), RemoteDeepSeek)
+    
+    with pytest.raises(Exception, match="Unknown DeepSeek backend"):
+        create_client({"backend": "missing"})
+
+def test_cache_keys_include_text_model():
+    """Test results of one classifier are not served for another"""
+    default = LocalDeepSeek({"model_version": "v1"})
+    finbert = LocalDeepSeek({"model_version": "v1", "models": {"text": {"model": "ProsusAI/finbert"}}})
+    
+    assert default.cache_version != finbert.cache_version
+    assert finbert.cache_version == "v1:ProsusAI/finbert"
+
+@pytest.mark.asyncio
+async def test_detect_anomalies_records(local_model):
+    """Test robust outlier detection over records"""
+    records = [{"price": 100.0 + i % 3, "volume": 10} for i in range(50)]
+    records[17]["price"] = 250.0
+    records[30]["volume"] = 1000
+    records[40]["price"] = None
+    
+    result = await local_model.detect_anomalies(records)
+    
+    assert result["checked"] == 50
+    assert [(a["index"], a["field"]) for a in result["anomalies"]] == [(17, "price"), (30, "volume")]
+
+@pytest.mark.asyncio
+async def test_detect_anomalies_series(local_model):
+    """Test detection over value series with a custom threshold"""
+    series = {"latency": [10, 11, 9, 10, 12, 10, 30], "host": "node-1"}
+    
+    result = await local_model.detect_anomalies(series, {"threshold": 10})
+    assert result["count"] == 1
+    assert result["anomalies"][0]["value"] == 30.0
+    
+    result = await local_model.detect_anomalies(series, {"threshold": 100})
+    assert result["count"] == 0
+
+@pytest.fixture
+def tiny_classifier(tmp_path):
+    """Save a tiny BERT sentiment classifier and return its directory"""
+    pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+    
+    path = tmp_path / "classifier"
+    vocab = tmp_path / "vocab.txt"
+    vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "btc", "up", "down"]))
+    config = transformers.BertConfig(
+        vocab_size=8,
+        hidden_size=16,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        intermediate_size=32,
+        id2label={0: "NEGATIVE", 1: "POSITIVE"},
+        label2id={"NEGATIVE": 0, "POSITIVE": 1}
+    )
+    transformers.BertForSequenceClassification(config).save_pretrained(path)
+    transformers.BertTokenizer(str(vocab)).save_pretrained(path)
+    return str(path)
+
+@pytest.mark.asyncio
+async def test_analyze_texts_local(tiny_classifier):
+    """Test batched sentiment analysis with a tiny local classifier"""
+    model = LocalDeepSeek({"models": {"text": {"model": tiny_classifier, "batch_size": 2}}})
+    results = await model.analyze_texts(["btc up", "btc down", "up up up"])
+    single = await model.analyze_text("btc down")
+    
+    assert len(results) == 3
+    assert single == results[1]
+    for result in results:
+        assert -1.0 <= result["sentiment"] <= 1.0
+        assert result["label"] in ("negative", "positive")
+        assert sum(result["scores"].values()) == pytest.approx(1.0)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("options", [{}, {"compile": "torchscript"}, {"quantize": False}])
+async def test_optimized_checkpoint_roundtrip(tiny_classifier, tmp_path, options):
+    """Test quantized, traced and plain models save and reload in optimized form"""
+    texts = ["btc up", "btc down"]
+    config = {"models": {"text": {"model": tiny_classifier, "max_length": 8, "cache_size": 0}}}
+    model = LocalDeepSeek(config)
+    await model.load()
+    
+    applied = await model.optimize(options)
+    assert applied["quantization"] == (None if options.get("quantize") is False else "dynamic_int8")
+    assert applied["compile"] == options.get("compile")
+    expected = await model.analyze_texts(texts)
+    
+    path = str(tmp_path / "optimized")
+    assert await model.save_checkpoint(path)
+    
+    restored = LocalDeepSeek({"models": {"text": {**config["models"]["text"], "model": path}}})
+    results = await restored.analyze_texts(texts)
+    assert restored.optimization == applied
+    for result, reference in zip(results, expected):
+        assert result["sentiment"] == pytest.approx(reference["sentiment"], abs=1e-5)
+
+@pytest.mark.asyncio
+async def test_plain_checkpoint_is_memory_mappable(tiny_classifier, tmp_path):
+    """Test unoptimized models are saved in the flat format and reload from it"""
+    texts = ["btc up", "btc down"]
+    config = {"models": {"text": {"model": tiny_classifier, "max_length": 8, "cache_size": 0}}}
+    model = LocalDeepSeek(config)
+    expected = await model.analyze_texts(texts)
+    
+    path = str(tmp_path / "plain")
+    assert await model.save_checkpoint(path)
+    assert is_checkpoint(os.path.join(path, OPTIMIZED_CHECKPOINT))
+    
+    restored = LocalDeepSeek({"models": {"text": {**config["models"]["text"], "model": path}}})
+    results = await restored.analyze_texts(texts)
+    assert restored.optimization == {}
+    for result, reference in zip(results, expected):
+        assert result["sentiment"] == pytest.approx(reference["sentiment"], abs=1e-6)
\ No newline at end of file
@@ -0,0 +1,91 @@
+import asyncio
+import multiprocessing
+import pytest
+
+from core.models.registry import ModelRegistry, get_model_registry
+
+def _read_shared(queue):
+    """Report whether a forked worker sees the parent's model"""
+    queue.put(get_model_registry().peek("fork-test"))
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_model():
+    """Test concurrent requests wait for a single load"""
+    registry = ModelRegistry()
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+        
+    models = await asyncio.gather(*(registry.get("text", loader) for _ in range(5)))
+    
+    assert len(loads) == 1
+    assert all(model is models[0] for model in models)
+    assert await registry.get("text", loader) is models[0]
+    
+    registry.pop("text")
+    assert await registry.get("text", loader) is not models[0]
+    assert len(loads) == 2
+
+@pytest.mark.asyncio
+async def test_failed_load_is_retried():
+    """Test load errors reach every waiter and are not cached"""
+    registry = ModelRegistry()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise Exception("missing weights")
+        
+    results = await asyncio.gather(*(registry.get("text", failing) for _ in range(3)), return_exceptions=True)
+    assert all(str(result) == "missing weights" for result in results)
+    assert "text" not in registry
+
+    async def working():
+        return "model"
+        
+    assert await registry.get("text", working) == "model"
+
+@pytest.mark.asyncio
+async def test_cancelled_load_is_taken_over():
+    """Test a waiter loads the model when the first caller is cancelled"""
+    registry = ModelRegistry()
+    loads = []
+
+    async def slow():
+        loads.append(1)
+        await asyncio.sleep(0.05)
+        return "model"
+        
+    first = asyncio.ensure_future(registry.get("text", slow))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.ensure_future(registry.get("text", slow))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    
+    assert await waiter == "model"
+    assert first.cancelled() and len(loads) == 2
+    assert registry.peek("text") == "model"
+
+@pytest.mark.asyncio
+async def test_forked_workers_inherit_models():
+    """Test models loaded before forking are available in workers"""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork is not available")
+        
+    registry = get_model_registry()
+
+    async def loader():
+        return {"weights": [1, 2, 3]}
+        
+    await registry.get("fork-test", loader)
+    try:
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        worker = context.Process(target=_read_shared, args=(queue,))
+        worker.start()
+        assert queue.get(timeout=10) == {"weights": [1, 2, 3]}
+        worker.join()
+    finally:
+        registry.pop("fork-test")
\ No newline at end of file
@@ -0,0 +1,137 @@
+import asyncio
+import os
+import pytest
+from typing import Any, Dict, List, Optional
+
+from core.data.collectors.base import BaseCollector
+from core.data.processors.base import BaseProcessor
+from core.data.processors.offload import shutdown_process_pools
+from core.data.processors.pipeline import Pipeline
+
+class StubCollector(BaseCollector):
+    def __init__(self, pages: List[List[Dict[str, Any]]]):
+        super().__init__({})
+        self.pages = pages
+
+    async def connect(self) -> bool:
+        return True
+
+    async def disconnect(self) -> bool:
+        return True
+
+    async def collect(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        return [item for page in self.pages for item in page]
+
+    async def stream(self, params: Optional[Dict[str, Any]] = None):
+        for page in self.pages:
+            await asyncio.sleep(0)
+            yield page
+
+    async def validate(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [item for item in data if "value" in item]
+
+class AddProcessor(BaseProcessor):
+    def __init__(self, config: Dict[str, Any], amount: int, delay: float = 0):
+        super().__init__(config)
+        self.amount = amount
+        self.delay = delay
+        self.batch_sizes = []
+        self.active = 0
+        self.max_active = 0
+
+    async def process(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        self.batch_sizes.append(len(data))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if any(item["value"] < 0 for item in data):
+                await asyncio.sleep(10)
+            await asyncio.sleep(self.delay)
+            return [{**item, "value": item["value"] + self.amount} for item in data]
+        finally:
+            self.active -= 1
+
+    async def validate_output(self, data: List[Dict[str, Any]]) -> bool:
+        return True
+
+    async def get_metadata(self) -> Dict[str, Any]:
+        return {"amount": self.amount}
+
+def make_pages(count: int, size: int) -> List[List[Dict[str, Any]]]:
+    return [[{"value": page * size + i} for i in range(size)] for page in range(count)]
+
+@pytest.mark.asyncio
+async def test_pipeline_chains_stages_in_batches():
+    """Test micro-batching and chaining of processor stages"""
+    
+    collector = StubCollector(make_pages(5, 7) + [[{"invalid": True}]])
+    first = AddProcessor({"batch_size": 10, "max_workers": 2}, amount=1, delay=0.01)
+    second = AddProcessor({"batch_size": 4, "max_workers": 3}, amount=10, delay=0.01)
+    pipeline = Pipeline(collector, [first, second])
+    
+    results = [item async for batch in pipeline.run() for item in batch]
+    
+    assert sorted(item["value"] for item in results) == [i + 11 for i in range(35)]
+    assert all(size <= 10 for size in first.batch_sizes)
+    assert all(size <= 4 for size in second.batch_sizes)
+    assert second.max_active > 1
+    assert pipeline.stats[0]["items"] == 35
+    assert pipeline.stats[1]["items"] == 35
+
+@pytest.mark.asyncio
+async def test_pipeline_drops_timed_out_batches():
+    """Test that batches exceeding the stage timeout are dropped"""
+    
+    collector = StubCollector([[{"value": 1}, {"value": 2}], [{"value": -1}]])
+    processor = AddProcessor({"batch_size": 2, "timeout": 0.05}, amount=1)
+    pipeline = Pipeline(collector, [processor])
+    
+    results = [item async for batch in pipeline.run() for item in batch]
+    
+    assert [item["value"] for item in results] == [2, 3]
+    assert pipeline.stats[0]["timeouts"] == 1
+
+@pytest.mark.asyncio
+async def test_pipeline_stops_early():
+    """Test that stopping consumption cancels the pipeline cleanly"""
+    
+    collector = StubCollector(make_pages(50, 10))
+    processor = AddProcessor({"batch_size": 5, "max_workers": 2}, amount=1)
+    pipeline = Pipeline(collector, [processor], {"queue_size": 1})
+    
+    run = pipeline.run()
+    async for batch in run:
+        break
+    await run.aclose()
+    
+    # Closing waits for every stage and worker to finish
+    assert [task for task in asyncio.all_tasks() if task is not asyncio.current_task()] == []
+    assert len(batch) == 5
+    assert pipeline.stats[0]["items"] < 500
+
+class PidProcessor(BaseProcessor):
+    cpu_bound = True
+
+    async def process(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [{**item, "pid": os.getpid()} for item in data]
+
+    async def validate_output(self, data: List[Dict[str, Any]]) -> bool:
+        return True
+
+    async def get_metadata(self) -> Dict[str, Any]:
+        return {}
+
+@pytest.mark.asyncio
+async def test_cpu_bound_processor_runs_in_process_pool():
+    """Test offloading of CPU-bound processors to worker processes"""
+    
+    processor = PidProcessor({"max_workers": 2})
+    data = [{"value": 1, "tags": ["a"]}, {"value": 2, "extra": None}]
+    
+    try:
+        result = await processor.run(data)
+    finally:
+        shutdown_process_pools()
+        
+    assert [{k: v for k, v in item.items() if k != "pid"} for item in result] == data
+    assert all(item["pid"] != os.getpid() for item in result)
\ No newline at end of file
@@ -0,0 +1,44 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Dependencies that must only be imported on first use
+HEAVY_MODULES = ["torch", "transformers", "web3", "PIL", "pandas"]
+
+def measure_import(*modules: str) -> dict:
+    """Import modules in a fresh interpreter and report heavy imports"""
+    
+    code = f"""
+import json, sys
+for name in {list(modules)!r}:
+    __import__(name)
+print(json.dumps({{
+    "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output)
+
+@pytest.mark.parametrize("modules", [
+    ("core.config", "core.utils.logger"),
+    ("core.models.base", "core.models.deepseek.base"),
+    ("core.blockchain.base",),
+    ("core.data.collectors.news.newsapi", "core.data.processors.pipeline"),
+])
+def test_cold_import(modules):
+    """Test that importing core defers heavy dependencies to first use"""
+    
+    result = measure_import(*modules)
+    
+    assert result["heavy"] == []
\ No newline at end of file
@@ -0,0 +1,37 @@
+import asyncio
+import pytest
+
+from core.utils.batching import RequestBatcher
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_after_delay():
+    """Test that a partial batch is sent once the delay has passed"""
+    
+    batches = []
+
+    async def handler(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+        
+    batcher = RequestBatcher(handler, max_batch_size=100, max_delay=0.01)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+    
+    assert results == [0, 2, 4]
+    assert batches == [[0, 1, 2]]
+
+@pytest.mark.asyncio
+async def test_batcher_isolates_item_errors():
+    """Test that per-item exceptions only reach their own caller"""
+
+    async def handler(items):
+        return [ValueError(item) if item < 0 else item for item in items]
+        
+    batcher = RequestBatcher(handler, max_batch_size=3)
+    results = await asyncio.gather(
+        batcher.submit(1), batcher.submit(-1), batcher.submit(2),
+        return_exceptions=True
+    )
+    
+    assert results[0] == 1
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 2
\ No newline at end of file
@@ -0,0 +1,37 @@
+from core.utils.cache import LRUCache
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted"""
+    
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+def test_ttl_expiry():
+    """Test that entries expire after their time-to-live"""
+    
+    timer = FakeTimer()
+    cache = LRUCache(maxsize=10, ttl=5, timer=timer)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=20)
+    
+    timer.now = 6
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    
+    timer.now = 21
+    assert "b" not in cache
\ No newline at end of file